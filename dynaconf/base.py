@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import contextvars
 import copy
 import importlib
 import inspect
 import os
 import re
+import threading
 import warnings
 from collections import defaultdict
 from collections.abc import Callable
@@ -16,46 +18,60 @@ from functools import lru_cache
 from functools import wraps
 from pathlib import Path
 from typing import Any
+from typing import NamedTuple
 from typing import Optional
 from typing import Union
 
+from dynaconf import constants as ct
 from dynaconf import default_settings
 from dynaconf.loaders import default_loader
 from dynaconf.loaders import enable_external_loaders
 from dynaconf.loaders import env_loader
 from dynaconf.loaders import execute_instance_hooks
 from dynaconf.loaders import execute_module_hooks
+from dynaconf.loaders import ini_loader
+from dynaconf.loaders import json_loader
 from dynaconf.loaders import py_loader
 from dynaconf.loaders import settings_loader
+from dynaconf.loaders import toml_loader
 from dynaconf.loaders import yaml_loader
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.nodes import DataDict
 from dynaconf.nodes import DataList
+from dynaconf.nodes import freeze_node
+from dynaconf.nodes import FrozenDataDict
 from dynaconf.nodes import recursively_evaluate_lazy_format
+from dynaconf.nodes import shallow_copy_node
 from dynaconf.strategies.filtering import PrefixFilter
 from dynaconf.utils import BANNER
 from dynaconf.utils import ensure_a_list
 from dynaconf.utils import ensure_upperfied_list
 from dynaconf.utils import ListMergeOptions
+from dynaconf.utils import LoadingHistory
 from dynaconf.utils import missing
 from dynaconf.utils import normalize_kwargs
 from dynaconf.utils import object_merge
+from dynaconf.utils import parse_history_mode
 from dynaconf.utils import RENAMED_VARS
 from dynaconf.utils import to_dict
 from dynaconf.utils import upperfy
+from dynaconf.utils.files import file_signature
 from dynaconf.utils.files import find_file
 from dynaconf.utils.files import glob
 from dynaconf.utils.files import has_magic
 from dynaconf.utils.functional import empty
 from dynaconf.utils.functional import LazyObject
 from dynaconf.utils.parse_conf import apply_converter
+from dynaconf.utils.parse_conf import auto_cast_enabled
 from dynaconf.utils.parse_conf import boolean_fix
 from dynaconf.utils.parse_conf import converters
 from dynaconf.utils.parse_conf import Lazy
+from dynaconf.utils.parse_conf import LazyCache
 from dynaconf.utils.parse_conf import parse_conf_data
 from dynaconf.utils.parse_conf import true_values
 from dynaconf.validator import ValidationError
 from dynaconf.validator import ValidatorList
+from dynaconf.watcher import SettingsWatcher
 
 
 class LazySettings(LazyObject):
@@ -95,7 +111,12 @@ class LazySettings(LazyObject):
         if self._wrapped is empty:
             self._setup()
 
-        return getattr(self._wrapped, name)
+        value = getattr(self._wrapped, name)
+        if isinstance(self._wrapped, FrozenSettings):
+            # frozen snapshots never change, so the value is stored on the
+            # proxy itself and next lookups will not reach __getattr__
+            self.__dict__[name] = value
+        return value
 
     def _setup(self):
         """Initial setup, run once."""
@@ -125,9 +146,21 @@ class LazySettings(LazyObject):
         settings_module = settings_module or os.environ.get(environment_var)
         kwargs = normalize_kwargs(kwargs)
         kwargs.update(self._kwargs)
+        for name in set(self.__dict__) - _LAZY_SETTINGS_ATTRS:
+            # drop values cached from a previous frozen snapshot
+            del self.__dict__[name]
+        # stop watching the files of the settings being replaced
+        core = getattr(self._wrapped, "__core__", None)
+        if core is not None and core.watcher is not None:
+            core.watcher.stop()
         self._wrapped = self._wrapper_class(
             settings_module=settings_module, **kwargs
         )
+        watch = self._wrapped.get("WATCH_FOR_DYNACONF")
+        if self._wrapped.get("FROZEN_FOR_DYNACONF"):
+            self._wrapped = self._wrapped.freeze()
+        elif watch:
+            self._wrapped.watch(interval=1.0 if watch is True else watch)
 
     @property
     def configured(self):
@@ -172,13 +205,27 @@ class DynaconfConfig:
     loaded_hooks: dict[str, dict] = field(
         default_factory=lambda: defaultdict(dict)
     )
-    loaded_by_loaders: dict[SourceMetadata, Any] = field(default_factory=dict)
+    loaded_by_loaders: LoadingHistory = field(default_factory=LoadingHistory)
     loaded_py_modules: list[str] = field(default_factory=list)
     loaded_files: list[str] = field(default_factory=list)
     loaders: list[str] = field(default_factory=list)
     deleted: set[str] = field(default_factory=set)
     env_cache: dict = field(default_factory=dict)
 
+    # fresh vars reloading, see `Settings._reload_key`
+    key_sources: dict[str, dict[SourceMetadata, None]] = field(
+        default_factory=dict
+    )
+    file_signatures: dict[str, Optional[tuple]] = field(default_factory=dict)
+    loaded_file_signatures: dict[str, Optional[tuple]] = field(
+        default_factory=dict
+    )
+    key_file_signatures: dict[str, dict] = field(default_factory=dict)
+
+    # lazy loading, see `Settings._load_lazy_keys`
+    lazy_keys: dict[str, None] = field(default_factory=dict)
+    lazy_indexing: bool = False
+
     not_installed_warnings: list[str] = field(default_factory=list)
 
     def __post_init__(self):
@@ -186,6 +233,15 @@ class DynaconfConfig:
         if not isinstance(self.post_hooks, list):
             self.post_hooks = ensure_a_list(self.post_hooks)
 
+    def copy(self) -> DynaconfConfig:
+        """Copy with its dict, list and set values copied one level deep."""
+        new = copy.copy(self)
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if isinstance(value, (dict, list, set)):
+                setattr(new, name, copy.copy(value))
+        return new
+
     def override_with(self, data: dict):
         """Override keys and ignore unknows items."""
         exclude = [
@@ -196,6 +252,12 @@ class DynaconfConfig:
             "loaded_files",
             "deleted",
             "env_cache",
+            "key_sources",
+            "file_signatures",
+            "loaded_file_signatures",
+            "key_file_signatures",
+            "lazy_keys",
+            "lazy_indexing",
         ]
         keys = self.__dataclass_fields__
         for key, value in data.items():
@@ -223,10 +285,42 @@ class DynaconfCore:
 
         self._cache: dict = {}
         self.cache_enabled = True
+        # evaluated Lazy values, dropped by the keys they read
+        self.lazy_cache = LazyCache()
+        # cores with an env loaded for `Settings.using_env` and the environ
+        # they were loaded with
+        self.env_cores: dict = {}
         self.obj = obj
         self.config = config
         self.store = store
         self.validators = ValidatorList(obj, validators=validators)
+        # serializes writers, readers never take it, see `Settings._staging`
+        self.lock = threading.RLock()
+        # key -> times it was reloaded on this core, odd while it is
+        # reloading, see `Settings._reload_key`
+        self.key_reloads: dict = {}
+        self.staging = False
+        self.watcher: Optional[SettingsWatcher] = None
+
+    def staged_copy(self, obj):
+        """Copy of this core for `obj` where loaders can run off to the side.
+
+        The store and config are copied one level deep, the lock and the
+        validators are shared.
+        """
+        new_instance = self.__class__.__new__(self.__class__)
+        new_instance.__dict__.update(self.__dict__)
+        new_instance._cache = {}
+        new_instance.lazy_cache = LazyCache()
+        new_instance.env_cores = {}
+        new_instance.staging = True
+        new_instance.obj = obj
+        new_instance.config = self.config.copy()
+        if isinstance(self.store, DataDict):
+            new_instance.store = shallow_copy_node(self.store, obj)
+        else:
+            new_instance.store = dict(self.store)
+        return new_instance
 
     # CACHING
 
@@ -236,19 +330,29 @@ class DynaconfCore:
             raise KeyError
         return self._cache[key]
 
-    def set_cached(self, key, value):
+    def set_cached(self, key, value, cache=None):
+        """Cache `value` of `key`.
+
+        `cache` is the cache dict taken before computing `value`, a value
+        computed while another thread cleared the cache is then dropped
+        along with the old dict.
+        """
         # NOTE: remove support for this marker in a breaking change
         _is_lazy = hasattr(value, "_dynaconf_lazy_format")
         if not self.cache_enabled:
             return
         fresh_vars = self.config.fresh_vars
         if key not in fresh_vars and not _is_lazy:
-            self._cache[key] = value
+            if cache is None:
+                cache = self._cache
+            cache[key] = value
 
     def clear_cache(self):
         if not self.cache_enabled:
             return
-        self._cache.clear()
+        # swap instead of clear, see `set_cached`
+        self._cache = {}
+        self.env_cores = {}
 
     # COPYING
 
@@ -259,32 +363,99 @@ class DynaconfCore:
         memo[id(self)] = new_instance
 
         for key, value in self.__dict__.items():
-            if key != "_cache":
+            if key not in _UNCOPIED_CORE_ATTRS:
                 setattr(new_instance, key, copy.deepcopy(value, memo))
 
         new_instance._cache = {}
+        new_instance.lazy_cache = LazyCache()
+        new_instance.env_cores = {}
+        new_instance.lock = threading.RLock()
+        new_instance.key_reloads = {}
+        new_instance.watcher = None
         return new_instance
 
 
+_UNCOPIED_CORE_ATTRS = (
+    "_cache",
+    "lazy_cache",
+    "env_cores",
+    "lock",
+    "key_reloads",
+    "watcher",
+)
+
+
+class SetOptions(NamedTuple):
+    """The options `Settings.set` depends on, resolved once per batch."""
+
+    validate: Any
+    dotted_lookup: Any
+    index_pattern: Optional[re.Pattern]
+    nested_sep: Optional[str]
+    dynaboxify: bool
+    auto_cast: bool
+
+
+@lru_cache
+def _index_pattern(index_separator: str) -> re.Pattern:
+    """Matches the list indexes of a key e.g `DATA__a___0__key`"""
+    return re.compile(rf"{index_separator}(\d+)")
+
+
 def invalidates_cache(func):
-    """Decorator that clears the cache before calling the decorated method."""
+    """Decorator that clears the cache before and after calling the
+    decorated method, holding the core lock while it runs."""
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         # core should encapsulates all the caching logic
         # using getattr because before Settings init it's unset
         core = getattr(self, "__core__", None)
-        if core:
+        if not core:
+            return func(self, *args, **kwargs)
+        with core.lock:
             core.clear_cache()
-        return func(self, *args, **kwargs)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                # the method may have published a new core
+                self.__core__.clear_cache()
 
     return wrapper
 
 
+_env_overlays: contextvars.ContextVar = contextvars.ContextVar(
+    "_env_overlays", default=None
+)
+"""id(settings) -> the core of the env entered by `Settings.using_env`"""
+
+
+class _CoreAttribute:
+    """`__core__` of the settings with an env entered by `using_env`, the
+    core of that env in the context that entered it, the instance one in
+    any other context."""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            core = obj.__dict__["__core__"]
+        except KeyError:
+            raise AttributeError("__core__") from None
+        overlays = _env_overlays.get()
+        if overlays:
+            return overlays.get(id(obj), core)
+        return core
+
+    def __set__(self, obj, value):
+        obj.__dict__["__core__"] = value
+
+
 class Settings:
     """User-facing settings object."""
 
     dynaconf_banner = BANNER
+    __core__ = _CoreAttribute()
 
     def __init__(self, settings_module=None, **kwargs):  # pragma: no cover
         """Execute loaders and custom initialization
@@ -306,14 +477,12 @@ class Settings:
                 loader_identifier="init_settings_module",
             )
         kwargs.pop("validators", None)
-        for key, value in kwargs.items():
-            self.set(
-                key,
-                value,
-                loader_identifier="init_kwargs",
-                validate=False,
-                dotted_lookup=True,
-            )
+        self._update(
+            kwargs,
+            self._set_options(dotted_lookup=True, validate=False),
+            loader_identifier="init_kwargs",
+            dotted_lookup=True,
+        )
 
         # These skipping flags are used for when copying of settings is done
         skip_loaders = kwargs.get("dynaconf_skip_loaders", False)
@@ -344,6 +513,8 @@ class Settings:
     @property
     def store(self):
         """Gets internal storage"""
+        if self.__core__.config.lazy_keys:
+            self._load_lazy_keys()
         return self.__core__.store
 
     def __getattr__(self, key):
@@ -351,6 +522,7 @@ class Settings:
         try:
             if key != "__core__":
                 core = self.__core__
+                cache = core._cache
                 return core.get_cached(key)
         except KeyError:
             pass
@@ -364,13 +536,15 @@ class Settings:
         # This is to keep the only upper case mode working
         # __getattribute__ will only match exact casing, first levels always upper
         if _should_use_strict_uppercase(key, self):
-            value = core.store.__getattribute__(key)
+            if key in core.config.lazy_keys:
+                self._load_lazy_keys([key])
+            value = self.__core__.store.__getattribute__(key)
         # Use regular .get which triggers hooks among other things
         else:
             value = self.get(key, default=empty)
             if value is empty:
                 raise AttributeError(key)
-            core.set_cached(key, value)
+            core.set_cached(key, value, cache)
         return value
 
     def __getitem__(self, key):
@@ -380,6 +554,7 @@ class Settings:
         try:
             if key != "__core__":
                 core = self.__core__
+                cache = core._cache
                 return core.get_cached(key)
         except KeyError:
             pass
@@ -388,7 +563,7 @@ class Settings:
         value = self.get(key, default=empty)
         if value is empty:
             raise KeyError(f"{key} does not exist")
-        core.set_cached(key, value)
+        core.set_cached(key, value, cache)
         return value
 
     @invalidates_cache
@@ -407,6 +582,7 @@ class Settings:
     def __delattr__(self, name):
         """stores reference in `_deleted` for proper error management"""
         self.__core__.config.deleted.add(name)
+        self.__core__.lazy_cache.invalidate(upperfy(name))
         if hasattr(self, name):
             super().__delattr__(name)
 
@@ -424,7 +600,11 @@ class Settings:
         if isinstance(item, str) and "." in item:
             return self.get(item, default=missing) is not missing
 
-        return item.upper() in self.store or item.lower() in self.store
+        if isinstance(item, str):
+            if item.upper() in self.__core__.config.lazy_keys:
+                self._load_lazy_keys([item.upper()])
+        store = self.__core__.store
+        return item.upper() in store or item.lower() in store
 
     def __dir__(self):
         """Enable auto-complete for code editors"""
@@ -633,10 +813,12 @@ class Settings:
             elif isinstance(default, dict):
                 default = DataDict(default)
 
-        if key in config.deleted:
-            return default
-
-        if (
+        # `key` may be reloading on this core, see `_reload_key`
+        reloads = core.key_reloads.get(key, 0) if parent is None else 0
+        deleted = key in config.deleted and not fresh
+        if deleted:
+            pass
+        elif (
             (fresh or config.fresh or key in config.fresh_vars)
             and key not in UPPER_DEFAULT_SETTINGS
             and parent is None
@@ -647,14 +829,42 @@ class Settings:
             # setting, so it must not be unset/reloaded here: doing so
             # would mark it as deleted permanently and break every
             # future lookup of the dotted key.
-            self.unset(key)
-            self.execute_loaders(key=key)
+            # An explicit `fresh` read reloads keys marked deleted, as a
+            # key missing from the sources on a previous reload is.
+            self._reload_key(key)
+            core = self.__core__
+            reloads = core.key_reloads.get(key, 0)
+            deleted = key in core.config.deleted
+        elif key in config.lazy_keys and parent is None:
+            self._load_lazy_keys([key])
+            core = self.__core__
+        else:
+            deleted = key in config.deleted
 
-        data = _get_with_default(parent or core.store, key, default)
-        if config.dynaboxify is False:
-            data = recursively_evaluate_lazy_format(data, self)
-        if cast:
-            data = apply_converter(cast, data, box_settings=self)
+        if deleted:
+            data = default
+        else:
+            data = _get_with_default(parent or core.store, key, default)
+            if config.dynaboxify is False:
+                data = recursively_evaluate_lazy_format(data, self)
+            if cast:
+                data = apply_converter(cast, data, box_settings=self)
+
+        if parent is None and (
+            reloads % 2 or core.key_reloads.get(key, 0) != reloads
+        ):
+            # read while `key` was reloading, read it again once it is done
+            with core.lock:
+                if core.key_reloads.get(key, 0) % 2:
+                    # reloading in this thread, e.g. read by its loaders
+                    return data
+                return self.get(
+                    key,
+                    default,
+                    cast=cast,
+                    dotted_lookup=dotted_lookup,
+                    sysenv_fallback=sysenv_fallback,
+                )
         return data
 
     def exists(self, key, fresh=False):
@@ -744,7 +954,6 @@ class Settings:
         config = self.__core__.config
         return config.loaded_by_loaders
 
-    @invalidates_cache
     def from_env(self, env="", keep=False, **kwargs):
         """Return a new isolated settings object pointing to specified env.
 
@@ -773,12 +982,28 @@ class Settings:
             keep {bool} -- Keep pre-existing values (default: {False})
             kwargs {dict} -- Passed directly to new instance.
         """
-        config = self.__core__.config
-
+        # reading does not change the values of this instance, its cache is
+        # kept, see `ENV_CACHE_SIZE_FOR_DYNACONF`
+        core = self.__core__
         cache_key = f"{env}_{keep}_{kwargs}"
-        if cache_key in config.env_cache:
-            return config.env_cache[cache_key]
-
+        new_settings = core.config.env_cache.get(cache_key)
+        if new_settings is None:
+            # loaded without the lock, so envs can be loaded concurrently
+            new_settings = self._load_env(env, keep, **kwargs)
+        with core.lock:
+            env_cache = core.config.env_cache
+            # another thread may have loaded the env meanwhile
+            new_settings = env_cache.pop(cache_key, new_settings)
+            cache_size = self.ENV_CACHE_SIZE_FOR_DYNACONF
+            if cache_size:
+                # most recently used last
+                env_cache[cache_key] = new_settings
+                while len(env_cache) > cache_size:
+                    env_cache.pop(next(iter(env_cache)))
+            return new_settings
+
+    def _load_env(self, env, keep, **kwargs):
+        """A new settings instance loading `env`, see `from_env`."""
         new_data = {
             key: self.get(key)
             for key in UPPER_DEFAULT_SETTINGS
@@ -810,18 +1035,19 @@ class Settings:
 
         new_data.update(kwargs)
         new_data["FORCE_ENV_FOR_DYNACONF"] = env
+        # frozen snapshots freeze the settings of the env themselves
+        new_data["FROZEN_FOR_DYNACONF"] = False
         new_data.setdefault("dynaconf_skip_validators", True)
         new_settings = LazySettings(**new_data)
         new_settings.unset("DYNACONF_SKIP_VALIDATORS")
-        config.env_cache[cache_key] = new_settings
 
         # update source metadata for inspecting
-        self.loaded_by_loaders.update(new_settings.loaded_by_loaders)
+        with self.__core__.lock:
+            self.loaded_by_loaders.update(new_settings.loaded_by_loaders)
 
         return new_settings
 
     @contextmanager
-    @invalidates_cache
     def using_env(self, env, clean=True, silent=True, filename=None):
         """
         This context manager allows the contextual use of a different env
@@ -841,23 +1067,57 @@ class Settings:
             ...    print settings.MESSAGE
             'this is in other env'
 
+        The env is loaded once, as `setenv` would, on a copy of this
+        object core which is kept until this object, the environment
+        variables or the loaded files change. Entering it
+        only makes this object read that core in the current thread or
+        asyncio task, other contexts keep reading the current env. Values
+        set in the block are set on the entered env only.
+
         :param env: Upper case name of env without any _
         :param clean: If preloaded vars should be cleaned
         :param silent: Silence errors
         :param filename: Custom filename to load (optional)
         :return: context
         """
+        env_core = self._env_core(env, clean, silent, filename)
+        overlays = dict(_env_overlays.get() or {})
+        overlays[id(self)] = env_core
+        token = _env_overlays.set(overlays)
         try:
-            self.setenv(env, clean=clean, silent=silent, filename=filename)
             yield
         finally:
-            if env.lower() != self.ENV_FOR_DYNACONF.lower():
-                del self.loaded_envs[-1]
-            self.setenv(self.current_env, clean=clean, filename=filename)
+            _env_overlays.reset(token)
 
     # compat
     using_namespace = using_env
 
+    def _env_core(self, env, clean, silent, filename):
+        """The core of this object with `env` loaded, see `using_env`."""
+        core = self.__core__
+        key = (str(env).upper(), clean, silent, str(filename))
+        environ = dict(os.environ)
+        cached = core.env_cores.get(key)
+        if cached is not None:
+            env_core, loaded_environ = cached
+            # loaded again when an env var or a settings file changed
+            if loaded_environ == environ and not any(
+                file_signature(path) != signature
+                for path, signature in env_core.config.file_signatures.items()
+            ):
+                return env_core
+
+        with core.lock:
+            staged = object.__new__(self.__class__)
+            staged.__dict__.update(self.__dict__)
+            # never published, writes go straight to the env core
+            staged.__dict__["__core__"] = core.staged_copy(staged)
+            staged.setenv(env, clean=clean, silent=silent, filename=filename)
+            env_core = staged.__core__
+            if core.cache_enabled:
+                core.env_cores[key] = (env_core, environ)
+        return env_core
+
     @contextmanager
     @invalidates_cache
     def fresh(self):
@@ -962,14 +1222,15 @@ class Settings:
 
         env = env.upper()
 
-        if env != self.ENV_FOR_DYNACONF:
-            self.loaded_envs.append(env)
-        else:
-            self.loaded_envs = []
+        with self._staging() as staged:
+            if env != staged.ENV_FOR_DYNACONF:
+                staged.loaded_envs.append(env)
+            else:
+                staged.loaded_envs = []
 
-        if clean:
-            self.clean(env=env)
-        self.execute_loaders(env=env, silent=silent, filename=filename)
+            if clean:
+                staged.clean(env=env)
+            staged.execute_loaders(env=env, silent=silent, filename=filename)
 
     # compat
     namespace = setenv
@@ -977,7 +1238,9 @@ class Settings:
     @invalidates_cache
     def clean(self, *args, **kwargs):
         """Clean all loaded values to reload when switching envs"""
-        for key in list(self.store.keys()):
+        core = self.__core__
+        core.config.lazy_keys.clear()
+        for key in list(core.store.keys()):
             self.unset(key)
 
     @invalidates_cache
@@ -987,18 +1250,24 @@ class Settings:
         :param key: The key to be unset
         :param force: Bypass default checks and force unset
         """
-        config = self.__core__.config
+        core = self.__core__
+        config = core.config
         key = upperfy(key.strip())
         if (
             key not in UPPER_DEFAULT_SETTINGS
             and key not in config.defaults
             or force
         ):
+            config.key_sources.pop(key, None)
+            config.lazy_keys.pop(key, None)
+            core.lazy_cache.invalidate(key)
+            if core.validators:
+                core.validators.changed(key)
             with suppress(KeyError, AttributeError):
                 # AttributeError can happen when a LazyValue consumes
                 # a previously deleted key
                 delattr(self, key)
-                del self.store[key]
+                del self.__core__.store[key]
 
     @invalidates_cache
     def unset_all(self, keys, force=False):  # pragma: no cover
@@ -1018,6 +1287,7 @@ class Settings:
         validate=empty,
         tomlfy_filter=None,
         list_merge: ListMergeOptions = "shallow",
+        options: SetOptions | None = None,
         **kwargs,
     ):
         """Sets dotted keys as nested dictionaries.
@@ -1032,13 +1302,53 @@ class Settings:
             tomlfy: Perform toml parsing (default: {False})
             validate: Pass the flag to validate down
             list_merge: The strategy used for list merging
+            options: The resolved `SetOptions`
         """
-        config = self.__core__.config
-        if validate is empty:
-            validate = self.get(
-                "VALIDATE_ON_UPDATE_FOR_DYNACONF"
-            )  # pragma: nocover
+        if options is None:
+            options = self._set_options(validate=validate)
+        validate = options.validate
 
+        top_key = _split_dotted_key(dotted_key, list_merge)[0]
+        new_data = self._dotted_tree(
+            dotted_key,
+            value,
+            self.get(top_key, {}),
+            options,
+            tomlfy=tomlfy,
+            tomlfy_filter=tomlfy_filter,
+            list_merge=list_merge,
+        )
+        # `new_data` is keyed by the already-resolved top level key
+        # (`split_keys[0]`). With index merge disabled a bracket is a literal
+        # key, so that key can still contain `[` (e.g. `servers[0]`). Writing
+        # it with dotted_lookup on would route it back into `_dotted_set` and
+        # recurse forever, so set the resolved keys literally.
+        self._update(
+            new_data,
+            options._replace(validate=False, dotted_lookup=False),
+            tomlfy=tomlfy,
+            tomlfy_filter=tomlfy_filter,
+            dotted_lookup=False,
+            **kwargs,
+        )
+        if validate is True:
+            self.__core__.validators.validate_changed()
+        elif validate == "all":
+            self.__core__.validators.validate_changed(validate_all=True)
+
+    def _dotted_tree(
+        self,
+        dotted_key: str,
+        value,
+        existing_data,
+        options: SetOptions,
+        tomlfy=False,
+        tomlfy_filter=None,
+        list_merge: ListMergeOptions = "shallow",
+    ) -> dict | DataDict:
+        """Build `{top_key: tree}` with the value set at `dotted_key` and
+        `existing_data`, the current value of top_key, merged around it."""
+        config = self.__core__.config
         if config.dynaboxify:
             new_data: dict | DataDict = DataDict(box_settings=self)
         else:
@@ -1049,15 +1359,20 @@ class Settings:
             tomlfy=tomlfy,
             box_settings=self,
             tomlfy_filter=tomlfy_filter,
+            auto_cast=options.auto_cast,
         )
 
         # 'deep' strategy is the index merging behavior
         if list_merge != "deep":
-            split_keys = dotted_key.split(".")
-            existing_data = self.get(split_keys[0], {})
+            split_keys = _split_dotted_key(dotted_key, list_merge)
             for k in split_keys[:-1]:
                 tree = tree.setdefault(k, {})
-            value = parse_conf_data(value, tomlfy=tomlfy, box_settings=self)
+            value = parse_conf_data(
+                value,
+                tomlfy=tomlfy,
+                box_settings=self,
+                auto_cast=options.auto_cast,
+            )
             tree[split_keys[-1]] = value
         else:
             # TODO @pbrochad: refactor this implementation, it's really cumbersome
@@ -1067,8 +1382,7 @@ class Settings:
             # >>> li=[]
             # >>> li.extend([li])
             # >>> li[0][0]...[0]
-            split_keys = dotted_key.replace("[", ".[").split(".")
-            existing_data = self.get(split_keys[0], {})
+            split_keys = _split_dotted_key(dotted_key, list_merge)
             for n, k in enumerate(split_keys):
                 is_not_end = n < (len(split_keys) - 1)
                 if is_not_end:
@@ -1121,19 +1435,7 @@ class Settings:
                 full_path=split_keys,
                 list_merge=list_merge,  # when to use deep / shallow replace?
             )
-        # `new_data` is keyed by the already-resolved top level key
-        # (`split_keys[0]`). With index merge disabled a bracket is a literal
-        # key, so that key can still contain `[` (e.g. `servers[0]`). Writing
-        # it with dotted_lookup on would route it back into `_dotted_set` and
-        # recurse forever, so set the resolved keys literally.
-        self.update(
-            data=new_data,
-            tomlfy=tomlfy,
-            validate=validate,
-            tomlfy_filter=tomlfy_filter,
-            dotted_lookup=False,
-            **kwargs,
-        )
+        return new_data
 
     @invalidates_cache
     def set(
@@ -1159,41 +1461,69 @@ class Settings:
         :param validate: Bool define if validation will be triggered
         :param tomlfy_filter: Optional tuple with the keys where tomlfy should apply
         """
-        core = self.__core__
-        config = core.config
-
-        # Ensure source_metadata always is set even if set is called
-        # without a loader_identifier
-        if isinstance(loader_identifier, str) or loader_identifier is None:
-            source_metadata = SourceMetadata(
-                loader="set_method",
-                identifier=loader_identifier or "undefined",
-                merged=merge is True,
-            )
-        else:  # loader identifier must be a SourceMetadata instance
-            source_metadata = loader_identifier
+        self._set(
+            key,
+            value,
+            self._set_options(dotted_lookup=dotted_lookup, validate=validate),
+            loader_identifier=loader_identifier,
+            tomlfy=tomlfy,
+            merge=merge,
+            tomlfy_filter=tomlfy_filter,
+        )
 
+    def _set_options(self, dotted_lookup=empty, validate=empty) -> SetOptions:
+        """Resolve the options used by `set`, explicit values take
+        precedence over the `*_FOR_DYNACONF` settings."""
         if validate is empty:
             validate = self.get("VALIDATE_ON_UPDATE_FOR_DYNACONF")
         if dotted_lookup is empty:
             dotted_lookup = self.get("DOTTED_LOOKUP_FOR_DYNACONF")
+        index_separator = self.get("INDEX_SEPARATOR_FOR_DYNACONF")
+        return SetOptions(
+            validate=validate,
+            dotted_lookup=dotted_lookup,
+            index_pattern=(
+                _index_pattern(index_separator) if index_separator else None
+            ),
+            nested_sep=self.get("NESTED_SEPARATOR_FOR_DYNACONF"),
+            dynaboxify=self.get("DYNABOXIFY", True),
+            auto_cast=auto_cast_enabled(self),
+        )
 
-        # Do index replacement first
-        list_merge: ListMergeOptions = "shallow"  # default
-        nested_ind = self.get("INDEX_SEPARATOR_FOR_DYNACONF")
-        index_merge_enabled = bool(nested_ind)
-        if index_merge_enabled and isinstance(key, str):
-            list_merge = "deep"
-            # DYNACONF_DATA__a___0__key___2__subkey ->
-            # DYNACONF_DATA__a[0]__key[2]__subkey
-            nested_ind = rf"{nested_ind}(\d+)"
-            key = re.sub(nested_ind, r"[\1]", key)
+    def _set(
+        self,
+        key,
+        value,
+        options: SetOptions,
+        loader_identifier: SourceMetadata | str | None = None,
+        tomlfy=False,
+        merge=empty,
+        tomlfy_filter: tuple[str, ...] | None = None,
+    ):
+        """`set` with the options already resolved, see `_set_options`."""
+        core = self.__core__
+        config = core.config
+        dotted_lookup = options.dotted_lookup
+        validate = options.validate
 
-        nested_sep = self.get("NESTED_SEPARATOR_FOR_DYNACONF")
+        source_metadata = _source_metadata(loader_identifier, merge)
+        key, list_merge = _resolve_key(key, options)
 
         if isinstance(key, str):
-            if nested_sep and nested_sep in key:
-                key = key.replace(nested_sep, ".")  # FOO__bar -> FOO.bar
+            if config.lazy_indexing:
+                top_key = key
+                if dotted_lookup is True:
+                    if list_merge == "deep":
+                        top_key = top_key.replace("[", ".[")
+                    top_key = top_key.split(".")[0]
+                top_key = upperfy(top_key.strip())
+                if not _is_dynaconf_option(top_key):
+                    # only record where the key comes from, its value is
+                    # loaded on first access, see `_load_lazy_keys`
+                    config.lazy_keys[top_key] = None
+                    sources = config.key_sources.setdefault(top_key, {})
+                    sources[source_metadata] = None
+                    return
 
             if ("." in key or "[" in key) and dotted_lookup is True:
                 return self._dotted_set(
@@ -1201,17 +1531,24 @@ class Settings:
                     value,
                     loader_identifier=source_metadata,
                     tomlfy=tomlfy,
-                    validate=validate,
                     tomlfy_filter=tomlfy_filter,
                     list_merge=list_merge,
+                    options=options,
                 )
             key = upperfy(key.strip())
 
+        if key in config.lazy_keys:
+            # values from the loaders come first
+            self._load_lazy_keys([key])
+            core = self.__core__
+            config = core.config
+
         parsed = parse_conf_data(
             value,
             tomlfy=tomlfy,
             box_settings=self,
             tomlfy_filter=tomlfy_filter,
+            auto_cast=options.auto_cast,
         )
 
         # Fix for #869 - Evaluating an existing lazy value during set can
@@ -1219,12 +1556,15 @@ class Settings:
         existing = None
         if not isinstance(parsed, Lazy):
             with suppress(AttributeError, KeyError):
-                if isinstance(self.store, DataDict):
-                    existing = self.store.get(key, bypass_eval=True)
+                if isinstance(core.store, DataDict):
+                    existing = core.store.get(key, bypass_eval=True)
                 else:
-                    existing = self.store.get(key)
+                    existing = core.store.get(key)
+
+        # meta values (`@insert`, `@merge`...) are marked objects
+        marked = not isinstance(parsed, (str, int, float))
 
-        if getattr(parsed, "_dynaconf_insert", False):
+        if marked and getattr(parsed, "_dynaconf_insert", False):
             # `@insert` calls insert in a list by index
             if existing and isinstance(existing, list):
                 source_metadata = source_metadata._replace(merged=True)
@@ -1233,14 +1573,16 @@ class Settings:
             else:
                 parsed = [parsed.unwrap()]
 
-        if getattr(parsed, "_dynaconf_del", None):
+        if marked and getattr(parsed, "_dynaconf_del", None):
             self.unset(key, force=True)  # `@del` in a first level var.
             return
 
-        if getattr(parsed, "_dynaconf_reset", False):  # pragma: no cover
+        if marked and getattr(
+            parsed, "_dynaconf_reset", False
+        ):  # pragma: no cover
             parsed = parsed.unwrap()  # `@reset` in a first level var.
 
-        if getattr(parsed, "_dynaconf_merge_unique", False):
+        if marked and getattr(parsed, "_dynaconf_merge_unique", False):
             # `@merge_unique` in a first level var
             if existing:
                 # update SourceMetadata (for inspecting purposes)
@@ -1249,7 +1591,7 @@ class Settings:
             else:
                 parsed = parsed.unwrap()
 
-        if getattr(parsed, "_dynaconf_merge", False):
+        if marked and getattr(parsed, "_dynaconf_merge", False):
             # `@merge` in a first level var
             if existing:
                 # update SourceMetadata (for inspecting purposes)
@@ -1275,7 +1617,7 @@ class Settings:
                 )
 
         if (
-            self.get("DYNABOXIFY", True)
+            options.dynaboxify
             and isinstance(parsed, dict)
             and not isinstance(parsed, DataDict)
         ):
@@ -1284,9 +1626,22 @@ class Settings:
         if isinstance(parsed, list) and not isinstance(parsed, DataList):
             parsed = DataList(parsed, box_settings=self)
 
-        # Set the parsed value
-        self.store[key] = parsed
+        if key == "HISTORY_MODE_FOR_DYNACONF":
+            # an invalid mode must not reach the store
+            parse_history_mode(parsed)
+
+        # Set the parsed value, on the current core as a fresh `get` above
+        # may have published a new one
+        core = self.__core__
+        config = core.config
+        core.store[key] = parsed
         config.deleted.discard(key)
+        core.lazy_cache.invalidate(key)
+        if core.validators:
+            core.validators.changed(key)
+        if core._cache:
+            # values read while setting, e.g by `_dotted_set`, are stale
+            core.clear_cache()
 
         # only use super().__setattr__ (uses the 'object' class setattr)
         # with internal values. Other values should go to internal store
@@ -1294,10 +1649,10 @@ class Settings:
             super().__setattr__(key, parsed)
 
         # Track history for inspect, store the raw_value
-        if source_metadata in self.loaded_by_loaders:
-            self.loaded_by_loaders[source_metadata][key] = value
-        else:
-            self.loaded_by_loaders[source_metadata] = {key: value}
+        if key == "HISTORY_MODE_FOR_DYNACONF":
+            config.loaded_by_loaders.set_mode(parsed)
+        config.loaded_by_loaders.record(source_metadata, key, value)
+        config.key_sources.setdefault(key, {})[source_metadata] = None
 
         if loader_identifier is None:
             # if .set is called without loader identifier it becomes
@@ -1305,7 +1660,7 @@ class Settings:
             config.defaults[key] = parsed
 
         if validate is True:
-            core.validators.validate()
+            core.validators.validate_changed()
 
     @invalidates_cache
     def update(
@@ -1340,33 +1695,164 @@ class Settings:
         :param kwargs: extra values to update
         :return: None
         """
-        core = self.__core__
-
-        if validate is empty:
-            validate = self.get("VALIDATE_ON_UPDATE_FOR_DYNACONF")
+        options = self._set_options(
+            dotted_lookup=dotted_lookup, validate=validate
+        )
+        validate = options.validate
 
         data = data or {}
         data.update(kwargs)
 
-        for key, value in data.items():
-            # update() will handle validation later
-            with suppress(ValidationError):
-                self.set(
-                    key,
-                    value,
-                    loader_identifier=loader_identifier,
-                    tomlfy=tomlfy,
-                    merge=merge,
-                    dotted_lookup=dotted_lookup,
-                    validate=validate,
-                    tomlfy_filter=tomlfy_filter,
-                )
+        # update() will handle validation later
+        self._update(
+            data,
+            options._replace(validate=False),
+            loader_identifier=loader_identifier,
+            tomlfy=tomlfy,
+            merge=merge,
+            tomlfy_filter=tomlfy_filter,
+            dotted_lookup=dotted_lookup,
+        )
 
         # handle param `validate`
+        core = self.__core__
         if validate is True:
-            core.validators.validate()
+            core.validators.validate_changed()
         elif validate == "all":
-            core.validators.validate_all()
+            core.validators.validate_changed(validate_all=True)
+
+    def _update(
+        self,
+        data,
+        options: SetOptions,
+        loader_identifier=None,
+        tomlfy=False,
+        merge=empty,
+        tomlfy_filter=None,
+        dotted_lookup=empty,
+    ):
+        """Apply all keys of `data` with `_set`, the options are resolved
+        again only when a key of the batch changes them.
+
+        :param dotted_lookup: The value passed by the caller, if any
+        """
+        groups = self._group_dotted_keys(data, options)
+        for key, value in data.items():
+            group = groups.get(key)
+            if group is not None:
+                # applied at once on the first key of the group
+                if group[0][0] == key:
+                    self._dotted_set_group(
+                        group,
+                        options,
+                        loader_identifier=_source_metadata(
+                            loader_identifier, merge
+                        ),
+                        tomlfy=tomlfy,
+                        tomlfy_filter=tomlfy_filter,
+                    )
+                continue
+            self._set(
+                key,
+                value,
+                options,
+                loader_identifier=loader_identifier,
+                tomlfy=tomlfy,
+                merge=merge,
+                tomlfy_filter=tomlfy_filter,
+            )
+            if isinstance(key, str) and upperfy(key) in _SET_OPTIONS_KEYS:
+                options = self._set_options(
+                    dotted_lookup=dotted_lookup, validate=options.validate
+                )
+
+    def _group_dotted_keys(self, data, options: SetOptions) -> dict:
+        """Group the dotted keys of `data` by their top level key, e.g
+        `DATABASES__default__PORT` and `DATABASES__default__HOST` from
+        environment variables, to be merged into the existing value at once.
+
+        Groups are formed only when the keys can be applied in any order and
+        the result is the same as setting them one by one.
+
+        :return: `{key: [(key, dotted_key, value, list_merge), ...]}` for all
+                 the keys of groups with more than one key
+        """
+        if (
+            len(data) < 2
+            or options.dotted_lookup is not True
+            or self.__core__.config.lazy_indexing
+            or self.get("MERGE_ENABLED_FOR_DYNACONF")
+        ):
+            return {}
+
+        groups: dict[str, list | None] = {}
+        for key, value in data.items():
+            if not isinstance(key, str):
+                continue
+            if upperfy(key) in _SET_OPTIONS_KEYS:
+                # the keys after it may be resolved differently
+                return {}
+            dotted_key, list_merge = _resolve_key(key, options)
+            split_keys = _split_dotted_key(dotted_key, list_merge)
+            top_key = upperfy(split_keys[0].strip())
+            group = groups.setdefault(top_key, [])
+            if group is None:
+                continue
+            if len(split_keys) == 1 or any(
+                k.lower().startswith("dynaconf_merge") for k in split_keys
+            ):
+                # a plain key must be set in its position
+                groups[top_key] = None
+                continue
+            group.append((key, dotted_key, value, list_merge))
+
+        return {
+            key: group
+            for group in groups.values()
+            if group is not None and len(group) > 1
+            for key, *_ in group
+        }
+
+    def _dotted_set_group(
+        self,
+        group: list,
+        options: SetOptions,
+        loader_identifier: SourceMetadata,
+        tomlfy=False,
+        tomlfy_filter=None,
+    ):
+        """Set a group of dotted keys with the same top level key, see
+        `_group_dotted_keys`.
+
+        The keys are merged one by one into the tree of the top level key,
+        as `_dotted_set` does, and the result is set once so the existing
+        value is read, parsed and boxed once for the whole group.
+        """
+        existing_data = self.get(
+            _split_dotted_key(group[0][1], group[0][3])[0], {}
+        )
+        for _, dotted_key, value, list_merge in group:
+            new_data = self._dotted_tree(
+                dotted_key,
+                value,
+                existing_data,
+                options,
+                tomlfy=tomlfy,
+                tomlfy_filter=tomlfy_filter,
+                list_merge=list_merge,
+            )
+            # `{top_key: tree}`, read without evaluating lazy values
+            existing_data = dict.__getitem__(
+                new_data, _split_dotted_key(dotted_key, list_merge)[0]
+            )
+        self._update(
+            new_data,
+            options._replace(validate=False, dotted_lookup=False),
+            loader_identifier=loader_identifier,
+            tomlfy=tomlfy,
+            tomlfy_filter=tomlfy_filter,
+            dotted_lookup=False,
+        )
 
     def _merge_before_set(
         self,
@@ -1431,15 +1917,22 @@ class Settings:
 
     @invalidates_cache
     def reload(self, env=None, silent=None):  # pragma: no cover
-        """Clean end Execute all loaders"""
-        config = self.__core__.config
-        self.clean()
-        config.loaded_hooks.clear()
-        for hook in config.post_hooks:
-            with suppress(AttributeError, TypeError):
-                hook._called = False
+        """Clean end Execute all loaders
 
-        self.execute_loaders(env, silent)
+        Loaders run on a staged copy published at once when done, so
+        concurrent readers never see a partially loaded store.
+        """
+        with self._staging() as staged:
+            config = staged.__core__.config
+            staged.clean()
+            config.loaded_hooks.clear()
+            # `from_env` settings were loaded from the previous sources
+            config.env_cache.clear()
+            for hook in config.post_hooks:
+                with suppress(AttributeError, TypeError):
+                    hook._called = False
+
+            staged.execute_loaders(env, silent)
 
     def execute_loaders(
         self, env=None, silent=None, key=None, filename=None, loaders=None
@@ -1459,21 +1952,29 @@ class Settings:
         env = (env or self.current_env).upper()
         silent = silent or self.SILENT_ERRORS_FOR_DYNACONF
 
-        if loaders is None:
-            self.pre_load(env, silent=silent, key=key)
-            settings_loader(
-                self, env=env, silent=silent, key=key, filename=filename
-            )
-            self.load_extra_yaml(env, silent, key)  # DEPRECATED
-            enable_external_loaders(self)
+        # with lazy_load the loaders only index the keys, see `set`
+        config.lazy_indexing = key is None and bool(
+            self.get("LAZY_LOAD_FOR_DYNACONF")
+        )
+        try:
+            if loaders is None:
+                self.pre_load(env, silent=silent, key=key)
+                settings_loader(
+                    self, env=env, silent=silent, key=key, filename=filename
+                )
+                self.load_extra_yaml(env, silent, key)  # DEPRECATED
+                enable_external_loaders(self)
 
-            loaders = self.loaders
-        # non setting_file or py_module loaders
-        for core_loader in loaders:
-            core_loader.load(self, env, silent=silent, key=key)
+                loaders = self.loaders
+            # non setting_file or py_module loaders
+            for core_loader in loaders:
+                core_loader.load(self, env, silent=silent, key=key)
 
-        self.load_includes(env, silent=silent, key=key)
+            self.load_includes(env, silent=silent, key=key)
+        finally:
+            self.__core__.config.lazy_indexing = False
 
+        config = self.__core__.config
         # execute hooks
         execute_module_hooks("post", self, env, silent=silent, key=key)
         execute_instance_hooks(self, "post", config.post_hooks)
@@ -1481,6 +1982,140 @@ class Settings:
         # always upper
         config.fresh_vars = ensure_upperfied_list(self.FRESH_VARS_FOR_DYNACONF)
 
+        if key is None:
+            # state of the settings files when all keys were loaded
+            config.loaded_file_signatures = dict(config.file_signatures)
+            config.key_file_signatures.clear()
+
+    def _reload_key(self, key):
+        """Unset `key` and load it again from its sources, see `_load_key`.
+
+        Only `key` changes, so it is loaded on the current core under the
+        lock instead of staging a copy of the whole store. Reads of `key`
+        overlapping the reload are done again once it ends, see `get`.
+        """
+        core = self.__core__
+        with core.lock:
+            reloads = core.key_reloads
+            reloads[key] = reloads.get(key, 0) + 1
+            try:
+                self._load_key(key)
+            finally:
+                reloads[key] += 1
+
+    def _load_key(self, key):
+        """Unset `key` and load it again from its sources.
+
+        When none of the settings files changed since `key` was loaded, only
+        the files that supplied `key` are loaded again, reusing their parsed
+        content, followed by the env and external loaders and the hooks.
+        Otherwise, or when `key` came from a source that can't be queried on
+        its own (python modules, `load_file`), all loaders run for `key`.
+        """
+        config = self.__core__.config
+        sources = list(config.key_sources.get(key, ()))
+        signatures = config.key_file_signatures.get(
+            key, config.loaded_file_signatures
+        )
+        self.unset(key)
+
+        files_changed = any(
+            file_signature(path) != signature
+            for path, signature in signatures.items()
+        )
+        if files_changed or not all(map(_is_key_reloadable, sources)):
+            self.execute_loaders(key=key)
+            config = self.__core__.config
+            config.key_file_signatures[key] = dict(config.file_signatures)
+            return
+
+        env = self.current_env.upper()
+        silent = self.SILENT_ERRORS_FOR_DYNACONF
+        files = {
+            source.identifier: _FILE_LOADERS[source.loader][0]
+            for source in sources
+            if source.loader in _FILE_LOADERS
+        }
+        for filename, loader in files.items():
+            loader.load(
+                self, env=env, silent=silent, key=key, filename=filename
+            )
+        for loader in self.loaders:
+            loader.load(self, env, silent=silent, key=key)
+        execute_module_hooks("post", self, env, silent=silent, key=key)
+        execute_instance_hooks(self, "post", config.post_hooks)
+
+    def _load_lazy_keys(self, keys=None):
+        """Load `keys` indexed by a lazy load, by default all pending keys.
+
+        Only the sources that define each key are loaded, in the same order
+        `execute_loaders` would load them, and the values are published at
+        once, see `_staging`.
+        """
+        with self.__core__.lock:
+            pending = self.__core__.config.lazy_keys
+            # another thread may have loaded them while we waited
+            keys = [key for key in keys or list(pending) if key in pending]
+            if not keys:
+                return
+            with self._staging() as staged:
+                config = staged.__core__.config
+                for key in keys:
+                    del config.lazy_keys[key]
+                indexing, config.lazy_indexing = config.lazy_indexing, False
+                try:
+                    for key in keys:
+                        staged._load_key(key)
+                finally:
+                    staged.__core__.config.lazy_indexing = indexing
+
+    @contextmanager
+    def _staging(self):
+        """Stage writes on a shadow of this object and publish them at once.
+
+        The shadow shares everything with this object but a copy of its
+        core, so loaders running on it build a new store off to the side
+        while concurrent readers keep using the current one. If the block
+        exits without errors the new core is published with a single
+        reference swap. Writers are serialized by the core lock.
+        """
+        with self.__core__.lock:
+            if self.__core__.staging:
+                # already a shadow, nothing is visible until it's published
+                yield self
+                return
+
+            staged = object.__new__(self.__class__)
+            staged.__dict__.update(self.__dict__)
+            staged.__dict__["__core__"] = self.__core__.staged_copy(staged)
+            yield staged
+
+            staged.__core__.staging = False
+            namespace = self.__dict__
+            namespace["__core__"] = staged.__dict__["__core__"]
+            for name in namespace.keys() - staged.__dict__.keys():
+                del namespace[name]
+            namespace.update(staged.__dict__)
+            # nodes created on the shadow keep pointing to it
+            object.__setattr__(staged, "__dict__", namespace)
+
+    def watch(self, interval=1.0, debounce=0.1, callback=None):
+        """Reload the settings in a background thread when its files change.
+
+        Changes are published at once after the new values are validated,
+        see `SettingsWatcher`.
+
+        :param interval: Seconds between checks of the files
+        :param debounce: Seconds the files must stay unchanged to reload
+        :param callback: Called with the set of changed keys after a reload
+        :return: The running `SettingsWatcher`, call `.stop()` to stop it
+        """
+        core = self.__core__
+        if core.watcher is not None:
+            core.watcher.stop()
+        core.watcher = SettingsWatcher(self, interval, debounce, callback)
+        return core.watcher.start()
+
     def pre_load(self, env, silent, key):
         """Do we have any file to pre-load before main settings file?"""
         preloads = self.get("PRELOAD_FOR_DYNACONF", [])
@@ -1618,9 +2253,9 @@ class Settings:
 
         # handle param `validate`
         if validate is True:
-            core.validators.validate()
+            core.validators.validate_changed()
         elif validate == "all":
-            core.validators.validate_all()
+            core.validators.validate_changed(validate_all=True)
 
     @property
     def _root_path(self):
@@ -1795,6 +2430,203 @@ class Settings:
         """This is to provide Django DJDT support: issue 382"""
         return False
 
+    def freeze(self):
+        """Return a read-only snapshot of the current settings.
+
+        Every Lazy value is evaluated once and the data is copied into
+        read-only nodes, so reading from the snapshot costs about the same
+        as reading from a plain dict. Later changes to this object are not
+        reflected on the snapshot.
+        """
+        data = {
+            key: freeze_node(value, self) for key, value in self.store.items()
+        }
+        return FrozenSettings(
+            data, current_env=self.current_env, settings=self
+        )
+
+
+def _frozen_settings_error(self, *args, **kwargs):
+    raise TypeError("settings are frozen")
+
+
+class FrozenSettings(FrozenDataDict):
+    """Read-only settings snapshot created by `Settings.freeze`.
+
+    Reads never go through the lookup machinery of `Settings`. The loading
+    history and `from_env` are served by the settings the snapshot was
+    created from, which are not kept by pickled copies.
+    """
+
+    __slots__ = ("_current_env", "_settings")
+
+    def __init__(self, data=(), current_env=None, settings=None):
+        super().__init__(data)
+        object.__setattr__(self, "_current_env", current_env)
+        object.__setattr__(self, "_settings", settings)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self), self._current_env)
+
+    def __call__(self, *args, **kwargs):
+        """Allow direct call of `frozen('val')`
+        in place of `frozen.get('val')`
+        """
+        return self.get(*args, **kwargs)
+
+    @property
+    def current_env(self):
+        return self._current_env
+
+    @property
+    def environ(self):
+        return os.environ
+
+    @property
+    def store(self):
+        """The snapshot is its own storage"""
+        return self
+
+    def _source(self):
+        if self._settings is None:
+            raise AttributeError(
+                "Settings snapshot restored from a copy has no source, "
+                "freeze the settings again."
+            )
+        return self._settings
+
+    @property
+    def loaded_envs(self):
+        return self._source().loaded_envs
+
+    loaded_namespaces = loaded_envs
+
+    @property
+    def loaded_by_loaders(self):
+        return self._source().loaded_by_loaders
+
+    def from_env(self, env="", keep=False, **kwargs):
+        """Return a snapshot of the settings pointing to `env`,
+        see `Settings.from_env`."""
+        return self._source().from_env(env, keep, **kwargs).freeze()
+
+    def get(
+        self,
+        key,
+        default=None,
+        cast=None,
+        fresh=False,
+        dotted_lookup=empty,
+        parent=None,
+        sysenv_fallback=None,
+    ):
+        """Get a value from the snapshot, same semantics of `Settings.get`
+
+        :param key: The name of the setting value, will always be upper case
+        :param default: In case of not found it will be returned
+        :param cast: Should cast in to @int, @float, @bool or @json ?
+        :param fresh: Ignored, a snapshot is never reloaded
+        :param dotted_lookup: Should perform dotted-path lookup?
+        :param parent: Is there a pre-loaded parent in a nested data?
+        :param sysenv_fallback: Should fallback to system environ if not found?
+        :return: The value if found, default or None
+        """
+        names = [key]
+        if isinstance(key, str):
+            nested_sep = dict.get(self, "NESTED_SEPARATOR_FOR_DYNACONF")
+            if nested_sep and nested_sep in key:
+                key = key.replace(nested_sep, ".")
+            if dotted_lookup is empty:
+                dotted_lookup = dict.get(self, "DOTTED_LOOKUP_FOR_DYNACONF")
+            names = key.split(".") if dotted_lookup else [key]
+            names[0] = upperfy(names[0])
+
+        if default is None:
+            if sysenv_fallback is None:
+                sysenv_fallback = dict.get(
+                    self, "SYSENV_FALLBACK_FOR_DYNACONF"
+                )
+            if sysenv_fallback is True or (
+                isinstance(sysenv_fallback, list)
+                and names[0] in [upperfy(k) for k in sysenv_fallback]
+            ):
+                default = self.get_environ(names[0], cast=True)
+
+        if parent is None:
+            data = FrozenDataDict.get(self, names[0], missing)
+        else:
+            data = _get_with_default(parent, names[0], missing)
+        for name in names[1:]:
+            if data is missing:
+                break
+            if not isinstance(data, (dict, list)):
+                raise AttributeError(
+                    f"Invalid dotted lookup in {key}. "
+                    f"{name} is a {type(data).__name__}"
+                )
+            data = _get_with_default(data, name, missing)
+
+        if data is missing:
+            data = default
+        if cast:
+            data = apply_converter(cast, data, box_settings=self)
+        return data
+
+    def get_fresh(self, key, default=None, cast=None):
+        """Same as `get`, a snapshot is never reloaded"""
+        return self.get(key, default=default, cast=cast)
+
+    get_environ = Settings.get_environ.__wrapped__
+    exists_in_environ = Settings.exists_in_environ
+
+    def exists(self, key, fresh=False):
+        """Check if key exists"""
+        return self.get(key, default=missing) is not missing
+
+    def as_bool(self, key):
+        """Partial method for get with bool cast"""
+        return self.get(key, cast="@bool")
+
+    def as_int(self, key):
+        """Partial method for get with int cast"""
+        return self.get(key, cast="@int")
+
+    def as_float(self, key):
+        """Partial method for get with float cast"""
+        return self.get(key, cast="@float")
+
+    def as_json(self, key):
+        """Partial method for get with json cast"""
+        return self.get(key, cast="@json")
+
+    def as_dict(self, env=None, internal=False):
+        """Returns a mutable dictionary with set key and values.
+
+        :param env: Str env name, default self.current_env `DEVELOPMENT`
+        :param internal: bool - should include dynaconf internal vars?
+        """
+        current_env = (self.current_env or "").upper()
+        if env is not None and env.upper() != current_env:
+            return self.from_env(env).as_dict(internal=internal)
+        data = to_dict(self)
+        if not internal:
+            for name in UPPER_DEFAULT_SETTINGS:
+                data.pop(name, None)
+        return data
+
+    to_dict = as_dict
+
+    def is_overridden(self, setting):  # noqa
+        """This is to provide Django DJDT support: issue 382"""
+        return False
+
+    # methods of `Settings` that would change the snapshot
+    set = update = unset = unset_all = clean = _frozen_settings_error
+    setenv = namespace = using_env = using_namespace = _frozen_settings_error
+    reload = execute_loaders = load_file = _frozen_settings_error
+    fresh = watch = _frozen_settings_error
+    validators = property(_frozen_settings_error)
+
 
 """Upper case default settings"""
 UPPER_DEFAULT_SETTINGS = [k for k in dir(default_settings) if k.isupper()]
@@ -1812,6 +2644,14 @@ RESERVED_ATTRS = [
 
 _INTERNAL_KEYS = set(RESERVED_ATTRS + UPPER_DEFAULT_SETTINGS)
 
+"""Attributes LazySettings keeps on its own __dict__"""
+_LAZY_SETTINGS_ATTRS = {
+    "_wrapped",
+    "_kwargs",
+    "_wrapper_class",
+    "_warn_dynaconf_global_settings",
+}
+
 # These are special fields defined by Dynaconf, but users can access it
 _PUBLIC_PROPERTIES = [
     name
@@ -1821,6 +2661,62 @@ _PUBLIC_PROPERTIES = [
 ]
 
 
+def _source_metadata(
+    loader_identifier: SourceMetadata | str | None, merge=empty
+) -> SourceMetadata:
+    """Ensure source_metadata always is set even if set is called
+    without a loader_identifier"""
+    if isinstance(loader_identifier, str) or loader_identifier is None:
+        return SourceMetadata(
+            loader="set_method",
+            identifier=loader_identifier or "undefined",
+            merged=merge is True,
+        )
+    # loader identifier must be a SourceMetadata instance
+    return loader_identifier
+
+
+def _resolve_key(key, options: SetOptions) -> tuple[Any, ListMergeOptions]:
+    """Replace the index and nested separators of `key` and return it
+    with the list merge strategy to use.
+
+    DYNACONF_DATA__a___0__key___2__subkey ->
+    DYNACONF_DATA.a[0].key[2].subkey
+    """
+    if not isinstance(key, str):
+        return key, "shallow"
+    list_merge: ListMergeOptions = "shallow"  # default
+    # Do index replacement first
+    if options.index_pattern is not None:
+        list_merge = "deep"
+        key = options.index_pattern.sub(r"[\1]", key)
+    nested_sep = options.nested_sep
+    if nested_sep and nested_sep in key:
+        key = key.replace(nested_sep, ".")  # FOO__bar -> FOO.bar
+    return key, list_merge
+
+
+def _split_dotted_key(
+    dotted_key: str, list_merge: ListMergeOptions = "shallow"
+) -> list[str]:
+    """`foo.bar[0]` -> `["foo", "bar", "[0]"]` when merging by index"""
+    if list_merge == "deep":
+        return dotted_key.replace("[", ".[").split(".")
+    return dotted_key.split(".")
+
+
+"""Settings that change the `SetOptions`"""
+_SET_OPTIONS_KEYS = frozenset(
+    (
+        "AUTO_CAST_FOR_DYNACONF",
+        "DOTTED_LOOKUP_FOR_DYNACONF",
+        "DYNABOXIFY",
+        "INDEX_SEPARATOR_FOR_DYNACONF",
+        "NESTED_SEPARATOR_FOR_DYNACONF",
+    )
+)
+
+
 @lru_cache
 def _is_key_internal(key: str | int) -> bool:
     return (
@@ -1828,6 +2724,39 @@ def _is_key_internal(key: str | int) -> bool:
     ) or key in _INTERNAL_KEYS
 
 
+"""Loaders and extensions of settings files, keyed by source identifier"""
+_FILE_LOADERS = {
+    "yaml": (yaml_loader, ct.YAML_EXTENSIONS),
+    "toml": (toml_loader, ct.TOML_EXTENSIONS),
+    "ini": (ini_loader, ct.INI_EXTENSIONS),
+    "json": (json_loader, ct.JSON_EXTENSIONS),
+}
+
+
+def _is_key_reloadable(source: SourceMetadata) -> bool:
+    """Can `Settings._reload_key` reload values coming from `source`?
+
+    Files must have been read by the settings loader, values from python
+    modules or `load_file` require running all loaders.
+    """
+    if source.loader in _FILE_LOADERS:
+        _, extensions = _FILE_LOADERS[source.loader]
+        return str(source.identifier).endswith(extensions)
+    return not (
+        source.loader in ("py", "py_global", "settings_loader")
+        or source.loader.startswith("load_file@")
+    )
+
+
+def _is_dynaconf_option(key: str) -> bool:
+    """Options drive the loading itself, so they are never lazy loaded."""
+    return (
+        key in UPPER_DEFAULT_SETTINGS
+        or key.endswith("_FOR_DYNACONF")
+        or key.startswith(("DYNACONF_", "_"))
+    )
+
+
 def _should_use_strict_uppercase(key, obj):
     return (isinstance(key, str) and key.islower()) and getattr(
         obj, "LOWERCASE_READ_FOR_DYNACONF", empty
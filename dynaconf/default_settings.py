@@ -108,6 +108,10 @@ ENV_FOR_DYNACONF = get(ENV_SWITCHER_FOR_DYNACONF, "DEVELOPMENT")
 # This variable exists to support `from_env` method
 FORCE_ENV_FOR_DYNACONF = get("FORCE_ENV_FOR_DYNACONF", None)
 
+# Number of `from_env` settings kept, the least recently used are dropped
+# and all of them on `reload`
+ENV_CACHE_SIZE_FOR_DYNACONF = get("ENV_CACHE_SIZE_FOR_DYNACONF", 32)
+
 # Default values is taken from DEFAULT pseudo env
 # this value is used only when reading files like .toml|yaml|ini|json
 DEFAULT_ENV_FOR_DYNACONF = get("DEFAULT_ENV_FOR_DYNACONF", "DEFAULT")
@@ -204,6 +208,9 @@ VAULT_SECRET_ID_FOR_DYNACONF = get("VAULT_SECRET_ID_FOR_DYNACONF", None)
 VAULT_USERNAME_FOR_DYNACONF = get("VAULT_USERNAME_FOR_DYNACONF", None)
 VAULT_PASSWORD_FOR_DYNACONF = get("VAULT_PASSWORD_FOR_DYNACONF", None)
 VAULT_TOKEN_RENEW_FOR_DYNACONF = get("VAULT_TOKEN_RENEW_FOR_DYNACONF", False)
+VAULT_MAX_WORKERS_FOR_DYNACONF = get("VAULT_MAX_WORKERS_FOR_DYNACONF", 4)
+VAULT_CACHE_TTL_FOR_DYNACONF = get("VAULT_CACHE_TTL_FOR_DYNACONF", 0)
+VAULT_CACHE_STALE_FOR_DYNACONF = get("VAULT_CACHE_STALE_FOR_DYNACONF", 0)
 
 # Only core loaders defined on this list will be invoked
 core_loaders = ["YAML", "TOML", "INI", "JSON", "PY"]
@@ -271,6 +278,18 @@ VALIDATE_ON_UPDATE_FOR_DYNACONF = get("VALIDATE_ON_UPDATE_FOR_DYNACONF", False)
 # Use system environ as fallback when a setting was not set
 SYSENV_FALLBACK_FOR_DYNACONF = get("SYSENV_FALLBACK_FOR_DYNACONF", False)
 
+# Replace the settings with a read-only snapshot once loaded and validated
+FROZEN_FOR_DYNACONF = get("FROZEN_FOR_DYNACONF", False)
+
+# Index the keys on load and only read their values when first accessed
+LAZY_LOAD_FOR_DYNACONF = get("LAZY_LOAD_FOR_DYNACONF", False)
+
+# Reload when the settings files change, True or seconds between checks
+WATCH_FOR_DYNACONF = get("WATCH_FOR_DYNACONF", False)
+
+# What `loaded_by_loaders` records: full, keys, ring:<size> or off
+HISTORY_MODE_FOR_DYNACONF = get("HISTORY_MODE_FOR_DYNACONF", "full")
+
 
 # Backwards compatibility with renamed variables
 for old, new in RENAMED_VARS.items():
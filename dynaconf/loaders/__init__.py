@@ -127,10 +127,12 @@ def execute_module_hooks(
 
     # Try to load from python filename path
     files = files or config.loaded_files
-    for loaded_file in files:
-        hook_file = os.path.join(
-            os.path.dirname(loaded_file), "dynaconf_hooks.py"
-        )
+    # files loaded again are listed again, their hooks are looked up once
+    hook_files = dict.fromkeys(
+        os.path.join(os.path.dirname(loaded_file), "dynaconf_hooks.py")
+        for loaded_file in dict.fromkeys(files)
+    )
+    for hook_file in hook_files:
         if not os.path.exists(hook_file):
             # Return early if file doesn't exist.
             # Faster than attempting to import.
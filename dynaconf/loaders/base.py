@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from types import GeneratorType
 from typing import NamedTuple
 
 from dynaconf.utils import build_env_list
+from dynaconf.utils import copy_tree
 from dynaconf.utils import ensure_a_list
 from dynaconf.utils import upperfy
+from dynaconf.utils.files import file_signature
 from dynaconf.utils.functional import empty
 
 
@@ -44,6 +52,7 @@ class BaseLoader:
             "encoding": obj.get("ENCODING_FOR_DYNACONF", "utf-8"),
         }
         self.validate = validate
+        self.key = None
 
     @staticmethod
     def warn_not_installed(obj, identifier):  # pragma: no cover
@@ -77,6 +86,7 @@ class BaseLoader:
         else:  # it is already a list/tuple
             files = filename
 
+        self.key = key
         source_data = self.get_source_data(files)
 
         if (
@@ -91,17 +101,13 @@ class BaseLoader:
         """Reads each file and returns source data for each file
         {"path/to/file.ext": {"key": "value"}}
         """
-        config = self.obj.__core__.config
-
         data = {}
         for source_file in files:
             if source_file.endswith(self.extensions):
                 try:
-                    with open(source_file, **self.opener_params) as open_file:
-                        content = self.file_reader(open_file)
-                        config.loaded_files.append(source_file)
-                        if content:
-                            data[source_file] = content
+                    content = self.read_source_file(source_file)
+                    if content:
+                        data[source_file] = content
                 except OSError as e:
                     if ".local." not in source_file:
                         warnings.warn(
@@ -115,6 +121,35 @@ class BaseLoader:
                     data[source_file] = content
         return data
 
+    def read_source_file(self, source_file):
+        """Reads and parses `source_file` recording its signature.
+
+        Parsed files are kept in the process-wide `parsed_files` cache and
+        reused while the file is unchanged. The cached tree is shared and
+        returned as is, `_set_data_to_obj` copies only the env or the key
+        being loaded, so loading one env of a file with many envs does not
+        copy the others.
+        """
+        config = self.obj.__core__.config
+        signature = file_signature(source_file)
+        config.file_signatures[source_file] = signature
+        cache_key = (
+            os.path.realpath(source_file),
+            _reader_id(self.file_reader),
+            tuple(sorted(self.opener_params.items())),
+        )
+        content = parsed_files.get(cache_key, source_file, signature)
+        if content is empty:
+            digest = parsed_files.digest_if_racy(source_file, signature)
+            with open(source_file, **self.opener_params) as open_file:
+                content = self.file_reader(open_file)
+                if isinstance(content, GeneratorType):  # multi document yaml
+                    content = tuple(content)
+            parsed_files.set(cache_key, signature, digest, content)
+        history = config.loaded_by_loaders
+        history.add_loaded(config.loaded_files, source_file)
+        return content
+
     def _envless_load(self, source_data, silent=True, key=None):
         """Load all the keys from each file without env separation"""
         for file_name, file_data in source_data.items():
@@ -190,10 +225,28 @@ class BaseLoader:
         file_dotted_lookup=None,
     ):
         """Calls settings.set to add the keys"""
+        if key:
+            self._set_key_to_obj(
+                data, identifier, file_merge, upperfy(key), file_dotted_lookup
+            )
+            return
+
+        data, file_merge, file_dotted_lookup = self._prepare_data(
+            data, file_merge, file_dotted_lookup
+        )
+        # `data` may be shared with the parsed files cache
+        self.obj.update(
+            copy_tree(data),
+            loader_identifier=identifier,
+            merge=file_merge,
+            dotted_lookup=file_dotted_lookup,
+            validate=self.validate,
+        )
+
+    def _prepare_data(self, data, file_merge, file_dotted_lookup):
+        """`(data, file_merge, file_dotted_lookup)` of the `data` to load"""
         # data 1st level keys should be transformed to upper case.
         data = {upperfy(k): v for k, v in data.items()}
-        if key:
-            key = upperfy(key)
 
         if self.obj.filter_strategy:
             data = self.obj.filter_strategy(data)
@@ -210,19 +263,46 @@ class BaseLoader:
                 "DYNACONF_DOTTED_LOOKUP",
                 self.obj.get("DOTTED_LOOKUP_FOR_DYNACONF"),
             )
+        return data, file_merge, file_dotted_lookup
 
-        if not key:
-            self.obj.update(
-                data,
-                loader_identifier=identifier,
-                merge=file_merge,
-                dotted_lookup=file_dotted_lookup,
-                validate=self.validate,
+    def _set_key_to_obj(
+        self, data, identifier, file_merge, key, file_dotted_lookup
+    ):
+        """Set the entries of `data` loaded with `key`, these are found in
+        an index of `data` by top level key kept with the parsed file."""
+        obj = self.obj
+        nested_sep = obj.get("NESTED_SEPARATOR_FOR_DYNACONF")
+        options = (
+            file_merge,
+            file_dotted_lookup,
+            obj.get("DOTTED_LOOKUP_FOR_DYNACONF"),
+            nested_sep,
+            obj.filter_strategy,
+        )
+        index = parsed_files.get_key_index(data, options)
+        if index is None:
+            prepared, merge, dotted_lookup = self._prepare_data(
+                data, file_merge, file_dotted_lookup
             )
-        elif key in data:
-            self.obj.set(
-                key,
-                data.get(key),
+            # `KEY__nested` and `"KEY.nested"` entries are loaded with `KEY`
+            entries: dict = {}
+            for name, value in prepared.items():
+                top_key = name
+                if nested_sep:
+                    top_key = top_key.replace(nested_sep, ".")
+                if dotted_lookup is True:
+                    top_key = top_key.replace("[", ".").split(".")[0]
+                top_key = upperfy(top_key.strip())
+                entries.setdefault(top_key, []).append((name, value))
+            index = (merge, dotted_lookup, entries)
+            parsed_files.set_key_index(data, options, index)
+
+        file_merge, file_dotted_lookup, entries = index
+        for name, value in entries.get(key, ()):
+            # `value` may be shared with the parsed files cache
+            obj.set(
+                name,
+                copy_tree(value),
                 loader_identifier=identifier,
                 merge=file_merge,
                 dotted_lookup=file_dotted_lookup,
@@ -230,6 +310,106 @@ class BaseLoader:
             )
 
 
+class ParsedFilesCache:
+    """Process-wide LRU cache of parsed settings files.
+
+    Entries are keyed by (realpath, reader, opener params) and hold the file
+    signature `(mtime_ns, size)` at parse time, so `from_env`, `setenv`,
+    `reload` and fresh reads of the same files skip parsing while the files
+    are unchanged.
+
+    A file modified less than `racy_seconds` before it was parsed may be
+    modified again keeping the same signature, so for those entries the
+    content digest is also compared.
+    """
+
+    def __init__(self, maxsize=128, racy_seconds=2):
+        self.maxsize = maxsize
+        self.racy_ns = racy_seconds * 1_000_000_000
+        self._data: OrderedDict = OrderedDict()
+        # id(data) -> (data, options, index), see `get_key_index`
+        self._key_indexes: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, path, signature):
+        """Returns the parsed content or `empty` if missing or stale."""
+        if signature is None or not self.maxsize:
+            return empty
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+        if entry is None or entry[0] != signature:
+            return empty
+        _, digest, content = entry
+        if digest is not None and digest != _file_digest(path):
+            return empty
+        return content
+
+    def digest_if_racy(self, path, signature):
+        """Digest of the file content if it was modified recently."""
+        if signature is None or time.time_ns() - signature[0] > self.racy_ns:
+            return None
+        return _file_digest(path)
+
+    def set(self, key, signature, digest, content):
+        if signature is None or not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = (signature, digest, content)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_key_index(self, data, options):
+        """The index by top level key of `data`, a parsed file or one of
+        its envs, built with `options`, or None."""
+        with self._lock:
+            entry = self._key_indexes.get(id(data))
+        # `data` is kept in the entry so its id is not reused meanwhile
+        if entry is None or entry[0] is not data or entry[1] != options:
+            return None
+        return entry[2]
+
+    def set_key_index(self, data, options, index):
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._key_indexes[id(data)] = (data, options, index)
+            self._key_indexes.move_to_end(id(data))
+            while len(self._key_indexes) > self.maxsize:
+                self._key_indexes.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._key_indexes.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+parsed_files = ParsedFilesCache()
+
+
+def _file_digest(path):
+    try:
+        with open(path, "rb") as open_file:
+            return hashlib.blake2b(open_file.read(), digest_size=16).digest()
+    except OSError:
+        return None
+
+
+def _reader_id(reader):
+    """Lambdas without closures (e.g ini_loader's) are created on each load
+    but are equivalent, so their code object is used as identity."""
+    code = getattr(reader, "__code__", None)
+    if code is not None and reader.__name__ == "<lambda>":
+        if not reader.__closure__:
+            return code
+    return reader
+
+
 class SourceMetadata(NamedTuple):
     """
     Useful metadata about some loaded source (file, envvar, etc).
@@ -101,6 +101,24 @@ def load_from_env(
                     boolean_fix(value), tomlfy=True, box_settings=obj
                 )
 
+        # nested values of the key e.g: `DYNACONF_KEY__nested=1`
+        nested_sep = obj.get("NESTED_SEPARATOR_FOR_DYNACONF")
+        if nested_sep:
+            nested_prefix = f"{key}{nested_sep}".upper()
+            trim_len = len(env_)
+            data = {
+                name[trim_len:]: parse_conf_data(
+                    boolean_fix(value), tomlfy=True, box_settings=obj
+                )
+                for name, value in environ.items()
+                if name.startswith(env_)
+                and name[trim_len:].upper().startswith(nested_prefix)
+            }
+            if data:
+                obj.update(
+                    data, loader_identifier=source_metadata, validate=validate
+                )
+
     # Load environment variables in bulk (when matching).
     else:
         # Only known variables should be loaded from environment?
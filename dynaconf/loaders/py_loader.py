@@ -80,8 +80,9 @@ def load_from_python_object(
         elif setting.startswith("_dynaconf_hook") and callable(setting_value):
             if setting_value not in config.post_hooks:
                 config.post_hooks.append(setting_value)
-    config.loaded_py_modules.append(mod.__name__)
-    config.loaded_files.append(mod.__file__)
+    history = config.loaded_by_loaders
+    history.add_loaded(config.loaded_py_modules, mod.__name__)
+    history.add_loaded(config.loaded_files, mod.__file__)
 
 
 def try_to_load_from_py_module_name(
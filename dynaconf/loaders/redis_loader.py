@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import threading
+
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.utils import build_env_list
 from dynaconf.utils import upperfy
@@ -12,15 +15,24 @@ except ImportError:
     StrictRedis = None
 
 IDENTIFIER = "redis"
+# `write` and `delete` publish the changed keys to `CHANNEL_PREFIX + holder`
+CHANNEL_PREFIX = "dynaconf:"
+
+# clients by connection settings, each one holds its connection pool
+_clients: dict = {}
+_clients_lock = threading.Lock()
 
 
 def _get_redis_client(obj):
-    """Create a Redis client from settings.
+    """Return the Redis client for the connection settings of `obj`.
 
     If REDIS_URL_FOR_DYNACONF is set, uses StrictRedis.from_url() which
     supports all URL schemes including rediss:// for TLS connections.
     Otherwise falls back to creating a client from REDIS_FOR_DYNACONF kwargs.
 
+    Clients are created once for each URL or set of kwargs and shared by
+    all settings objects, so loads reuse the connections of its pool.
+
     :param obj: the settings instance
     :return: StrictRedis client
     """
@@ -33,39 +45,77 @@ def _get_redis_client(obj):
 
     redis_url = obj.get("REDIS_URL_FOR_DYNACONF")
     if redis_url:
-        return StrictRedis.from_url(redis_url)
-    return StrictRedis(**obj.get("REDIS_FOR_DYNACONF"))
+        cache_key = redis_url
+    else:
+        kwargs = dict(obj.get("REDIS_FOR_DYNACONF"))
+        cache_key = repr(sorted(kwargs.items()))
 
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            if redis_url:
+                client = StrictRedis.from_url(redis_url)
+            else:
+                client = StrictRedis(**kwargs)
+            _clients[cache_key] = client
+        return client
 
-def load(obj, env=None, silent=True, key=None, validate=False):
-    """Reads and loads in to "settings" a single key or all keys from redis
 
-    :param obj: the settings instance
-    :param env: settings env default='DYNACONF'
-    :param silent: if errors should raise
-    :param key: if defined load a single key, else load all in env
-    :return: None
-    """
-    redis = _get_redis_client(obj)
+def _holders(obj, env=None):
+    """`[(env_name, holder), ...]` for the envs loaded by `obj`."""
     prefix = obj.get("ENVVAR_PREFIX_FOR_DYNACONF")
     env_list = build_env_list(obj, env or obj.current_env)
     # prefix is added to env_list to keep backwards compatibility
     if prefix:
         env_list.insert(0, prefix)
 
+    holders = []
     for env_name in env_list:
         if prefix:
             holder = f"{prefix.upper()}_{env_name.upper()}"
         else:
             holder = env_name.upper()
+        holders.append((env_name, holder.upper()))
+    return holders
+
+
+def _env_holder(obj, env=None):
+    """The holder of `env`, the current env by default, for writing."""
+    holder = obj.get("ENVVAR_PREFIX_FOR_DYNACONF").upper()
+    # add env to holder
+    return f"{holder}_{(env or obj.current_env).upper()}".upper()
+
 
-        try:
+def load(obj, env=None, silent=True, key=None, validate=False):
+    """Reads and loads in to "settings" a single key or all keys from redis
+
+    The hashes of all the envs are read in a single pipelined round trip.
+
+    :param obj: the settings instance
+    :param env: settings env default='DYNACONF'
+    :param silent: if errors should raise
+    :param key: if defined load a single key, else load all in env
+    :return: None
+    """
+    redis = _get_redis_client(obj)
+    holders = _holders(obj, env)
+
+    try:
+        # all the holders are read in a single round trip
+        pipeline = redis.pipeline(transaction=False)
+        for _, holder in holders:
+            if key:
+                pipeline.hget(holder, key)
+            else:
+                pipeline.hgetall(holder)
+        results = pipeline.execute()
+
+        for (env_name, _), result in zip(holders, results):
             source_metadata = SourceMetadata(IDENTIFIER, "unique", env_name)
             if key:
-                value = redis.hget(holder.upper(), key)
-                if value:
+                if result:
                     parsed_value = parse_conf_data(
-                        value, tomlfy=True, box_settings=obj
+                        result, tomlfy=True, box_settings=obj
                     )
                     if parsed_value:
                         obj.set(
@@ -77,7 +127,7 @@ def load(obj, env=None, silent=True, key=None, validate=False):
             else:
                 data = {
                     key: parse_conf_data(value, tomlfy=True, box_settings=obj)
-                    for key, value in redis.hgetall(holder.upper()).items()
+                    for key, value in result.items()
                 }
                 if data:
                     obj.update(
@@ -85,10 +135,30 @@ def load(obj, env=None, silent=True, key=None, validate=False):
                         loader_identifier=source_metadata,
                         validate=validate,
                     )
-        except Exception:
-            if silent:
-                return False
-            raise
+    except Exception:
+        if silent:
+            return False
+        raise
+
+
+def _ensure_enabled(obj):
+    if obj.REDIS_ENABLED_FOR_DYNACONF is False:
+        raise RuntimeError(
+            "Redis is not configured \n"
+            "export REDIS_ENABLED_FOR_DYNACONF=true\n"
+            "and configure the REDIS_*_FOR_DYNACONF variables"
+        )
+
+
+def _redis_data(data):
+    return {
+        upperfy(key): unparse_conf_data(value) for key, value in data.items()
+    }
+
+
+def _publish(pipeline, holder, keys):
+    """Queue the message announcing the `keys` changed in `holder`."""
+    pipeline.publish(f"{CHANNEL_PREFIX}{holder}", json.dumps(sorted(keys)))
 
 
 def write(obj, data=None, **kwargs):
@@ -99,25 +169,41 @@ def write(obj, data=None, **kwargs):
     :param kwargs: vars to be stored
     :return:
     """
-    if obj.REDIS_ENABLED_FOR_DYNACONF is False:
-        raise RuntimeError(
-            "Redis is not configured \n"
-            "export REDIS_ENABLED_FOR_DYNACONF=true\n"
-            "and configure the REDIS_*_FOR_DYNACONF variables"
-        )
+    _ensure_enabled(obj)
     client = _get_redis_client(obj)
-    holder = obj.get("ENVVAR_PREFIX_FOR_DYNACONF").upper()
-    # add env to holder
-    holder = f"{holder}_{obj.current_env.upper()}"
+    holder = _env_holder(obj)
 
     data = data or {}
     data.update(kwargs)
     if not data:
         raise AttributeError("Data must be provided")
-    redis_data = {
-        upperfy(key): unparse_conf_data(value) for key, value in data.items()
-    }
-    client.hset(holder.upper(), mapping=redis_data)
+    redis_data = _redis_data(data)
+    pipeline = client.pipeline(transaction=False)
+    pipeline.hset(holder, mapping=redis_data)
+    _publish(pipeline, holder, redis_data)
+    pipeline.execute()
+    load(obj)
+
+
+def write_many(obj, data_by_env):
+    """Write the values of many envs in a single round trip
+
+    :param obj: settings object
+    :param data_by_env: `{env: {key: value}}` vars to be stored by env
+    :return:
+    """
+    _ensure_enabled(obj)
+    if not any(data_by_env.values()):
+        raise AttributeError("Data must be provided")
+    client = _get_redis_client(obj)
+    pipeline = client.pipeline(transaction=False)
+    for env, data in data_by_env.items():
+        if data:
+            holder = _env_holder(obj, env)
+            redis_data = _redis_data(data)
+            pipeline.hset(holder, mapping=redis_data)
+            _publish(pipeline, holder, redis_data)
+    pipeline.execute()
     load(obj)
 
 
@@ -129,14 +215,106 @@ def delete(obj, key=None):
     :return: None
     """
     client = _get_redis_client(obj)
-    holder = obj.get("ENVVAR_PREFIX_FOR_DYNACONF").upper()
-    # add env to holder
-    holder = f"{holder}_{obj.current_env.upper()}"
+    holder = _env_holder(obj)
 
+    pipeline = client.pipeline(transaction=False)
     if key:
-        client.hdel(holder.upper(), upperfy(key))
+        pipeline.hdel(holder, upperfy(key))
+        _publish(pipeline, holder, [upperfy(key)])
+        pipeline.execute()
         obj.unset(key)
     else:
-        keys = client.hkeys(holder.upper())
-        client.delete(holder.upper())
+        keys = list(map(_text, client.hkeys(holder)))
+        pipeline.delete(holder)
+        _publish(pipeline, holder, keys)
+        pipeline.execute()
+        obj.unset_all(keys)
+
+
+def delete_many(obj, keys):
+    """
+    Delete many keys of the current env in a single round trip
+    :param obj: settings object
+    :param keys: keys to delete from store location
+    :return: None
+    """
+    keys = list(keys)
+    if keys:
+        client = _get_redis_client(obj)
+        holder = _env_holder(obj)
+        redis_keys = list(map(upperfy, keys))
+        pipeline = client.pipeline(transaction=False)
+        pipeline.hdel(holder, *redis_keys)
+        _publish(pipeline, holder, redis_keys)
+        pipeline.execute()
         obj.unset_all(keys)
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _reload_keys(obj, keys):
+    """Load `keys` again from all their sources, see `Settings._reload_key`"""
+    for key in keys:
+        obj._reload_key(upperfy(_text(key)))
+
+
+def subscribe(obj, keyspace=False, sleep_time=0.1):
+    """Keep `obj` up to date with the changes made in redis, opt-in.
+
+    Listens in a background thread to the messages `write` and `delete`
+    publish for the hashes of the envs loaded by `obj`. On a message, only
+    the changed keys are loaded again, their cached and lazy values are
+    dropped. Reads keep reading the values in memory.
+
+    With `keyspace=True` it listens to the redis keyspace notifications of
+    the hashes instead, so changes made by any redis client are seen. The
+    server must have them enabled, e.g `notify-keyspace-events Kgh`, the
+    changed keys are found by comparing the hashes with their last values.
+
+    :param obj: the settings instance
+    :param keyspace: Listen to keyspace notifications
+    :param sleep_time: Seconds to wait for messages on each poll
+    :return: The running thread, call `.stop()` to unsubscribe
+    """
+    client = _get_redis_client(obj)
+    holders = [holder for _, holder in _holders(obj)]
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+
+    if keyspace:
+        pipeline = client.pipeline(transaction=False)
+        for holder in holders:
+            pipeline.hgetall(holder)
+        values = dict(zip(holders, pipeline.execute()))
+
+        def on_keyspace_event(message):
+            holder = _text(message["channel"]).split("__:", 1)[1]
+            new_values = client.hgetall(holder)
+            old_values = values.get(holder, {})
+            values[holder] = new_values
+            _reload_keys(
+                obj,
+                {
+                    key
+                    for key in old_values.keys() | new_values.keys()
+                    if old_values.get(key) != new_values.get(key)
+                },
+            )
+
+        pubsub.psubscribe(
+            **{
+                f"__keyspace@*__:{holder}": on_keyspace_event
+                for holder in holders
+            }
+        )
+    else:
+
+        def on_message(message):
+            _reload_keys(obj, json.loads(_text(message["data"])))
+
+        pubsub.subscribe(
+            **{f"{CHANNEL_PREFIX}{holder}": on_message for holder in holders}
+        )
+
+    return pubsub.run_in_thread(sleep_time=sleep_time, daemon=True)
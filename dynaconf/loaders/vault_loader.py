@@ -2,6 +2,10 @@
 # pip install hvac
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.utils import build_env_list
 from dynaconf.utils.parse_conf import parse_conf_data
@@ -15,6 +19,7 @@ try:
     from hvac import Client
     from hvac.exceptions import Forbidden
     from hvac.exceptions import InvalidPath
+    from hvac.exceptions import InvalidRequest
 except ImportError:
     raise ImportError(
         "vault package is not installed in your environment. "
@@ -25,12 +30,38 @@ except ImportError:
 
 IDENTIFIER = "vault"
 
+# authenticated clients by vault settings as `(client, renew_at, renewable)`
+_sessions: dict = {}
+_sessions_lock = threading.Lock()
+# `(value, expires_at, stale_until)` of the lists and secrets read by `load`
+_secrets: dict = {}
+_secrets_lock = threading.Lock()
+# cache keys being read again by a thread
+_refreshing: set = set()
+
 
 # backwards compatibility
 _get_env_list = build_env_list
 
 
-def get_client(obj):
+def _session_key(obj):
+    """The vault url, client options and credentials used by `obj`."""
+    return repr(
+        (
+            sorted(obj.VAULT_FOR_DYNACONF.items()),
+            obj.VAULT_ROLE_ID_FOR_DYNACONF,
+            obj.get("VAULT_SECRET_ID_FOR_DYNACONF"),
+            obj.VAULT_ROOT_TOKEN_FOR_DYNACONF,
+            obj.VAULT_USERNAME_FOR_DYNACONF,
+            obj.VAULT_PASSWORD_FOR_DYNACONF,
+            obj.VAULT_AUTH_WITH_IAM_FOR_DYNACONF,
+            obj.VAULT_AUTH_ROLE_FOR_DYNACONF,
+            obj.VAULT_KV_VERSION_FOR_DYNACONF,
+        )
+    )
+
+
+def _login(obj):
     client = Client(
         **{k: v for k, v in obj.VAULT_FOR_DYNACONF.items() if v is not None}
     )
@@ -66,41 +97,221 @@ def get_client(obj):
     if obj.VAULT_TOKEN_RENEW_FOR_DYNACONF:
         client.auth.token.renew_self()
 
-    assert client.is_authenticated(), (
+    client.secrets.kv.default_kv_version = obj.VAULT_KV_VERSION_FOR_DYNACONF
+    return client
+
+
+def _token_ttl(client):
+    """`(ttl, renewable)` of the client token, 0 ttl never expires."""
+    try:
+        data = client.auth.token.lookup_self()["data"]
+    except (Forbidden, InvalidPath, InvalidRequest):
+        data = None
+    assert data, (
         "Vault authentication error: is VAULT_TOKEN_FOR_DYNACONF or "
         "VAULT_ROLE_ID_FOR_DYNACONF defined?"
     )
-    client.secrets.kv.default_kv_version = obj.VAULT_KV_VERSION_FOR_DYNACONF
-    return client
+    return data.get("ttl") or 0, data.get("renewable", False)
 
 
-def load(obj, env=None, silent=None, key=None, validate=False):
-    """Reads and loads in to "settings" a single key or all keys from vault
+def _renew_at(ttl):
+    # renew when 2/3 of the token ttl have passed
+    if not ttl:
+        return float("inf")
+    return time.monotonic() + ttl * 2 / 3
+
+
+def get_client(obj):
+    """Return an authenticated client for the vault settings of `obj`.
+
+    Clients are shared by all settings objects with the same url, options
+    and credentials and reused until 2/3 of their token ttl have passed,
+    then the token is renewed, or a new login is made when the token is not
+    renewable or the renewal fails.
 
     :param obj: the settings instance
-    :param env: settings env default='DYNACONF'
-    :param silent: if errors should raise
-    :param key: if defined load a single key, else load all in env
-    :return: None
+    :return: hvac Client
     """
-    client = get_client(obj)
+    cache_key = _session_key(obj)
+    with _sessions_lock:
+        session = _sessions.get(cache_key)
+        if session is not None and time.monotonic() < session[1]:
+            return session[0]
+        if session is not None and session[2]:
+            client = session[0]
+            try:
+                auth = client.auth.token.renew_self()["auth"]
+            except (Forbidden, InvalidPath, InvalidRequest):
+                pass
+            else:
+                ttl = auth.get("lease_duration") or 0
+                renewable = auth.get("renewable", False)
+                _sessions[cache_key] = (client, _renew_at(ttl), renewable)
+                return client
+        client = _login(obj)
+        ttl, renewable = _token_ttl(client)
+        _sessions[cache_key] = (client, _renew_at(ttl), renewable)
+        return client
+
+
+def _store(cache_key, read, ttl, stale):
+    value = read()
+    lease = None
+    if isinstance(value, dict):
+        lease = value.get("lease_duration")
+    if lease:
+        ttl = min(ttl, lease)
+    expires_at = time.monotonic() + ttl
+    with _secrets_lock:
+        _secrets[cache_key] = (value, expires_at, expires_at + stale)
+    return value
+
+
+def _revalidate(cache_key, read, ttl, stale):
     try:
-        if obj.VAULT_KV_VERSION_FOR_DYNACONF == 2:
-            dirs = client.secrets.kv.v2.list_secrets(
-                path=obj.VAULT_PATH_FOR_DYNACONF,
-                mount_point=obj.VAULT_MOUNT_POINT_FOR_DYNACONF,
-            )["data"]["keys"]
+        _store(cache_key, read, ttl, stale)
+    except Exception:
+        # keep serving the stale value until it is too old
+        pass
+    finally:
+        with _secrets_lock:
+            _refreshing.discard(cache_key)
+
+
+def _cached(obj, cache_key, read):
+    """Return `read()`, cached for VAULT_CACHE_TTL_FOR_DYNACONF seconds.
+
+    The ttl is shortened to the lease duration of the secret when it has
+    one. For VAULT_CACHE_STALE_FOR_DYNACONF seconds after expiring the
+    cached value is still returned while a thread reads it again.
+    """
+    ttl = obj.get("VAULT_CACHE_TTL_FOR_DYNACONF") or 0
+    if ttl <= 0:
+        return read()
+    stale = obj.get("VAULT_CACHE_STALE_FOR_DYNACONF") or 0
+    now = time.monotonic()
+    with _secrets_lock:
+        entry = _secrets.get(cache_key)
+        if entry is not None:
+            value, expires_at, stale_until = entry
+            if now < expires_at:
+                return value
+            if now < stale_until:
+                if cache_key not in _refreshing:
+                    _refreshing.add(cache_key)
+                    threading.Thread(
+                        target=_revalidate,
+                        args=(cache_key, read, ttl, stale),
+                        daemon=True,
+                    ).start()
+                return value
+    return _store(cache_key, read, ttl, stale)
+
+
+def _login_again(obj, client):
+    """A client logged in again when the token of `client` was revoked.
+
+    Returns None when the token is still valid, as it is only denied the
+    requested path.
+    """
+    cache_key = _session_key(obj)
+    with _sessions_lock:
+        session = _sessions.get(cache_key)
+        if session is not None and session[0] is not client:
+            # another thread already logged in again
+            return session[0]
+        try:
+            client.auth.token.lookup_self()
+        except (Forbidden, InvalidPath, InvalidRequest):
+            _sessions.pop(cache_key, None)
         else:
-            dirs = client.secrets.kv.v1.list_secrets(
+            return None
+    return get_client(obj)
+
+
+def _authorized(obj, client, request):
+    """Return `request(client)` or None when Vault answers Forbidden.
+
+    A shared client is trusted until its token expires, if the token is
+    revoked before, the session is dropped and `request` is retried once
+    with a new login.
+    """
+    try:
+        return request(client)
+    except Forbidden:
+        client = _login_again(obj, client)
+    if client is None:
+        return None
+    try:
+        return request(client)
+    except Forbidden:
+        return None
+
+
+def _list_dirs(obj, client):
+    def request(client):
+        if obj.VAULT_KV_VERSION_FOR_DYNACONF == 2:
+            return client.secrets.kv.v2.list_secrets(
                 path=obj.VAULT_PATH_FOR_DYNACONF,
                 mount_point=obj.VAULT_MOUNT_POINT_FOR_DYNACONF,
-            )["data"]["keys"]
+            )
+        return client.secrets.kv.v1.list_secrets(
+            path=obj.VAULT_PATH_FOR_DYNACONF,
+            mount_point=obj.VAULT_MOUNT_POINT_FOR_DYNACONF,
+        )
+
+    try:
+        response = _authorized(obj, client, request)
     except InvalidPath:
         # The given path is not a directory
-        dirs = []
-    except Forbidden:
+        return []
+    if response is None:
         # The given token does not have permission to list the given path
-        dirs = []
+        return []
+    return response["data"]["keys"]
+
+
+def _read_secret(obj, client, path, kv_version, mount_point):
+    def request(client):
+        if kv_version == 2:
+            return client.secrets.kv.v2.read_secret_version(
+                path,
+                mount_point=mount_point,
+                raise_on_deleted_version=True,  # keep default behavior
+            )
+        return client.secrets.kv.read_secret(
+            "data/" + path,
+            mount_point=mount_point,
+        )
+
+    try:
+        return _authorized(obj, client, request)
+    except InvalidPath:
+        # If the path doesn't exist, ignore it and set data to None
+        return None
+
+
+def load(obj, env=None, silent=None, key=None, validate=False):
+    """Reads and loads in to "settings" a single key or all keys from vault
+
+    The paths of all envs are read concurrently by up to
+    VAULT_MAX_WORKERS_FOR_DYNACONF threads and loaded in order.
+
+    :param obj: the settings instance
+    :param env: settings env default='DYNACONF'
+    :param silent: if errors should raise
+    :param key: if defined load a single key, else load all in env
+    :return: None
+    """
+    client = get_client(obj)
+    session_key = _session_key(obj)
+    kv_version = obj.VAULT_KV_VERSION_FOR_DYNACONF
+    mount_point = obj.VAULT_MOUNT_POINT_FOR_DYNACONF
+    dirs = _cached(
+        obj,
+        (session_key, "list", obj.VAULT_PATH_FOR_DYNACONF),
+        lambda: _list_dirs(obj, client),
+    )
     # First look for secrets into environments less store
     if not obj.ENVIRONMENTS_FOR_DYNACONF:
         # By adding '', dynaconf will now read secrets from environments-less
@@ -109,25 +320,29 @@ def load(obj, env=None, silent=None, key=None, validate=False):
     # Finally, look for secret into all the environments
     else:
         env_list = dirs + build_env_list(obj, env)
+
+    def read(path):
+        return _cached(
+            obj,
+            (session_key, "read", path),
+            lambda: _read_secret(obj, client, path, kv_version, mount_point),
+        )
+
+    paths = {
+        env: "/".join([obj.VAULT_PATH_FOR_DYNACONF, env]) for env in env_list
+    }
+    unique_paths = list(dict.fromkeys(paths.values()))
+    max_workers = min(
+        obj.get("VAULT_MAX_WORKERS_FOR_DYNACONF") or 1, len(unique_paths)
+    )
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            secrets = dict(zip(unique_paths, executor.map(read, unique_paths)))
+    else:
+        secrets = {path: read(path) for path in unique_paths}
+
     for env in env_list:
-        path = "/".join([obj.VAULT_PATH_FOR_DYNACONF, env])
-        try:
-            if obj.VAULT_KV_VERSION_FOR_DYNACONF == 2:
-                data = client.secrets.kv.v2.read_secret_version(
-                    path,
-                    mount_point=obj.VAULT_MOUNT_POINT_FOR_DYNACONF,
-                    raise_on_deleted_version=True,  # keep default behavior
-                )
-            else:
-                data = client.secrets.kv.read_secret(
-                    "data/" + path,
-                    mount_point=obj.VAULT_MOUNT_POINT_FOR_DYNACONF,
-                )
-        except InvalidPath:
-            # If the path doesn't exist, ignore it and set data to None
-            data = None
-        except Forbidden:
-            data = None
+        data = secrets[paths[env]]
         if data:
             # There seems to be a data dict within a data dict,
             # extract the inner data
@@ -184,6 +399,9 @@ def write(obj, data=None, **kwargs):
         raise AttributeError("Data must be provided")
     data = {"data": data}
     client = get_client(obj)
+    # secrets read before may have changed
+    with _secrets_lock:
+        _secrets.clear()
     if obj.VAULT_KV_VERSION_FOR_DYNACONF == 1:
         mount_point = obj.VAULT_MOUNT_POINT_FOR_DYNACONF + "/data"
     else:
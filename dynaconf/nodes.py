@@ -18,6 +18,8 @@ import copy
 import inspect
 import warnings
 from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
@@ -45,6 +47,16 @@ class NodeMetadata:
 
     core: Optional[DynaconfCore] = None
     data_env: str = "default"
+    # normalized key -> key, built on first case-insensitive lookup
+    casing: Optional[dict] = field(default=None, repr=False, compare=False)
+    # normalized keys of more than one key, these can't be dropped alone
+    shared_casings: Optional[set] = field(
+        default=None, repr=False, compare=False
+    )
+    # bumped when keys change, see `get_casing_index`
+    version: int = field(default=0, repr=False, compare=False)
+    # holds values to evaluate, see `recursively_evaluate_lazy_format`
+    lazy: bool = field(default=False, repr=False, compare=False)
 
 
 class DataDict(dict):
@@ -70,20 +82,14 @@ class DataDict(dict):
             try:
                 result = super().__getitem__(item)
             except KeyError:
-                pass
-                n_item = (
-                    ut.find_the_correct_casing(item, tuple(self.keys()))
-                    or item
-                )
+                n_item = ut.find_key_casing(item, self) or item
                 result = super().get(n_item, empty)
                 result = result if result is not empty else default
             return recursively_evaluate_lazy_format(result, self.__meta__.core)
         try:
             return super().__getitem__(item)
         except (AttributeError, KeyError):
-            n_item = (
-                ut.find_the_correct_casing(item, tuple(self.keys())) or item
-            )
+            n_item = ut.find_key_casing(item, self) or item
             return super().__getitem__(n_item)
 
     def __copy__(self):
@@ -102,9 +108,7 @@ class DataDict(dict):
         try:
             result = super().__getitem__(item)
         except (AttributeError, KeyError):
-            n_item = (
-                ut.find_the_correct_casing(item, tuple(self.keys())) or item
-            )
+            n_item = ut.find_key_casing(item, self) or item
             result = super().__getitem__(n_item)
         return recursively_evaluate_lazy_format(result, self.__meta__.core)
 
@@ -134,9 +138,55 @@ class DataDict(dict):
             return super().__setattr__(k, v)
         self[k] = v
 
+    def __setitem__(self, k, v):
+        super().__setitem__(k, v)
+        # __meta__ is not set yet while unpickling
+        meta = self.__dict__.get("__meta__")
+        if meta is not None:
+            meta.version += 1
+            casings = meta.casing
+            if casings is not None and isinstance(k, str):
+                shared = meta.shared_casings
+                for casing in (k.lower(), k.replace(" ", "_").lower()):
+                    if casings.setdefault(casing, k) != k:
+                        if shared is None:
+                            meta.shared_casings = shared = set()
+                        shared.add(casing)
+
     def __delitem__(self, k):
-        resolved = ut.find_the_correct_casing(k, tuple(self.keys())) or k
+        resolved = ut.find_key_casing(k, self) or k
         super().__delitem__(resolved)
+        drop_casing(self, resolved)
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        reset_casing(self)
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        reset_casing(self)
+        return result
+
+    def clear(self):
+        super().clear()
+        reset_casing(self)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        reset_casing(self)
+
+    def __or__(self, other: Any) -> dict:
+        return dict.__or__(self, other)
+
+    def __ior__(self, other: Any) -> DataDict:
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return super().__getitem__(key)
 
     def __delattr__(self, name):
         self.__delitem__(name)
@@ -152,7 +202,7 @@ class DataDict(dict):
         yield from self.keys()
 
     def __contains__(self, key):
-        resolved = ut.find_the_correct_casing(key, tuple(self.keys())) or key
+        resolved = ut.find_key_casing(key, self) or key
         return super().__contains__(resolved)
 
     # Box compatibility. Remove in 4.0
@@ -398,10 +448,42 @@ class DataList(list):
         super().__init__(*args, **kwargs)
         self.__meta__ = NodeMetadata(core=core)
         convert_containers(self, enumerate(self), core)
+        self.__meta__.lazy = any(map(needs_evaluation, self))
 
     def copy(self):
         return DataList((x for x in self), core=self.__meta__.core)
 
+    # keep `__meta__.lazy` up to date, removing items leaves it set
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            track_lazy(self, value)
+        else:
+            super().__setitem__(index, value)
+            track_lazy(self, (value,))
+
+    def append(self, value):
+        super().append(value)
+        track_lazy(self, (value,))
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        track_lazy(self, (value,))
+
+    def extend(self, values):
+        values = list(values)
+        super().extend(values)
+        track_lazy(self, values)
+
+    def __add__(self, values: Any) -> list:
+        return list.__add__(self, values)
+
+    def __iadd__(self, values: Any) -> DataList:
+        self.extend(values)
+        return self
+
     def __getitem__(self, index):
         result = super().__getitem__(index)
         return recursively_evaluate_lazy_format(result, self.__meta__.core)
@@ -686,6 +768,100 @@ class DataList(list):
         )
 
 
+def _frozen_error(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class FrozenDataDict(dict):
+    """A read-only and fully evaluated counterpart of DataDict.
+
+    Built by `freeze_node`, it holds no Lazy values and no core reference, so
+    reads are plain dict reads. Case-insensitive access is served from a
+    normalized key index built once.
+    """
+
+    __slots__ = ("_casing",)
+
+    def __init__(self, data=()):
+        dict.__init__(self, data)
+        casing = {}
+        for key in dict.keys(self):
+            if not isinstance(key, str):
+                continue
+            casing.setdefault(key.lower(), key)
+            casing.setdefault(key.replace(" ", "_").lower(), key)
+        object.__setattr__(self, "_casing", casing)
+
+    def _resolve(self, key):
+        if isinstance(key, str):
+            return self._casing.get(key.lower(), empty)
+        return empty
+
+    def __missing__(self, key):
+        resolved = self._resolve(key)
+        if resolved is empty:
+            raise KeyError(key)
+        return dict.__getitem__(self, resolved)
+
+    def __getattr__(self, attr):
+        try:
+            return dict.__getitem__(self, attr)
+        except KeyError:
+            resolved = self._resolve(attr)
+        if resolved is empty:
+            raise AccessError(attr)
+        return dict.__getitem__(self, resolved)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self._resolve(key) is not empty
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return f"{dict(self)}"
+
+    def __dir__(self):
+        return list(self.keys()) + dir(type(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _frozen_error
+    clear = pop = popitem = setdefault = update = __ior__ = _frozen_error
+
+
+class FrozenDataList(list):
+    """A read-only and fully evaluated counterpart of DataList."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"{list(self)!r}"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen_error
+    append = extend = insert = remove = pop = clear = _frozen_error
+    sort = reverse = _frozen_error
+
+
 ################
 ## NODE UTILS ##
 ################
@@ -709,6 +885,68 @@ def get_core(node, raises=True) -> DynaconfCore:
     return dynaconf_core
 
 
+def reset_casing(node: DataDict):
+    """Drop the casing index of `node` to be rebuilt on the next lookup.
+
+    Removing keys may promote another key as the first match of a casing.
+    """
+    meta = node.__dict__.get("__meta__")
+    if meta is not None:
+        meta.version += 1
+        meta.casing = None
+
+
+def drop_casing(node: DataDict, key: Any):
+    """Drop the deleted `key` from the casing index of `node`.
+
+    The index is rebuilt instead when another key has a casing of `key`.
+    """
+    meta = node.__dict__.get("__meta__")
+    if meta is None:
+        return
+    casings = meta.casing
+    if casings is None or not isinstance(key, str):
+        reset_casing(node)
+        return
+    dropped = {key.lower(), key.replace(" ", "_").lower()}
+    if not dropped.isdisjoint(meta.shared_casings or ()):
+        reset_casing(node)
+        return
+    meta.version += 1
+    for casing in dropped:
+        casings.pop(casing, None)
+
+
+def shallow_copy_node(node: DataDict, core) -> DataDict:
+    """Copy the first level of `node` for `core`, values are not evaluated."""
+    new_node = DataDict(core=core)
+    dict.update(new_node, dict.items(node))
+    return new_node
+
+
+def needs_evaluation(value) -> bool:
+    """Whether `recursively_evaluate_lazy_format` has to go through `value`.
+
+    Data dicts are returned as they are, their values are evaluated on
+    access, data lists only when they hold values to evaluate.
+    """
+    cls = type(value)
+    if cls is DataList:
+        return value.__meta__.lazy
+    if cls in _EVALUATED_TYPES:
+        return False
+    return is_lazy(value) or isinstance(value, list) or cls is dict
+
+
+def track_lazy(node: DataList, values):
+    """Set `node.__meta__.lazy` if any of the `values` added to it needs
+    evaluation."""
+    # __meta__ is not set yet while unpickling
+    meta = node.__dict__.get("__meta__")
+    if meta is not None and not meta.lazy:
+        meta.lazy = any(map(needs_evaluation, values))
+
+
 def convert_containers(data: dict | list | DataNode, iter, core):
     for key, value in iter:
         if isinstance(value, dict) and not isinstance(value, DataDict):
@@ -717,6 +955,30 @@ def convert_containers(data: dict | list | DataNode, iter, core):
             data[key] = DataList(value, core=core)
 
 
+def freeze_node(value, settings):
+    """Evaluate all Lazy values in `value` and return a read-only copy
+    built from FrozenDataDict and FrozenDataList nodes."""
+    if is_lazy(value):
+        value = recursively_evaluate_lazy_format(value, settings)
+    if isinstance(value, (FrozenDataDict, FrozenDataList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDataDict(
+            {k: freeze_node(v, settings) for k, v in dict.items(value)}
+        )
+    if isinstance(value, list):
+        return FrozenDataList(
+            [freeze_node(item, settings) for item in list.__iter__(value)]
+        )
+    return value
+
+
+# never traversed by `recursively_evaluate_lazy_format`
+_EVALUATED_TYPES = frozenset(
+    (str, int, float, bool, type(None))
+    + (DataDict, FrozenDataDict, FrozenDataList)
+)
+
 _eval_stack_ctx = contextvars.ContextVar("_eval_stack_ctx", default=None)
 
 
@@ -731,6 +993,13 @@ def recursively_evaluate_lazy_format(value, settings):
     Uses contextvars for context-local storage, ensuring proper isolation
     in both threaded and async (asyncio) environments.
     """
+    cls = type(value)
+    if cls in _EVALUATED_TYPES:
+        return value
+    if cls is DataList and not value.__meta__.lazy:
+        # nothing to evaluate, the node is returned as it is
+        return value
+
     if is_lazy(value):
         # Use context-local storage for the evaluation stack
         eval_stack = _eval_stack_ctx.get()
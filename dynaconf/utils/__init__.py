@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import datetime
 import json
 import os
 import warnings
@@ -73,10 +75,7 @@ def object_merge(
             unique = True
 
         if list_merge == "merge" or unique:
-            for item in old[::-1]:
-                if unique and item in new:
-                    continue
-                new.insert(0, item)
+            _merge_list(old, new, unique)
         elif list_merge == "deep" and len(full_path) > 0:  # element-wise merge
             new.extend([[]] * max(len(old) - len(new), 0))
             for ii, item in enumerate(old):
@@ -95,66 +94,140 @@ def object_merge(
                         )
 
     if isinstance(old, dict) and isinstance(new, dict):
-        existing_value = recursive_get(old, full_path)  # doesn't handle None
-        # Need to make every `None` on `_store` to be an wrapped `LazyNone`
-
-        # data coming from source, in `new` can be mix case: KEY4|key4|Key4
-        # data existing on `old` object has the correct case: key4|KEY4|Key4
-        # So we need to ensure that new keys matches the existing keys
-        for new_key in tuple(new.keys()):
-            correct_case_key = find_the_correct_casing(
-                new_key, tuple(old.keys())
-            )
-            if correct_case_key:
-                new[correct_case_key] = new.pop(new_key)
-
-        def safe_items(data):
-            """
-            Get items from DataDict without triggering recursive evaluation
-            """
-            if data.__class__.__name__ == "DataDict":
-                return data.items(bypass_eval=True)
-            else:
-                return data.items()
-
-        # local mark may set dynaconf_merge=False
-        should_merge = new.pop("dynaconf_merge", True)
-        if should_merge:
-            for old_key, value in safe_items(old):
-                # This is for when the dict exists internally
-                # but the new value on the end of full path is the same
-                if (
-                    existing_value is not None
-                    and len(full_path) == 1
-                    and old_key.lower() == full_path[-1].lower()
-                    and existing_value is value
-                ):
-                    # Here Be The Dragons
-                    # This comparison needs to be smarter
-                    continue
-
-                if old_key not in new:
-                    new[old_key] = value
-                else:
-                    new[old_key] = object_merge(
-                        value,
-                        new[old_key],
-                        full_path=full_path[1:] if full_path else None,
-                        list_merge=list_merge,
-                    )
-
-            # Restore old key order: keys that exist in old keep old's
-            # relative order; keys that are new-only come last.
-            old_keys = list(safe_items(old))
-            old_key_set = {k for k, _ in old_keys}
-            new_only = [k for k in new if k not in old_key_set]
-            ordered = [k for k, _ in old_keys if k in new] + new_only
-            for k in ordered:
-                new[k] = new.pop(k)
+        _merge_dict(old, new, full_path, list_merge)
+
+    return new
+
+
+class _ItemSet:
+    """Membership of list items, hashed when possible.
+
+    Unhashable items fall back to comparing with every item, as `in` does
+    on a list.
+    """
+
+    def __init__(self, items: list):
+        self.items = list(items)
+        self.hashed: set = set()
+        self.unhashable = False
+        for item in self.items:
+            self._index(item)
+
+    def _index(self, item: Any):
+        try:
+            self.hashed.add(item)
+        except TypeError:
+            self.unhashable = True
+
+    def __contains__(self, item: Any) -> bool:
+        if not self.unhashable:
+            try:
+                return item in self.hashed
+            except TypeError:
+                pass
+        return item in self.items
+
+    def add(self, item: Any):
+        self.items.append(item)
+        self._index(item)
+
+
+def _merge_list(old: list, new: list, unique: bool = False) -> None:
+    """Put the items of `old` in front of `new`.
+
+    When `unique` the items already in `new` are skipped and only the last
+    occurrence of repeated items of `old` is kept.
+    """
+    if not unique:
+        new[:0] = old[:]
+        return
+    seen = _ItemSet(new)
+    items = []
+    for item in old[::-1]:
+        if item not in seen:
+            seen.add(item)
+            items.append(item)
+    items.reverse()
+    new[:0] = items
+
+
+def _merge_dict(
+    old: dict,
+    new: dict,
+    full_path: list[str],
+    list_merge: ListMergeOptions,
+) -> None:
+    """Merge the dict `old` into `new`, see `object_merge`.
 
+    The merged items are built in a single pass, keys of `old` keep their
+    order followed by the keys only in `new`, and the metavalues of each
+    key are handled as the key is merged.
+    """
+    existing_value = recursive_get(old, full_path)  # doesn't handle None
+    # Need to make every `None` on `_store` to be an wrapped `LazyNone`
+
+    # data coming from source, in `new` can be mix case: KEY4|key4|Key4
+    # data existing on `old` object has the correct case: key4|KEY4|Key4
+    # So we need to ensure that new keys matches the existing keys
+    old_casing = None
+    for new_key in tuple(new.keys()):
+        if not isinstance(new_key, str) or dict.__contains__(old, new_key):
+            continue
+        if old_casing is None:
+            old_casing = get_casing_index(old)
+        correct_case_key = old_casing.get(new_key.lower())
+        if correct_case_key is not None:
+            new[correct_case_key] = new.pop(new_key)
+
+    # local mark may set dynaconf_merge=False
+    should_merge = new.pop("dynaconf_merge", True)
+    if not should_merge:
         handle_metavalues(old, new, list_merge=list_merge)
+        return
 
-    return new
+    merged = {}
+    deleted = set()
+    # raw values, DataDict values are not evaluated
+    for old_key, value in list(dict.items(old)):
+        in_new = dict.__contains__(new, old_key)
+        # This is for when the dict exists internally
+        # but the new value on the end of full path is the same
+        if (
+            existing_value is not None
+            and len(full_path) == 1
+            and old_key.lower() == full_path[-1].lower()
+            and existing_value is value
+        ):
+            # Here Be The Dragons
+            # This comparison needs to be smarter
+            if not in_new:
+                continue
+            value = dict.__getitem__(new, old_key)
+        elif in_new:
+            value = object_merge(
+                value,
+                new[old_key],
+                full_path=full_path[1:] if full_path else None,
+                list_merge=list_merge,
+            )
+        value = _handle_metavalue(old, old_key, value, list_merge)
+        if value is missing:
+            deleted.add(old_key)
+        else:
+            merged[old_key] = value
+
+    # keys only in `new` come last
+    for key, value in dict.items(new):
+        if key not in merged and key not in deleted:
+            value = _handle_metavalue(old, key, value, list_merge)
+            if value is not missing:
+                merged[key] = value
+
+    for key in deleted:
+        # a Del on `new` triggers deletion of existing data
+        old.pop(key, None)
+    new.clear()
+    new.update(merged)
 
 
 def recursive_get(
@@ -207,67 +280,192 @@ def handle_metavalues(
     """
 
     for key in list(new.keys()):
-        # MetaValue instances
-        if getattr(new[key], "_dynaconf_reset", False):  # pragma: no cover
-            # a Reset on `new` triggers reasign of existing data
-            new[key] = new[key].unwrap()
-        elif getattr(new[key], "_dynaconf_del", False):
+        # raw values, reading from a DataDict would evaluate the whole value
+        value = dict.__getitem__(new, key)
+        result = _handle_metavalue(old, key, value, list_merge)
+        if result is missing:
             # a Del on `new` triggers deletion of existing data
             new.pop(key, None)
             old.pop(key, None)
-        elif getattr(new[key], "_dynaconf_merge", False):
+        elif result is not value:
+            new[key] = result
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _handle_metavalue(
+    old: DataDict | dict,
+    key: Any,
+    value: Any,
+    list_merge: ListMergeOptions = "merge",
+) -> Any:
+    """Resolve the MetaValue or merge tokens of the `value` set for `key`
+    over `old`, see `handle_metavalues`.
+
+    :return: The resolved value or `missing` when `key` must be deleted
+    """
+    if value.__class__ in _SCALAR_TYPES:
+        return value
+    # MetaValue instances, markers are class attributes and looking them
+    # up on the type never falls back to DataDict key lookups
+    marker = type(value)
+    if getattr(marker, "_meta_value", False):
+        if getattr(marker, "_dynaconf_reset", False):  # pragma: no cover
+            # a Reset on `new` triggers reasign of existing data
+            value = value.unwrap()
+        elif getattr(marker, "_dynaconf_del", False):
+            return missing
+        elif getattr(marker, "_dynaconf_merge", False):
             # a Merge on `new` triggers merge with existing data
-            new[key] = object_merge(
+            value = object_merge(
                 old.get(key),
-                new[key].unwrap(),
-                unique=new[key].unique,
+                value.unwrap(),
+                unique=value.unique,
             )
-        elif getattr(new[key], "_dynaconf_insert", False):
+        elif getattr(marker, "_dynaconf_insert", False):
             # Insert on `new` triggers insert with existing data
             # if existing is a list it inserts at specified .index
             # if existing is not a list it creates a new list with the value
             existing = old.get(key)  # keep the same reference
             if isinstance(existing, list):  # perform insert on it
-                existing.insert(new[key].index, new[key].unwrap())
-                new[key] = existing
+                existing.insert(value.index, value.unwrap())
+                value = existing
             else:
-                new[key] = [new[key].unwrap()]
-
-        # Data structures containing merge tokens
-        if isinstance(new.get(key), (list, tuple)):
-            has_merge = "dynaconf_merge" in new[key]
-            has_merge_unique = "dynaconf_merge_unique" in new[key]
-            if has_merge or has_merge_unique:
-                value = list(new[key])
-                unique = False
-
-                try:
-                    value.remove("dynaconf_merge")
-                except ValueError:
-                    value.remove("dynaconf_merge_unique")
-                    unique = True
-
-                for item in (old.get(key) or [])[::-1]:
-                    if unique and item in value:
-                        continue
-                    value.insert(0, item)
-
-                new[key] = value
-
-        elif isinstance(new.get(key), dict):
-            local_merge = new[key].pop(
-                "dynaconf_merge", new[key].pop("dynaconf_merge_unique", None)
+                value = [value.unwrap()]
+
+    # Data structures containing merge tokens
+    if isinstance(value, (list, tuple)):
+        has_merge = "dynaconf_merge" in value
+        has_merge_unique = "dynaconf_merge_unique" in value
+        if has_merge or has_merge_unique:
+            value = list(value)
+            unique = False
+
+            try:
+                value.remove("dynaconf_merge")
+            except ValueError:
+                value.remove("dynaconf_merge_unique")
+                unique = True
+
+            _merge_list(old.get(key) or [], value, unique)
+
+    elif isinstance(value, dict):
+        local_merge = None
+        if dict.__contains__(value, "dynaconf_merge") or dict.__contains__(
+            value, "dynaconf_merge_unique"
+        ):
+            local_merge = value.pop(
+                "dynaconf_merge", value.pop("dynaconf_merge_unique", None)
             )
-            if local_merge not in (True, False, None) and not new[key]:
-                # In case `dynaconf_merge:` holds value not boolean - ref #241
-                new[key] = local_merge
+        if local_merge not in (True, False, None) and not value:
+            # In case `dynaconf_merge:` holds value not boolean - ref #241
+            value = local_merge
 
-            if local_merge:
-                new[key] = object_merge(
-                    old.get(key), new[key], list_merge=list_merge
-                )
-            elif key not in old:
-                _strip_merge_tokens(new[key])
+        if local_merge:
+            value = object_merge(old.get(key), value, list_merge=list_merge)
+        elif key not in old:
+            _strip_merge_tokens(value)
+
+    return value
+
+
+@lru_cache
+def parse_history_mode(mode: Any) -> tuple[str, int | None]:
+    """Parse a `HISTORY_MODE_FOR_DYNACONF` value into (mode, ring size).
+
+    >>> parse_history_mode("ring:10")
+    ('ring', 10)
+    """
+    if mode is None or mode is True:
+        return "full", None
+    if mode is False:
+        return "off", None
+    name, _, size = str(mode).strip().lower().partition(":")
+    if name in ("full", "keys", "off") and not size:
+        return name, None
+    if name == "ring" and size.strip().isdigit() and int(size) > 0:
+        return name, int(size)
+    raise ValueError(
+        f"Invalid history mode {mode!r}, "
+        "expected 'full', 'keys', 'ring:<size>' or 'off'"
+    )
+
+
+class LoadingHistory(dict):
+    """Mapping of `SourceMetadata` -> data loaded by that source.
+
+    What is recorded depends on `HISTORY_MODE_FOR_DYNACONF`:
+
+    - `full`: the raw value of every key from every source
+    - `keys`: only the key names, values are recorded as `None`
+    - `ring:<size>`: like `full` for the `size` most recent sources only
+    - `off`: nothing is recorded
+    """
+
+    mode = "full"
+    size: int | None = None
+
+    def set_mode(self, mode: Any):
+        """Switch to `mode`, compacting the data recorded so far."""
+        self.mode, self.size = parse_history_mode(mode)
+        if self.mode == "off":
+            dict.clear(self)
+        elif self.mode == "keys":
+            for source, data in dict.items(self):
+                dict.__setitem__(self, source, dict.fromkeys(data))
+        elif self.mode == "ring":
+            self._trim()
+
+    @property
+    def complete(self) -> bool:
+        """Whether every source loaded so far is recorded."""
+        return self.mode in ("full", "keys")
+
+    def record(self, source: Any, key: str, value: Any):
+        """Record that `source` loaded `value` for `key`."""
+        data = dict.get(self, source)
+        if data is None:
+            self[source] = {key: value}
+            return
+        if self.mode == "off":
+            return
+        if self.mode == "keys":
+            value = None
+        elif self.mode == "ring" and next(reversed(self.keys())) != source:
+            # the most recent sources are the last ones
+            dict.__setitem__(self, source, dict.pop(self, source))
+        data[key] = value
+
+    def add_loaded(self, loaded: list, item: str):
+        """Append `item` to a list of loaded files or modules, outside of
+        the `full` mode an item loaded again is kept once."""
+        if self.mode == "full" or item not in loaded:
+            loaded.append(item)
+
+    def __setitem__(self, source: Any, data: dict):
+        if self.mode == "off":
+            return
+        if self.mode == "keys":
+            data = dict.fromkeys(data)
+        elif self.mode == "ring":
+            dict.pop(self, source, None)
+        dict.__setitem__(self, source, data)
+        self._trim()
+
+    def setdefault(self, source: Any, default: Any = None) -> Any:
+        if source not in self:
+            self[source] = default
+        return dict.get(self, source, default)
+
+    def update(self, *args, **kwargs):
+        for source, data in dict(*args, **kwargs).items():
+            self[source] = data
+
+    def _trim(self):
+        if self.size is not None:
+            while len(self) > self.size:
+                dict.__delitem__(self, next(iter(self)))
 
 
 class FakeCore:
@@ -317,7 +515,7 @@ class DynaconfDict(dict):
         self._deleted = set()
         self._store = {}
         self._env_cache = {}
-        self._loaded_by_loaders = {}
+        self._loaded_by_loaders = LoadingHistory()
         self._loaders = []
         self._defaults = {}
         self.environ = os.environ
@@ -638,6 +836,53 @@ def find_the_correct_casing(
     return None
 
 
+def build_casing_index(
+    data: dict, shared: set[str] | None = None
+) -> dict[str, Any]:
+    """Map the normalized forms of each str key in `data` to the key.
+
+    The first key (in insertion order) wins, following the same rules of
+    `find_the_correct_casing`, so a lookup is a single dict access. The
+    normalized forms of more than one key are added to `shared`.
+    """
+    index: dict[str, Any] = {}
+    for k in dict.keys(data):
+        if isinstance(k, str):
+            for casing in (k.lower(), k.replace(" ", "_").lower()):
+                if index.setdefault(casing, k) != k and shared is not None:
+                    shared.add(casing)
+    return index
+
+
+def get_casing_index(data: dict) -> dict[str, Any]:
+    """Casing index of `data`, DataDict nodes keep it on its metadata."""
+    meta = getattr(data, "__dict__", {}).get("__meta__")
+    if meta is None:
+        return build_casing_index(data)
+    index = meta.casing
+    if index is None:
+        version = meta.version
+        shared: set[str] = set()
+        index = build_casing_index(data, shared)
+        meta.casing, meta.shared_casings = index, shared
+        if meta.version != version:
+            # keys changed by another thread while building
+            meta.casing = None
+    return index
+
+
+def find_key_casing(
+    key: Any, data: dict, index: dict[str, Any] | None = None
+) -> Any:
+    """Same as `find_the_correct_casing(key, tuple(data.keys()))` served
+    from the casing `index` of `data` instead of scanning all keys."""
+    if not isinstance(key, str) or dict.__contains__(data, key):
+        return key
+    if index is None:
+        index = get_casing_index(data)
+    return index.get(key.lower())
+
+
 def prepare_json(data: Any) -> Any:
     """Takes a data dict and transforms unserializable values to str for JSON.
     {1: PosixPath("/foo")} -> {"1": "/foo"}
@@ -667,6 +912,37 @@ def to_dict(obj: Any) -> Any:
     return obj
 
 
+_IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    type(None),
+    datetime.date,
+    datetime.time,
+)
+
+
+def copy_tree(data: Any) -> Any:
+    """Copy a parsed data tree, e.g the output of `tomllib.load`.
+
+    Plain dicts, lists and tuples are copied recursively and immutable
+    values are shared, which is much faster than `copy.deepcopy`. Any other
+    object is deep copied.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return {k: copy_tree(v) for k, v in data.items()}
+    if data_type is list:
+        return [copy_tree(v) for v in data]
+    if data_type is tuple:
+        return tuple(copy_tree(v) for v in data)
+    if isinstance(data, _IMMUTABLE_TYPES):
+        return data
+    return copy.deepcopy(data)
+
+
 def container_items(container: dict | list):
     if isinstance(container, dict):
         return container.items()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import inspect
 import os
 import re
 import sys
+import time
+import unicodedata
+from functools import lru_cache
 from glob import glob as python_glob
 
 from dynaconf.utils import deduplicate
@@ -35,6 +37,79 @@ def _walk_to_root(path, break_at=None):
 SEARCHTREE = []
 
 
+def _script_dir():
+    """Directory of the invoked script, the file of the outermost frame.
+
+    Walks `f_back` instead of `inspect.stack()` which builds frame records
+    and reads source lines for the whole stack.
+    """
+    frame = sys._getframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return os.path.dirname(os.path.abspath(frame.f_code.co_filename))
+
+
+@lru_cache(maxsize=128)
+def _search_tree(project_root, script_dir, work_dir):
+    search_tree = []
+    if project_root is not None:
+        search_tree.extend(_walk_to_root(project_root, break_at=work_dir))
+
+    # Path to invoked script and recursively to root with its ./config dirs
+    search_tree.extend(_walk_to_root(script_dir))
+
+    # Path to where Python interpreter was invoked and recursively to root
+    search_tree.extend(_walk_to_root(work_dir))
+
+    # Don't look the same place twice
+    return tuple(deduplicate(search_tree))
+
+
+# {dirname: (mtime_ns, names)}, a directory mtime changes when entries are
+# added or removed so a listing is valid while the mtime is the same.
+# Listings of directories modified in the last `_DIR_LISTINGS_RACY_NS` are
+# not kept as entries added within the mtime granularity would be missed.
+_DIR_LISTINGS = {}
+_DIR_LISTINGS_MAXSIZE = 512
+_DIR_LISTINGS_RACY_NS = 2_000_000_000
+
+
+def _fold(name):
+    """`name` as listed by a case and normalization insensitive filesystem,
+    e.g. on macOS or Windows."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _exists(path):
+    """`os.path.exists` answered from cached directory listings.
+
+    Names missing from the listing don't exist, a listed name is confirmed
+    with `os.path.exists` as whether it matches depends on the filesystem
+    and a dangling symlink is listed too.
+    """
+    dirname, name = os.path.split(path)
+    if not name:
+        return os.path.exists(path)
+    dirname = dirname or os.curdir
+    try:
+        mtime = os.stat(dirname).st_mtime_ns
+    except (OSError, ValueError):
+        return False
+    listing = _DIR_LISTINGS.get(dirname)
+    if listing is None or listing[0] != mtime:
+        try:
+            names = frozenset(map(_fold, os.listdir(dirname)))
+        except (OSError, ValueError):  # pragma: no cover
+            return os.path.exists(path)
+        if time.time_ns() - mtime >= _DIR_LISTINGS_RACY_NS:
+            if len(_DIR_LISTINGS) >= _DIR_LISTINGS_MAXSIZE:
+                _DIR_LISTINGS.clear()
+            _DIR_LISTINGS[dirname] = (mtime, names)
+    else:
+        names = listing[1]
+    return _fold(name) in names and os.path.exists(path)
+
+
 def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
     """Search in increasingly higher folders for the given file
     Returns path to the file if found, or an empty string otherwise.
@@ -47,6 +122,9 @@ def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
 
     For each path in the `search_tree` it will also look for an
     additional `./config` folder.
+
+    The `search_tree` and the directory listings are cached, the listings
+    are refreshed when the directory modification time changes.
     """
     # If filename is an absolute path and exists, just return it
     # if the absolute path does not exist, return empty string so
@@ -54,26 +132,17 @@ def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
     if os.path.isabs(filename):
         return filename if os.path.exists(filename) else ""
 
-    search_tree = []
     try:
         work_dir = os.getcwd()
     except FileNotFoundError:  # pragma: no cover
         return ""
     skip_files = skip_files or []
 
-    if project_root is not None:
-        search_tree.extend(_walk_to_root(project_root, break_at=work_dir))
-
-    script_dir = os.path.dirname(os.path.abspath(inspect.stack()[-1].filename))
-
-    # Path to invoked script and recursively to root with its ./config dirs
-    search_tree.extend(_walk_to_root(script_dir))
-
-    # Path to where Python interpreter was invoked and recursively to root
-    search_tree.extend(_walk_to_root(work_dir))
-
-    # Don't look the same place twice
-    search_tree = deduplicate(search_tree)
+    search_tree = _search_tree(
+        None if project_root is None else str(project_root),
+        _script_dir(),
+        work_dir,
+    )
 
     global SEARCHTREE
     SEARCHTREE[:] = search_tree
@@ -82,13 +151,23 @@ def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
         check_path = os.path.join(dirname, filename)
         if check_path in skip_files:
             continue
-        if os.path.exists(check_path):
+        if _exists(check_path):
             return check_path  # First found will return
 
     # return empty string if not found so it can still be joined in os.path
     return ""
 
 
+def file_signature(path):
+    """Returns `(mtime_ns, size)` of the file at `path` or None if the
+    file can't be accessed, used to detect changes without reading it."""
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def read_file(path, **kwargs):
     content = ""
     with open(path, **kwargs) as open_file:
@@ -142,10 +142,9 @@ def inspect_settings(
     env_filter = None  # type: ignore
     if env:
         settings = settings.from_env(env)
-        registered_envs = {
-            src_meta.env for src_meta in settings.loaded_by_loaders.keys()
-        }
-        if env.lower() not in registered_envs:
+        history = settings.loaded_by_loaders
+        registered_envs = {src_meta.env for src_meta in history.keys()}
+        if history.complete and env.lower() not in registered_envs:
             raise EnvNotFoundError(f"The requested env is not valid: {env!r}")
 
         def env_filter(src: SourceMetadata) -> bool:  # noqa: F811
@@ -248,6 +247,10 @@ def get_history(
             },
             ...
         ]
+
+    The history depends on `HISTORY_MODE_FOR_DYNACONF`, in `keys` mode the
+    values are `None` and only top level keys are filtered, in `ring` and
+    `off` modes older sources may be missing.
     """
     if filter_callable is None:
         filter_callable = lambda x: True  # noqa
@@ -258,9 +261,16 @@ def get_history(
     if key:
         obj.get(key)  # noqa
 
+    history = obj.loaded_by_loaders
+    keys_only = history.mode == "keys"
+    key_path = key
+    if key and keys_only:
+        # nested values are not recorded, look for the top level key
+        key_path = key.replace(sep, ".").split(".")[0]
+
     internal_identifiers = ["default_settings", "_root_path"]
     result = []
-    for source_metadata, data in obj.loaded_by_loaders.items():
+    for source_metadata, data in history.items():
         # filter by source_metadata
         if filter_callable(source_metadata) is False:
             continue
@@ -275,12 +285,13 @@ def get_history(
 
         # filter by key path
         try:
-            data = _get_data_by_key(data, key, sep=sep) if key else data
+            data = _get_data_by_key(data, key_path, sep=sep) if key else data
         except KeyError:
             continue  # skip: source doesn't contain the requested key
 
         # Normalize output
-        data = _ensure_serializable(data)
+        if not keys_only:
+            data = _ensure_serializable(data)
         result.append({**source_metadata._asdict(), "value": data})
 
     if key and not result:
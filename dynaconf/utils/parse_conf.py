@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import _string
+import contextvars
+import inspect
 import json
 import os
 import re
 import string
+import threading
 import warnings
+import weakref
 from contextlib import suppress
+from functools import lru_cache
 from functools import wraps
 
 from dynaconf.nodes import DataDict
 from dynaconf.nodes import recursively_evaluate_lazy_format
+from dynaconf.utils import copy_tree
 from dynaconf.utils import extract_json_objects
 from dynaconf.utils import isnamedtupleinstance
 from dynaconf.utils import multi_replace
+from dynaconf.utils import upperfy
 from dynaconf.utils.functional import empty
 from dynaconf.vendor import toml
 from dynaconf.vendor import tomllib
@@ -276,9 +284,12 @@ class Insert(MetaValue):
 
 
 class BaseFormatter:
-    def __init__(self, function, token):
+    def __init__(self, function, token, cacheable=False):
         self.function = function
         self.token = token
+        # the result depends only on the `this` and `env` reads, so it can
+        # be memoized, see `Lazy.__call__`
+        self.cacheable = cacheable
 
     def __call__(self, value, **context):
         try:
@@ -294,13 +305,22 @@ class BaseFormatter:
         return str(self.token)
 
 
+TEMPLATE_CACHE_SIZE = 1024
+"""Number of compiled `@jinja` and `@format` templates kept."""
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _jinja_template(value: str):
+    return jinja_env.from_string(value)
+
+
 def _jinja_formatter(value: str, **context) -> str:
     if jinja_env is None:  # pragma: no cover
         raise ImportError(
             "jinja2 must be installed to enable '@jinja' settings in dynaconf"
         )
     try:
-        return jinja_env.from_string(value).render(**context)
+        return _jinja_template(value).render(**context)
     except jinja2.exceptions.SecurityError:
         warnings.warn(f"Unsafe access attempt to: {value}")
         return ""
@@ -435,41 +455,310 @@ def _read_file_formatter(value, **context):
         )
 
 
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _key_to_validate(field_name: str):
+    """The (context name, key) that must exist for `field_name` or None."""
+    if not field_name.lower().startswith("this"):
+        return None
+    from dynaconf.base import _PUBLIC_PROPERTIES
+
+    field_name = field_name.replace("[", ".")
+    field_name = field_name.replace("]", "")
+    context_name, _, key = field_name.partition(".")
+    # these are accessible by the user, but are not considered setting keys
+    # e.g, settings.current_env
+    if key in _PUBLIC_PROPERTIES:
+        return None
+    return context_name, key
+
+
 class SafeFormatter(string.Formatter):
     def get_field(self, field_name, args, context):
         self._validate_key_exists(field_name, context)
         return super().get_field(field_name, args, context)
 
     def _validate_key_exists(self, field_name: str, context):
-        if not field_name.lower().startswith("this"):
-            return
-        from dynaconf.base import _PUBLIC_PROPERTIES
-
-        field_name = field_name.replace("[", ".")
-        field_name = field_name.replace("]", "")
-        context_name, _, key = field_name.partition(".")
-        # these are accessible by the user, but are not considered setting keys
-        # e.g, settings.current_env
-        if key in _PUBLIC_PROPERTIES:
+        to_validate = _key_to_validate(field_name)
+        if to_validate is None:
             return
+        context_name, key = to_validate
         # allow only existing setting keys
         if key not in context[context_name]:
             raise AttributeError(key)
 
 
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _format_template(input: str):
+    """Parse `input` into (literal text, field) pairs, a field being
+    (name, lookups, conversion, format spec, key to validate) or None.
+
+    Returns None for templates with positional or nested fields, these
+    are left to `SafeFormatter`.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(
+        input
+    ):
+        if field_name is None:
+            parts.append((literal, None))
+            continue
+        if "{" in format_spec:
+            return None
+        first, rest = _string.formatter_field_name_split(field_name)
+        if not isinstance(first, str) or not first:
+            return None
+        field = (
+            first,
+            tuple(rest),
+            conversion,
+            format_spec,
+            _key_to_validate(field_name),
+        )
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+_FORMATTER = SafeFormatter()
+
+
 def _format_formatter(input: str, **context) -> str:
-    return SafeFormatter().format(input, **context)
+    template = _format_template(input)
+    if template is None:
+        return SafeFormatter().format(input, **context)
+    result = []
+    for literal, field in template:
+        if literal:
+            result.append(literal)
+        if field is None:
+            continue
+        name, lookups, conversion, format_spec, to_validate = field
+        if to_validate is not None:
+            context_name, key = to_validate
+            # allow only existing setting keys
+            if key not in context[context_name]:
+                raise AttributeError(key)
+        obj = context[name]
+        for is_attr, lookup in lookups:
+            obj = getattr(obj, lookup) if is_attr else obj[lookup]
+        obj = _FORMATTER.convert_field(obj, conversion)
+        result.append(format(obj, format_spec))
+    return "".join(result)
 
 
 class Formatters:
     """Dynaconf builtin formatters"""
 
-    python_formatter = BaseFormatter(_format_formatter, "format")
-    jinja_formatter = BaseFormatter(_jinja_formatter, "jinja")
-    get_formatter = BaseFormatter(_get_formatter, "get")
+    python_formatter = BaseFormatter(_format_formatter, "format", True)
+    jinja_formatter = BaseFormatter(_jinja_formatter, "jinja", True)
+    get_formatter = BaseFormatter(_get_formatter, "get", True)
     read_file_formatter = BaseFormatter(_read_file_formatter, "read_file")
 
 
+_lazy_deps_ctx = contextvars.ContextVar("_lazy_deps_ctx", default=None)
+
+
+class LazyDeps:
+    """The settings keys and environment variables a Lazy value read.
+
+    `tracked` is False when the value read something else, e.g a property
+    of the settings or a fresh var, its result is then never memoized.
+    """
+
+    __slots__ = ("keys", "environ", "tracked")
+
+    def __init__(self):
+        self.keys = set()
+        self.environ = {}
+        self.tracked = True
+
+    def add_key(self, settings, key):
+        """Record `key` read from `settings`, dotted keys by their top key."""
+        if not self.tracked:
+            return
+        if not isinstance(key, str):
+            self.tracked = False
+            return
+        core = settings.__core__
+        nested_sep = getattr(settings, "NESTED_SEPARATOR_FOR_DYNACONF", None)
+        if nested_sep and nested_sep in key:
+            key = key.replace(nested_sep, ".")
+        top_key = upperfy(key.partition(".")[0])
+        self.keys.add(top_key)
+        self.keys.add(upperfy(key))
+        config = core.config
+        if config.fresh or top_key in config.fresh_vars:
+            self.tracked = False
+        elif top_key not in core.store and getattr(
+            settings, "SYSENV_FALLBACK_FOR_DYNACONF", None
+        ):
+            # a missing key may be read from os.environ by `Settings.get`
+            self.tracked = False
+
+    def add_attribute(self, settings, name):
+        """Record an attribute or item read, anything but a settings key,
+        e.g. a property as `current_env`, is not tracked."""
+        if not isinstance(name, str):
+            self.tracked = False
+            return
+        nested_sep = getattr(settings, "NESTED_SEPARATOR_FOR_DYNACONF", None)
+        top_key = name
+        if nested_sep and nested_sep in top_key:
+            top_key = top_key.replace(nested_sep, ".")
+        if upperfy(top_key.partition(".")[0]) in settings.__core__.store:
+            self.add_key(settings, name)
+        else:
+            self.tracked = False
+
+    def update(self, other):
+        self.keys |= other.keys
+        self.environ.update(other.environ)
+        self.tracked = self.tracked and other.tracked
+
+
+class _TrackedSettings:
+    """The `this` of a Lazy value, records the keys it reads."""
+
+    __slots__ = ("_settings", "_deps")
+
+    def __init__(self, settings, deps):
+        self._settings = settings
+        self._deps = deps
+
+    def __getattr__(self, name):
+        value = getattr(self._settings, name)
+        self._deps.add_attribute(self._settings, name)
+        return value
+
+    def __getitem__(self, key):
+        self._deps.add_attribute(self._settings, key)
+        return self._settings[key]
+
+    def __contains__(self, key):
+        self._deps.add_attribute(self._settings, key)
+        return key in self._settings
+
+    def __iter__(self):
+        self._deps.tracked = False
+        return iter(self._settings)
+
+    def __str__(self):
+        self._deps.tracked = False
+        return str(self._settings)
+
+    def __repr__(self):
+        self._deps.tracked = False
+        return repr(self._settings)
+
+    def get(self, key, *args, **kwargs):
+        if kwargs.get("fresh"):
+            self._deps.tracked = False
+        self._deps.add_key(self._settings, key)
+        return self._settings.get(key, *args, **kwargs)
+
+
+class _TrackedEnviron:
+    """The `env` of a Lazy value, records the variables it reads."""
+
+    __slots__ = ("_environ", "_deps")
+
+    def __init__(self, environ, deps):
+        self._environ = environ
+        self._deps = deps
+
+    def __getattr__(self, name):
+        value = getattr(self._environ, name)
+        self._deps.tracked = False
+        return value
+
+    def __getitem__(self, name):
+        value = self._environ[name]
+        self._deps.environ[name] = value
+        return value
+
+    def __contains__(self, name):
+        value = self._environ.get(name)
+        self._deps.environ[name] = value
+        return value is not None
+
+    def get(self, name, default=None):
+        value = self._environ.get(name)
+        self._deps.environ[name] = value
+        return default if value is None else value
+
+
+class LazyCache:
+    """Results of the Lazy values evaluated for a settings core.
+
+    A result is kept along with its `LazyDeps` until one of its keys is set
+    or unset, see `invalidate`, or one of the environment variables it read
+    has changed.
+    """
+
+    def __init__(self):
+        # Lazy -> (result, deps), dropped with the Lazy value
+        self.results = weakref.WeakKeyDictionary()
+        # key -> the Lazy values that read it
+        self.dependents: dict[str, weakref.WeakSet] = {}
+        # bumped on invalidation, a result computed meanwhile is not stored
+        self.epoch = 0
+        self._lock = threading.Lock()
+
+    def get(self, lazy):
+        """Return the (result, deps) of `lazy` or None."""
+        entry = self.results.get(lazy)
+        if entry is None:
+            return None
+        environ = os.environ
+        for name, value in entry[1].environ.items():
+            if environ.get(name) != value:
+                self.results.pop(lazy, None)
+                return None
+        return entry
+
+    def set(self, lazy, result, deps, epoch):
+        with self._lock:
+            if epoch != self.epoch:
+                return
+            self.results[lazy] = (result, deps)
+            dependents = self.dependents
+            for key in deps.keys:
+                lazies = dependents.get(key)
+                if lazies is None:
+                    lazies = dependents[key] = weakref.WeakSet()
+                lazies.add(lazy)
+
+    def invalidate(self, key):
+        """Drop the results that read `key`."""
+        with self._lock:
+            self.epoch += 1
+            lazies = self.dependents.pop(key, None)
+            if lazies:
+                results = self.results
+                for lazy in list(lazies):
+                    results.pop(lazy, None)
+
+
+@lru_cache
+def _is_hookable(cls):
+    """Whether `cls` runs the hooks registered on its instances, these can
+    be registered or changed at any time, see `dynaconf.hooking`."""
+    get = getattr(cls, "get", None)
+    return hasattr(cls, "_REGISTERED_HOOKS") or hasattr(
+        get, "original_function"
+    )
+
+
+def _lazy_cache_of(settings):
+    core = getattr(settings, "__core__", None)
+    if core is None or not getattr(core, "cache_enabled", False):
+        return None
+    # LazySettings keeps the settings it wraps in its `__dict__`
+    wrapped = getattr(settings, "__dict__", {}).get("_wrapped", settings)
+    if _is_hookable(type(wrapped)):
+        return None
+    return getattr(core, "lazy_cache", None)
+
+
 class Lazy:
     """Holds data to format lazily."""
 
@@ -488,16 +777,48 @@ class Lazy:
         else:
             self.formatter = BaseFormatter(formatter, "lambda")
 
-    @property
-    def context(self):
+    def context(self, settings):
         """Builds a context for formatting."""
-        return {"env": os.environ, "this": self.settings}
+        return {"env": os.environ, "this": settings}
 
     def __call__(self, settings, validator_object=None):
-        """LazyValue triggers format lazily."""
-        self.settings = settings
-        self.context["_validator_object"] = validator_object
-        result = self.formatter(self.value, **self.context)
+        """LazyValue triggers format lazily.
+
+        Nothing is stored on the instance, so the same value can be
+        evaluated concurrently for different settings. The result is
+        memoized by the `LazyCache` of the settings core when the
+        formatter is cacheable.
+        """
+        parent = _lazy_deps_ctx.get()
+        cache = _lazy_cache_of(settings) if self.formatter.cacheable else None
+        if cache is None:
+            if parent is not None:
+                parent.tracked = False
+            return self._evaluate(self.context(settings))
+
+        entry = cache.get(self)
+        if entry is not None:
+            result, deps = entry
+        else:
+            epoch = cache.epoch
+            deps = LazyDeps()
+            context = self.context(settings)
+            context["this"] = _TrackedSettings(context["this"], deps)
+            context["env"] = _TrackedEnviron(context["env"], deps)
+            token = _lazy_deps_ctx.set(deps)
+            try:
+                result = self._evaluate(context)
+            finally:
+                _lazy_deps_ctx.reset(token)
+            if deps.tracked:
+                cache.set(self, result, deps, epoch)
+        if parent is not None:
+            # the value that read this one depends on the same keys
+            parent.update(deps)
+        return result
+
+    def _evaluate(self, context):
+        result = self.formatter(self.value, **context)
         if self.casting is not None:
             result = self.casting(result)
         return result
@@ -644,45 +965,147 @@ def string_casting(value, str_func):
     )
 
 
-converters = {
-    "@str": lambda value: lazy_casting(value, str),
-    "@int": lambda value: lazy_casting(value, _safe_int_casting),
-    "@float": lambda value: lazy_casting(value, _safe_float_casting),
-    "@bool": bool_casting,
-    "@json": json_casting,
-    "@format": lambda value: Lazy(value),
-    "@jinja": lambda value: Lazy(value, formatter=Formatters.jinja_formatter),
-    # Meta Values to trigger pre-assignment actions
-    "@reset": Reset,  # @reset is DEPRECATED on v3.0.0
-    "@del": Del,
-    "@merge": Merge,
-    "@merge_unique": lambda value, box_settings: Merge(
-        value, box_settings, unique=True
-    ),
-    "@insert": Insert,
-    "@get": lambda value: Lazy(value, formatter=Formatters.get_formatter),
-    "@read_file": lambda value: Lazy(
-        value, formatter=Formatters.read_file_formatter
-    ),
-    # String utilities
-    "@upper": lambda value: string_casting(value, str.upper),
-    "@lower": lambda value: string_casting(value, str.lower),
-    "@title": lambda value: string_casting(value, str.title),
-    "@capitalize": lambda value: string_casting(value, str.capitalize),
-    "@strip": lambda value: string_casting(value, str.strip),
-    "@lstrip": lambda value: string_casting(value, str.lstrip),
-    "@rstrip": lambda value: string_casting(value, str.rstrip),
-    "@split": lambda value: string_casting(value, str.split),
-    "@casefold": lambda value: string_casting(value, str.casefold),
-    "@swapcase": lambda value: string_casting(value, str.swapcase),
-    # Special markers to be used as placeholders e.g., in prefilled forms
-    # will always return None when evaluated
-    "@note": lambda value: None,
-    "@comment": lambda value: None,
-    "@null": lambda value: None,
-    "@none": lambda value: None,
-    "@empty": lambda value: empty,
-}
+class ConvertersRegistry(dict):
+    """The converters by token, e.g `@int`.
+
+    Keeps a matcher for the combined tokens (e.g `@int @format`) and the
+    resolved callers of each token chain, both reset on every change.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset()
+
+    def _reset(self):
+        self._matcher = None
+        self._chains = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._reset()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._reset()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._reset()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._reset()
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._reset()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._reset()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._reset()
+
+    @property
+    def matcher(self):
+        """Matches a converter combined with a lazy one, e.g `@int @get`"""
+        if self._matcher is None:
+            self._matcher = re.compile(
+                f"^({'|'.join(self.keys())}) @(jinja|format|read_file|get)"
+            )
+        return self._matcher
+
+    def split(self, data):
+        """Split `data` in its converters callers, to be applied in order,
+        and the value to be converted."""
+        comb_token = self.matcher.match(data)
+        if comb_token:
+            tokens = comb_token.group(0)
+            value = data.replace(tokens, "").strip()
+        else:
+            tokens, _, value = data.partition(" ")
+        chain = self._chains.get(tokens)
+        if chain is None:
+            chain = self._chains[tokens] = tuple(
+                _converter_caller(self[key]) for key in tokens.split(" ")[::-1]
+            )
+        return chain, value
+
+
+def _converter_caller(converter):
+    """Call `converter` with `box_settings` only when it accepts it."""
+    try:
+        parameters = inspect.signature(
+            converter, follow_wrapped=False
+        ).parameters
+    except (TypeError, ValueError):  # pragma: no cover
+        return lambda value, box_settings: _call_converter(
+            converter, value, box_settings
+        )
+    if "box_settings" in parameters or any(
+        param.kind is param.VAR_KEYWORD for param in parameters.values()
+    ):
+        return lambda value, box_settings: converter(
+            value, box_settings=box_settings
+        )
+    return lambda value, box_settings: converter(value)
+
+
+def _call_converter(converter, value, box_settings):
+    try:
+        return converter(value, box_settings=box_settings)
+    except TypeError:
+        return converter(value)
+
+
+converters = ConvertersRegistry(
+    {
+        "@str": lambda value: lazy_casting(value, str),
+        "@int": lambda value: lazy_casting(value, _safe_int_casting),
+        "@float": lambda value: lazy_casting(value, _safe_float_casting),
+        "@bool": bool_casting,
+        "@json": json_casting,
+        "@format": lambda value: Lazy(value),
+        "@jinja": lambda value: Lazy(
+            value, formatter=Formatters.jinja_formatter
+        ),
+        # Meta Values to trigger pre-assignment actions
+        "@reset": Reset,  # @reset is DEPRECATED on v3.0.0
+        "@del": Del,
+        "@merge": Merge,
+        "@merge_unique": lambda value, box_settings: Merge(
+            value, box_settings, unique=True
+        ),
+        "@insert": Insert,
+        "@get": lambda value: Lazy(value, formatter=Formatters.get_formatter),
+        "@read_file": lambda value: Lazy(
+            value, formatter=Formatters.read_file_formatter
+        ),
+        # String utilities
+        "@upper": lambda value: string_casting(value, str.upper),
+        "@lower": lambda value: string_casting(value, str.lower),
+        "@title": lambda value: string_casting(value, str.title),
+        "@capitalize": lambda value: string_casting(value, str.capitalize),
+        "@strip": lambda value: string_casting(value, str.strip),
+        "@lstrip": lambda value: string_casting(value, str.lstrip),
+        "@rstrip": lambda value: string_casting(value, str.rstrip),
+        "@split": lambda value: string_casting(value, str.split),
+        "@casefold": lambda value: string_casting(value, str.casefold),
+        "@swapcase": lambda value: string_casting(value, str.swapcase),
+        # Special markers to be used as placeholders e.g., in prefilled forms
+        # will always return None when evaluated
+        "@note": lambda value: None,
+        "@comment": lambda value: None,
+        "@null": lambda value: None,
+        "@none": lambda value: None,
+        "@empty": lambda value: empty,
+    }
+)
 
 
 def apply_converter(converter_key, value, box_settings):
@@ -691,12 +1114,7 @@ def apply_converter(converter_key, value, box_settings):
 
     Lazy converters will return Lazy objects for later evaluation.
     """
-    converter = converters[converter_key]
-    try:
-        converted_value = converter(value, box_settings=box_settings)
-    except TypeError:
-        converted_value = converter(value)
-    return converted_value
+    return _call_converter(converters[converter_key], value, box_settings)
 
 
 def add_converter(converter_key, func):
@@ -715,8 +1133,49 @@ def add_converter(converter_key, func):
     )
 
 
+TOML_INTEGER = re.compile(r"[+-]?(?:0|[1-9](?:_?[0-9])*)")
+TOML_FLOAT = re.compile(
+    r"[+-]?(?:0|[1-9](?:_?[0-9])*)"
+    r"(?:\.[0-9](?:_?[0-9])*(?:[eE][+-]?[0-9](?:_?[0-9])*)?"
+    r"|[eE][+-]?[0-9](?:_?[0-9])*)"
+)
+TOML_VALUE_START = frozenset("\"'[{+-0123456789tfin")
+"""First characters of a valid TOML value, others are plain strings."""
+
+
 def parse_with_toml(data):
-    """Uses TOML syntax to parse data"""
+    """Uses TOML syntax to parse data
+
+    String results are memoized, the env vars and other raw values are
+    parsed again on every settings load and `fresh` access.
+    """
+    if not isinstance(data, str):
+        return _parse_with_toml(data)
+    value = _parse_toml_string(data)
+    if isinstance(value, (dict, list)):
+        return copy_tree(value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _parse_toml_string(data):
+    """Fast path for plain strings, booleans and decimal numbers,
+    anything else is parsed by the TOML parser."""
+    value = data.strip(" \t")
+    if not value or value[0] not in TOML_VALUE_START:
+        return data
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    if TOML_INTEGER.fullmatch(value):
+        return int(value.replace("_", ""))
+    if TOML_FLOAT.fullmatch(value):
+        return float(value.replace("_", ""))
+    return _parse_with_toml(data)
+
+
+def _parse_with_toml(data):
     try:  # try tomllib first
         try:
             return tomllib.loads(f"key={data}")["key"]
@@ -735,7 +1194,20 @@ def parse_with_toml(data):
         )
 
 
-def _parse_conf_data(data, tomlfy=False, box_settings=None):
+def auto_cast_enabled(box_settings, auto_cast=empty):
+    """Whether converter tokens are parsed, `auto_cast` when resolved."""
+    if auto_cast is not empty:
+        return auto_cast
+    castenabled = box_settings.get("AUTO_CAST_FOR_DYNACONF", empty)
+    if castenabled is empty:
+        castenabled = (
+            os.environ.get("AUTO_CAST_FOR_DYNACONF", "true").lower()
+            not in false_values
+        )
+    return castenabled
+
+
+def _parse_conf_data(data, tomlfy=False, box_settings=None, auto_cast=empty):
     """
     @int @bool @float @json (for lists and dicts)
     strings does not need converters
@@ -750,36 +1222,16 @@ def _parse_conf_data(data, tomlfy=False, box_settings=None):
     # not enforced to not break backwards compatibility with custom loaders
     box_settings = box_settings or {}
 
-    castenabled = box_settings.get("AUTO_CAST_FOR_DYNACONF", empty)
-    if castenabled is empty:
-        castenabled = (
-            os.environ.get("AUTO_CAST_FOR_DYNACONF", "true").lower()
-            not in false_values
-        )
-
     if (
-        castenabled
-        and data
+        data
         and isinstance(data, str)
         and data.partition(" ")[0] in converters
+        and auto_cast_enabled(box_settings, auto_cast)
     ):
-        # Check combination token is used
-        comb_token = re.match(
-            f"^({'|'.join(converters.keys())}) @(jinja|format|read_file|get)",
-            data,
-        )
-        if comb_token:
-            tokens = comb_token.group(0)
-            converter_key_list = tokens.split(" ")
-            value = data.replace(tokens, "").strip()
-        else:
-            parts = data.partition(" ")
-            converter_key_list = [parts[0]]
-            value = parts[-1]
-
+        chain, value = converters.split(data)
         # Parse the converters iteratively
-        for converter_key in converter_key_list[::-1]:
-            value = apply_converter(converter_key, value, box_settings)
+        for converter in chain:
+            value = converter(value, box_settings)
     else:
         value = parse_with_toml(data) if tomlfy else data
 
@@ -789,11 +1241,15 @@ def _parse_conf_data(data, tomlfy=False, box_settings=None):
     return value
 
 
-def parse_conf_data(data, tomlfy=False, box_settings=None, tomlfy_filter=None):
+def parse_conf_data(
+    data, tomlfy=False, box_settings=None, tomlfy_filter=None, auto_cast=empty
+):
     """
     Apply parsing tokens recursively and return transformed data.
 
     Strings with lazy parser (e.g, @format) will become Lazy objects.
+    `auto_cast` defaults to the `AUTO_CAST_FOR_DYNACONF` setting, it is
+    resolved once for all the items of a data structure.
     """
 
     def in_tomlfy_filter(key):
@@ -815,6 +1271,9 @@ def parse_conf_data(data, tomlfy=False, box_settings=None, tomlfy_filter=None):
     # not enforced to not break backwards compatibility with custom loaders
     box_settings = box_settings or {}
 
+    if auto_cast is empty and isinstance(data, (tuple, list, dict)):
+        auto_cast = auto_cast_enabled(box_settings)
+
     if isinstance(data, (tuple, list)):
         # recursively parse each sequence item
         return [
@@ -823,6 +1282,7 @@ def parse_conf_data(data, tomlfy=False, box_settings=None, tomlfy_filter=None):
                 tomlfy=tomlfy,
                 box_settings=box_settings,
                 tomlfy_filter=tomlfy_filter,
+                auto_cast=auto_cast,
             )
             for item in data
         ]
@@ -837,6 +1297,7 @@ def parse_conf_data(data, tomlfy=False, box_settings=None, tomlfy_filter=None):
                 tomlfy=tomlfy,
                 box_settings=box_settings,
                 tomlfy_filter=tomlfy_filter,
+                auto_cast=auto_cast,
             )
         return data
 
@@ -851,11 +1312,14 @@ def parse_conf_data(data, tomlfy=False, box_settings=None, tomlfy_filter=None):
                 tomlfy=should_tomlfy,
                 box_settings=box_settings,
                 tomlfy_filter=tomlfy_filter,
+                auto_cast=auto_cast,
             )
         return data
 
     # return parsed string value
-    return _parse_conf_data(data, tomlfy=tomlfy, box_settings=box_settings)
+    return _parse_conf_data(
+        data, tomlfy=tomlfy, box_settings=box_settings, auto_cast=auto_cast
+    )
 
 
 def unparse_conf_data(value):
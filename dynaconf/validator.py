@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import re
+import time
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from copy import deepcopy
 from itertools import chain
 from types import MappingProxyType
 from typing import Any
 from typing import get_args
+from typing import NamedTuple
 from typing import TYPE_CHECKING
 
 from dynaconf import validator_conditions
 from dynaconf.utils import ensure_a_list
+from dynaconf.utils import upperfy
 from dynaconf.utils.functional import empty
 from dynaconf.utils.parse_conf import Lazy
 
@@ -346,13 +351,16 @@ class Validator:
         ):
             env = current_env
 
+        only = tuple(ensure_a_list(only))
+        exclude = tuple(ensure_a_list(exclude))
+
         for name in self.names:
             # Skip if only is set and name isn't in the only list
-            if only and not any(name.startswith(sub) for sub in only):
+            if only and not name.startswith(only):
                 continue
 
             # Skip if exclude is set and name is in the exclude list
-            if exclude and any(name.startswith(sub) for sub in exclude):
+            if exclude and name.startswith(exclude):
                 continue
 
             if self.default is not empty:
@@ -435,23 +443,11 @@ class Validator:
                 # settings is a dict
                 settings[name] = value
 
-            # reorder passed operations so type check is made first
-            sorted_operations = sorted(
-                self.operations.items(),
-                key=lambda item: item[0] != "is_type_of",
-            )
-            for op_name, op_value in sorted_operations:
-                op_function = getattr(validator_conditions, op_name)
+            for op_name, op_function, op_value in self._operations_plan():
                 op_succeeded = False
 
                 # 'is_type_of' special error handling - related to #879
                 if op_name == "is_type_of":
-                    # auto transform quoted types
-                    if isinstance(op_value, str):
-                        op_value = __builtins__.get(  # type: ignore
-                            op_value, op_value
-                        )
-
                     # invalid type (not in __builtins__) may raise TypeError
                     try:
                         op_succeeded = op_function(value, op_value)
@@ -494,6 +490,29 @@ class Validator:
             # Type is list or dict and has internal validators
             self._validate_internal_items(value, name, variable_path)
 
+    def _operations_plan(self) -> tuple[tuple[str, Callable, Any], ...]:
+        """`(op_name, op_function, op_value)` for each operation, the type
+        check first, resolved again only when `operations` change."""
+        items = tuple(self.operations.items())
+        planned = self.__dict__.get("_planned")
+        if planned is not None and planned[0] == items:
+            return planned[1]
+
+        plan = []
+        # reorder passed operations so type check is made first
+        for op_name, op_value in sorted(
+            items, key=lambda item: item[0] != "is_type_of"
+        ):
+            # auto transform quoted types
+            if op_name == "is_type_of" and isinstance(op_value, str):
+                op_value = __builtins__.get(  # type: ignore
+                    op_value, op_value
+                )
+            op_function = getattr(validator_conditions, op_name)
+            plan.append((op_name, op_function, op_value))
+        self._planned = (items, tuple(plan))
+        return self._planned[1]
+
     def _validate_internal_items(
         self,
         value: Any,
@@ -504,6 +523,14 @@ class Validator:
         variable_path = variable_path or tuple()
         variable_path += (name,)
         if isinstance(value, list):
+            # avoid mutating a reusable validator, copied once for all items
+            items_validators = []
+            for validator in self.items_validators:
+                if not validator.names:
+                    validator = deepcopy(validator)
+                    validator.names = ("<item>",)
+                items_validators.append(validator)
+
             for i, item in enumerate(value):
                 _item_path = tuple(variable_path)
                 if isinstance(item, dict):
@@ -515,14 +542,7 @@ class Validator:
                     _validator_location = ".".join(_item_path)
                     data = {"<item>": item}
 
-                for validator in self.items_validators:
-                    # avoid mutating a reusable validator
-                    if not validator.names:
-                        _validator = deepcopy(validator)
-                        _validator.names = ("<item>",)
-                    else:
-                        _validator = validator
-
+                for _validator in items_validators:
                     for k, v in _validator.default_messages.items():
                         _validator.messages[k] = v.replace(
                             "{name}", _validator_location
@@ -652,6 +672,41 @@ class AndValidator(CombinedValidator):
             raise ValidationError(_message, details=[(self, _message)])
 
 
+class EnvValidation(NamedTuple):
+    """The result of validating an env, see `ValidatorList.validate_envs`."""
+
+    env: str
+    errors: list[ValidationError]
+    seconds: float
+
+
+_KEY_SEPARATORS = re.compile(r"[.\[]")
+
+
+def _validator_keys(
+    validator: Validator, nested_sep: str | None = None
+) -> set[str]:
+    """The top level keys read by `validator`, including the keys of its
+    `when` and, for combined validators, of the validators it combines.
+
+    Names are normalized as `Settings.get` does, `FOO__bar` reads `FOO`.
+    """
+    if isinstance(validator, CombinedValidator):
+        return set().union(
+            *(_validator_keys(v, nested_sep) for v in validator.validators)
+        )
+    keys = set()
+    for name in validator.names:
+        if not isinstance(name, str):
+            continue
+        if nested_sep and nested_sep in name:
+            name = name.replace(nested_sep, ".")
+        keys.add(upperfy(_KEY_SEPARATORS.split(name, 1)[0]))
+    if validator.when is not None:
+        keys |= _validator_keys(validator.when, nested_sep)
+    return keys
+
+
 class ValidatorList(list):
     def __init__(
         self,
@@ -666,6 +721,12 @@ class ValidatorList(list):
         self._exclude = kwargs.pop("validate_exclude", None)
         super().__init__(args, **kwargs)  # type: ignore
         self.settings = settings
+        # top level key -> validators reading it, see `validate_changed`
+        self._index: dict[str, list[Validator]] = {}
+        self._indexed: tuple = ()
+        # all the validators in `_indexed` passed with the unchanged keys
+        self._validated = False
+        self._changed: set[str] = set()
 
     def register(self, *args: Validator, **kwargs: Validator):
         validators: list[Validator] = list(
@@ -694,6 +755,71 @@ class ValidatorList(list):
                     )
         return descriptions
 
+    def changed(self, key: str) -> None:
+        """Mark the top level `key` as changed, see `validate_changed`."""
+        self._changed.add(key)
+
+    def _key_index(self) -> dict[str, list[Validator]]:
+        """`{top level key: validators reading it}`, built again when
+        validators are added, removed or reordered."""
+        nested_sep = self.settings.get("NESTED_SEPARATOR_FOR_DYNACONF")
+        indexed = (nested_sep, *map(id, self))
+        if indexed != self._indexed:
+            index = defaultdict(list)
+            for validator in self:
+                for key in _validator_keys(validator, nested_sep):
+                    index[key].append(validator)
+            self._index = dict(index)
+            # the index keeps the validators alive, so ids are not reused
+            self._indexed = indexed
+            self._validated = False
+        return self._index
+
+    def _passed(self) -> None:
+        """Record that all the validators passed, values set by them
+        included."""
+        self._key_index()
+        self._validated = True
+        self._changed.clear()
+
+    def validate_changed(self, validate_all: bool = False) -> None:
+        """Run only the validators reading the keys changed since the last
+        validation, all of them if any was never run since added.
+
+        :param validate_all: Collect all the errors, see `validate_all`
+        """
+        index = self._key_index()
+        if not self._validated:
+            if validate_all:
+                self.validate_all()
+            else:
+                self.validate()
+            return
+
+        selected = {
+            id(validator)
+            for key in set(self._changed)
+            for validator in index.get(key, ())
+        }
+        errors = []
+        details = []
+        for validator in self:
+            if id(validator) not in selected:
+                continue
+            try:
+                validator.validate(self.settings)
+            except ValidationError as e:
+                if not validate_all:
+                    raise
+                errors.append(e)
+                details.append((validator, str(e)))
+
+        if errors:
+            raise ValidationError(
+                "; ".join(str(e) for e in errors), details=details
+            )
+        self._passed()
+
     def validate(
         self,
         only: str | Sequence | None = None,
@@ -707,6 +833,8 @@ class ValidatorList(list):
                 exclude=exclude,
                 only_current_env=only_current_env,
             )
+        if not (only or exclude or only_current_env):
+            self._passed()
 
     def validate_all(
         self,
@@ -730,8 +858,95 @@ class ValidatorList(list):
                 details.append((validator, str(e)))
                 continue
 
+        if not (errors or only or exclude or only_current_env):
+            self._passed()
         if errors and raise_error:
             raise ValidationError(
                 "; ".join(str(e) for e in errors), details=details
             )
         return errors
+
+    def validate_envs(
+        self,
+        envs: str | list[str] | None = None,
+        max_workers: int | None = None,
+        raise_error: bool = True,
+    ) -> list[EnvValidation]:
+        """Validate each env with the validators that apply to it, the envs
+        are validated concurrently in a thread pool.
+
+        Validators apply to the envs in their `env`, the ones without `env`
+        to the current env. The env views are loaded with `from_env`, so each
+        settings file is parsed once for all the envs. Errors are collected
+        as `validate_all` does.
+
+        :param envs: The envs to validate, all the envs of the validators
+                     and the current env by default
+        :param max_workers: The size of the thread pool
+        :param raise_error: Raise a ValidationError with all the errors
+        :return: An `EnvValidation` with the errors and the time taken for
+                 each env, in the order of `envs`
+        """
+        current_env = self.settings.current_env
+        validators_by_env: dict[str, tuple[str, list[Validator]]] = {}
+        for validator in self:
+            for env in validator.envs or [current_env]:
+                validators_by_env.setdefault(env.upper(), (env, []))
+                validators_by_env[env.upper()][1].append(validator)
+
+        if envs is None:
+            tasks = list(validators_by_env.values())
+        else:
+            env_list: list[str] = ensure_a_list(envs)
+            tasks = []
+            for env in env_list:
+                no_validators: tuple[str, list[Validator]] = (env, [])
+                tasks.append(validators_by_env.get(env.upper(), no_validators))
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                results = list(executor.map(self._validate_env, *zip(*tasks)))
+        else:
+            results = [self._validate_env(*task) for task in tasks]
+
+        errors = []
+        details = []
+        validations = []
+        for validation, env_details, env_settings in results:
+            errors.extend(validation.errors)
+            details.extend(env_details)
+            # merge source metadata into original settings for history inspect
+            if env_settings is not self.settings:
+                self.settings.loaded_by_loaders.update(
+                    env_settings.loaded_by_loaders
+                )
+            validations.append(validation)
+
+        if not errors and envs is None:
+            self._passed()
+        if errors and raise_error:
+            raise ValidationError(
+                "; ".join(str(e) for e in errors), details=details
+            )
+        return validations
+
+    def _validate_env(
+        self, env: str, validators: list[Validator]
+    ) -> tuple[EnvValidation, list, Settings]:
+        """Validate `env` with `validators`, see `validate_envs`."""
+        started = time.perf_counter()
+        settings = self.settings
+        if env.upper() == settings.current_env.upper():
+            env_settings = settings
+        else:
+            env_settings = settings.from_env(env)
+
+        errors = []
+        details = []
+        for validator in validators:
+            try:
+                validator.validate(env_settings, only_current_env=True)
+            except ValidationError as e:
+                errors.append(e)
+                details.append((validator, str(e)))
+        seconds = time.perf_counter() - started
+        return EnvValidation(env, errors, seconds), details, env_settings
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import threading
+import warnings
+import weakref
+from collections.abc import Callable
+from typing import Any
+from typing import TYPE_CHECKING
+
+from dynaconf.utils import ensure_a_list
+from dynaconf.utils import missing
+from dynaconf.utils.files import file_signature
+from dynaconf.utils.files import get_local_filename
+from dynaconf.utils.files import glob
+from dynaconf.utils.files import has_magic
+from dynaconf.utils.functional import is_lazy
+
+if TYPE_CHECKING:
+    from dynaconf.base import Settings
+
+__all__ = ["SettingsWatcher"]
+
+
+class _UnchangedError(Exception):
+    """Discards a staged reload that changed no key."""
+
+
+class SettingsWatcher:
+    """Reloads a settings object when its files change.
+
+    A daemon thread polls the signature (mtime and size) of every loaded
+    file, of their `.local.` variants and of the files matching the glob
+    patterns of `settings_files`, `preload` and `includes`. Once a change
+    is detected and the files stay unchanged for `debounce` seconds, the
+    settings are reloaded on a staged copy, validated and published at once.
+    Files that didn't change are served from the parsed files cache.
+
+    When nothing changed no reload happens, and when the reload or the
+    validation fails the current settings are kept and a warning is issued.
+
+    :param settings: The settings object to watch
+    :param interval: Seconds between checks
+    :param debounce: Seconds the files must stay unchanged before reloading
+    :param callback: Called with the set of changed keys after a reload
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        callback: Callable[[set[str]], Any] | None = None,
+    ):
+        self._settings = weakref.ref(settings)
+        self.interval = interval
+        self.debounce = debounce
+        self.callback = callback
+        self.signatures = self.snapshot(settings)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> SettingsWatcher:
+        """Start watching on a daemon thread."""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dynaconf-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None):
+        """Stop watching and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not (
+            threading.current_thread()
+        ):
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self._settings() is None:  # settings were garbage collected
+                return
+            try:
+                self.check()
+            except Exception as error:
+                warnings.warn(f"Settings were not reloaded: {error!r}")
+
+    def check(self) -> set[str] | None:
+        """Reload the settings if any watched file changed.
+
+        :return: The changed keys or None when no file changed
+        """
+        settings = self._settings()
+        if settings is None:
+            return None
+        signatures = self.snapshot(settings)
+        if signatures == self.signatures:
+            return None
+        # wait for writes to settle
+        while not self._stop.wait(self.debounce):
+            current = self.snapshot(settings)
+            if current == signatures:
+                break
+            signatures = current
+
+        # files changed during the reload are picked on the next check, a
+        # broken edit is attempted once rather than on every poll
+        self.signatures = signatures
+        changed = self.reload(settings)
+        if changed and self.callback is not None:
+            self.callback(changed)
+        return changed
+
+    @staticmethod
+    def reload(settings: Settings) -> set[str]:
+        """Reload and validate `settings` on a staged copy and publish it
+        when any key changed.
+
+        :return: The changed keys
+        """
+        old_store = settings.__core__.store
+        try:
+            with settings._staging() as staged:
+                staged.reload()
+                config = staged.__core__.config
+                for validator in staged.validators:
+                    validator.validate(
+                        staged,
+                        only=config.validate_only,
+                        exclude=config.validate_exclude,
+                        only_current_env=config.validate_only_current_env,
+                    )
+                changed = changed_keys(old_store, staged.__core__.store)
+                if not changed:
+                    raise _UnchangedError
+        except _UnchangedError:
+            return set()
+        return changed
+
+    @staticmethod
+    def snapshot(settings: Settings) -> dict[str, tuple | None]:
+        """Signatures of all the files watched for `settings`."""
+        config = settings.__core__.config
+        files = set(config.file_signatures).union(config.loaded_files)
+        files.update(
+            get_local_filename(path)
+            for path in list(files)
+            if ".local." not in path
+        )
+        root_dir = str(settings._root_path or os.getcwd())
+        patterns = (
+            ensure_a_list(settings.get("SETTINGS_FILE_FOR_DYNACONF"))
+            + ensure_a_list(settings.get("PRELOAD_FOR_DYNACONF"))
+            + ensure_a_list(settings.get("DYNACONF_INCLUDE"))
+            + ensure_a_list(settings.get("INCLUDES_FOR_DYNACONF"))
+        )
+        for pattern in patterns:
+            if isinstance(pattern, str) and has_magic(pattern):
+                files.update(glob(os.path.join(root_dir, pattern)))
+        return {path: file_signature(path) for path in sorted(files)}
+
+
+def changed_keys(old: dict, new: dict) -> set[str]:
+    """First level keys added, removed or with different values."""
+    return {
+        key
+        for key in dict.keys(old) | dict.keys(new)
+        if not _same_value(
+            dict.get(old, key, missing), dict.get(new, key, missing)
+        )
+    }
+
+
+def _same_value(old, new) -> bool:
+    """Compare raw values, Lazy values are equal when defined the same."""
+    if is_lazy(old) or is_lazy(new):
+        return type(old) is type(new) and repr(old) == repr(new)
+    if isinstance(old, dict) and isinstance(new, dict):
+        return dict.keys(old) == dict.keys(new) and all(
+            _same_value(value, dict.get(new, key))
+            for key, value in dict.items(old)
+        )
+    if isinstance(old, list) and isinstance(new, list):
+        return len(old) == len(new) and all(
+            _same_value(a, b)
+            for a, b in zip(list.__iter__(old), list.__iter__(new))
+        )
+    return old == new
@@ -113,6 +113,52 @@ def run(label, baseline, scenario):
         raise click.Abort()
 
 
+@cli.command()
+@click.option(
+    "--label",
+    required=False,
+    default="default",
+    help="Label identifier for this measurement",
+)
+@click.option(
+    "--baseline",
+    is_flag=True,
+    help="Measure the baseline version of the scenario",
+)
+@click.argument("scenario", required=True)
+def memory(label, baseline, scenario):
+    """Measure memory allocated by a scenario with tracemalloc.
+
+    Outputs the KiB still allocated when the run returns (objects kept in
+    the scenario context) and the peak KiB allocated during the run.
+    """
+    import tracemalloc
+
+    if baseline and label != "default":
+        click.echo("Error: Cannot use --label with --baseline flag", err=True)
+        raise click.Abort()
+
+    if baseline:
+        label = "baseline"
+
+    scenarios = discover_scenarios()
+    _validate_scenarios(scenarios, scenario)
+    scenario_module = scenarios[scenario]
+    setup_fn = "baseline_setup" if baseline else "setup"
+    run_fn = "baseline_run" if baseline else "run"
+
+    try:
+        context = getattr(scenario_module, setup_fn)()
+        tracemalloc.start()
+        getattr(scenario_module, run_fn)(context)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _output_tsv(label, f"{current / 1024:.1f}\t{peak / 1024:.1f}")
+    except Exception as e:
+        click.echo(f"Error measuring scenario '{scenario}': {e}", err=True)
+        raise click.Abort()
+
+
 @cli.command()
 @click.argument("scenario", required=True)
 @click.option(
@@ -0,0 +1,55 @@
+"""
+Reading interpolated URLs.
+
+Each `@format` value is memoized along with the keys it read, setting an
+unrelated key keeps it, setting `BASE_URL` evaluates it again.
+"""
+
+LOOP_COUNT = 2_000
+URL_COUNT = 100
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    base_url = "https://example.com"
+    data = {
+        "services": {
+            f"service_{i}": f"{base_url}/api/{i}" for i in range(URL_COUNT)
+        }
+    }
+    return {"data": data}
+
+
+def baseline_run(context):
+    """Baseline run function - performs raw dict access."""
+    services = context["data"]["services"]
+    for i in range(LOOP_COUNT):
+        for name in services:
+            services[name]
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(
+        base_url="https://example.com",
+        services={
+            f"service_{i}": f"@format {{this.BASE_URL}}/api/{i}"
+            for i in range(URL_COUNT)
+        },
+    )
+    # Trigger setup to warm up the object
+    settings.services
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - reads every URL, setting a key every 100 loops."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        if i % 100 == 0:
+            settings.set("request_count", i)
+        services = settings.services
+        for name in services:
+            services[name]
@@ -0,0 +1,40 @@
+"""
+Case-insensitive access on a large nested dict.
+
+Django-style flat configs can hold thousands of keys. Reading them with a
+different casing than the one they were defined with goes through the
+case-insensitive lookup of the data nodes.
+"""
+
+LOOP_COUNT = 100_000
+DATA = {"common": {f"KEY_{i}": i for i in range(5_000)}}
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    data = {"common": dict(DATA["common"])}
+    return {"data": data}
+
+
+def baseline_run(context):
+    """Baseline run function - performs raw dict access."""
+    data = context["data"]
+    for i in range(LOOP_COUNT):
+        data["common"]["KEY_4999"]
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(common=dict(DATA["common"]))
+    # Trigger setup to warm up the object
+    settings.common
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - performs Dynaconf lowercase dot notation access."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        settings.common.key_4999
@@ -0,0 +1,43 @@
+"""
+Dynaconf large nested list access scenario.
+
+This scenario measures the performance of reading a large list without
+Lazy values using subscript notation (settings["key"]["subkey"]).
+"""
+
+LOOP_COUNT = 10_000
+ITEM_COUNT = 1_000
+
+
+def _data():
+    hosts = [f"host{i}.example.com" for i in range(ITEM_COUNT)]
+    return {"common": {"allowed_hosts": hosts}}
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    return {"data": _data()}
+
+
+def baseline_run(context):
+    """Baseline run function - performs raw dict access."""
+    data = context["data"]
+    for i in range(LOOP_COUNT):
+        data["common"]["allowed_hosts"]
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(**_data())
+    # Trigger setup to warm up the object
+    settings.common
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - performs Dynaconf subscript access."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        settings["common"]["allowed_hosts"]
@@ -0,0 +1,61 @@
+"""
+Serving settings views for many environments.
+
+Each `from_env` view loads the `[default]`, `[<env>]` and `[global]` layers
+of the settings file. The file is parsed once and only the layers of the
+view are copied, views are kept in a bounded cache cleared on reload.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 5
+ENV_COUNT = 24
+KEY_COUNT = 200
+
+
+def _write_settings():
+    lines = ["[default]"]
+    lines.extend(
+        f'key_{i} = {{ name = "default {i}", ports = [{i}, {i + 1}] }}'
+        for i in range(KEY_COUNT)
+    )
+    for n in range(ENV_COUNT):
+        lines.append(f"[tenant_{n}]")
+        lines.extend(
+            f'key_{i} = {{ name = "tenant {n} {i}" }}'
+            for i in range(0, KEY_COUNT, 4)
+        )
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def baseline_setup():
+    """Baseline setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def baseline_run(context):
+    """Baseline run function - loads a single env."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(settings_files=context["path"], environments=True)
+    settings.KEY_0
+
+
+def setup():
+    """Setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def run(context):
+    """Run function - reads a key from each env view, reloading between."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(settings_files=context["path"], environments=True)
+    for _ in range(LOOP_COUNT):
+        for n in range(ENV_COUNT):
+            settings.from_env(f"tenant_{n}").KEY_0
+        settings.reload()
@@ -0,0 +1,53 @@
+"""
+Merging large lists across settings layers.
+
+Allowlists are merged across several layers with `@merge_unique`, the
+items already present are found with a hash set. The baseline merges the
+lists with a plain dict.
+"""
+
+LOOP_COUNT = 5
+LAYER_COUNT = 5
+ITEM_COUNT = 10_000
+
+
+def _layers():
+    # consecutive layers share half of their items
+    step = ITEM_COUNT // 2
+    return [
+        [
+            f"host-{i}.example.com"
+            for i in range(n * step, n * step + ITEM_COUNT)
+        ]
+        for n in range(LAYER_COUNT)
+    ]
+
+
+def baseline_setup():
+    """Baseline setup function - builds the layers."""
+    return {"layers": _layers()}
+
+
+def baseline_run(context):
+    """Baseline run function - merges unique items with a dict."""
+    for i in range(LOOP_COUNT):
+        merged = {}
+        for layer in context["layers"]:
+            merged.update(dict.fromkeys(layer))
+        list(merged)
+
+
+def setup():
+    """Setup function - builds the layers."""
+    return {"layers": _layers()}
+
+
+def run(context):
+    """Run function - merges the layers with `dynaconf_merge_unique`."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf()
+        for layer in context["layers"]:
+            settings.set("ALLOWED_HOSTS", ["dynaconf_merge_unique", *layer])
+        settings.ALLOWED_HOSTS
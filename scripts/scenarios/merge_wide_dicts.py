@@ -0,0 +1,53 @@
+"""
+Merging wide dicts across settings layers.
+
+Routing tables with thousands of keys are merged across several layers,
+each merge is a single ordered pass over the keys. The baseline merges the
+same layers with `dict.update`.
+"""
+
+LOOP_COUNT = 5
+LAYER_COUNT = 5
+KEY_COUNT = 10_000
+
+
+def _layers():
+    # each layer overrides part of the routes and adds new ones
+    step = KEY_COUNT // 4
+    return [
+        {
+            f"route_{i}": {"target": f"service-{n}", "weight": i % 10}
+            for i in range(n * step, n * step + KEY_COUNT)
+        }
+        for n in range(LAYER_COUNT)
+    ]
+
+
+def baseline_setup():
+    """Baseline setup function - builds the layers."""
+    return {"layers": _layers()}
+
+
+def baseline_run(context):
+    """Baseline run function - merges the layers with dict.update."""
+    for i in range(LOOP_COUNT):
+        merged = {}
+        for layer in context["layers"]:
+            for key, value in layer.items():
+                merged.setdefault(key, {}).update(value)
+
+
+def setup():
+    """Setup function - builds the layers."""
+    return {"layers": _layers()}
+
+
+def run(context):
+    """Run function - merges the layers with `dynaconf_merge`."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf()
+        for layer in context["layers"]:
+            settings.set("ROUTES", {"dynaconf_merge": True, **layer})
+        settings.ROUTES
@@ -0,0 +1,65 @@
+"""
+Reloading settings in a long-running worker.
+
+Every load records the raw value of each key per source in
+`loaded_by_loaders`, see `HISTORY_MODE_FOR_DYNACONF`. Measure it with the
+`memory` command and export `HISTORY_MODE_FOR_DYNACONF` (full, keys,
+ring:<size> or off) to compare. The baseline records no history.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 20
+KEY_COUNT = 2_000
+ENVS = ("development", "staging", "production")
+
+
+def _write_settings():
+    lines = []
+    for env in ("default",) + ENVS:
+        lines.append(f"[{env}]")
+        lines.extend(
+            f'key_{i} = {{ name = "{env} {i}", ports = [{i}, {i + 1}] }}'
+            for i in range(KEY_COUNT)
+        )
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def _load(context, history_mode=None):
+    from dynaconf import Dynaconf
+
+    options = {"history_mode": history_mode} if history_mode else {}
+    settings = Dynaconf(
+        settings_files=context["path"], environments=True, **options
+    )
+    settings.KEY_0
+    for i in range(LOOP_COUNT):
+        settings.reload()
+        settings.from_env(ENVS[i % len(ENVS)]).KEY_0
+        settings.KEY_0
+    # keep it alive so its memory is measured as retained
+    context["settings"] = settings
+
+
+def baseline_setup():
+    """Baseline setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def baseline_run(context):
+    """Baseline run function - reloads the settings without history."""
+    _load(context, history_mode="off")
+
+
+def setup():
+    """Setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def run(context):
+    """Run function - reloads the settings and switches envs."""
+    _load(context)
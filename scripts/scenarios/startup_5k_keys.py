@@ -0,0 +1,50 @@
+"""
+Loading a settings file with 5k keys.
+
+Loaders push every key of a file through `Settings.update`, which applies
+them in a batch with the `*_FOR_DYNACONF` options resolved once. The
+baseline parses the same file and updates a plain dict.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 20
+KEY_COUNT = 5_000
+
+
+def _write_settings():
+    lines = [f'key_{i} = "value {i}"' for i in range(KEY_COUNT)]
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def baseline_setup():
+    """Baseline setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def baseline_run(context):
+    """Baseline run function - parses the file into a dict."""
+    from dynaconf.vendor import tomllib
+
+    for i in range(LOOP_COUNT):
+        data = {}
+        with open(context["path"], "rb") as settings_file:
+            data.update(tomllib.load(settings_file))
+
+
+def setup():
+    """Setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def run(context):
+    """Run function - loads the file into Dynaconf settings."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf(settings_files=context["path"])
+        settings.KEY_0
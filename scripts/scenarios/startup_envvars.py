@@ -0,0 +1,49 @@
+"""
+Loading settings from hundreds of environment variables.
+
+Containers often export hundreds of prefixed variables. Each of them is
+parsed with TOML syntax on every settings load, so plain strings and numbers
+take a fast path and the parsed values are memoized.
+"""
+
+import os
+
+LOOP_COUNT = 50
+VAR_COUNT = 300
+
+
+def _export_vars():
+    for i in range(VAR_COUNT):
+        value = (f"value {i}", str(i), f"{i}.5", "true")[i % 4]
+        os.environ[f"APP_KEY_{i}"] = value
+
+
+def baseline_setup():
+    """Baseline setup function - exports the variables."""
+    _export_vars()
+    return {}
+
+
+def baseline_run(context):
+    """Baseline run function - reads the prefixed variables."""
+    for i in range(LOOP_COUNT):
+        {
+            key[4:]: value
+            for key, value in os.environ.items()
+            if key.startswith("APP_")
+        }
+
+
+def setup():
+    """Setup function - exports the variables."""
+    _export_vars()
+    return {}
+
+
+def run(context):
+    """Run function - loads the variables into Dynaconf settings."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf(envvar_prefix="APP")
+        settings.KEY_0
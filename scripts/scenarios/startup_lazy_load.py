@@ -0,0 +1,56 @@
+"""
+Startup of a large settings file using only a few of its keys.
+
+Command line tools and short lived jobs load the whole settings file but only
+read a handful of keys. The baseline loads the same file eagerly, `run` uses
+`lazy_load=True` so only the keys that are read get merged.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 50
+KEY_COUNT = 800
+USED_KEYS = [f"KEY_{i}" for i in range(0, KEY_COUNT, KEY_COUNT // 10)]
+
+
+def _write_settings():
+    lines = []
+    for i in range(KEY_COUNT):
+        lines.append(f"[key_{i}]")
+        lines.append(f'name = "value {i}"')
+        lines.append(f"items = [{i}, {i + 1}]")
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def baseline_setup():
+    """Baseline setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def baseline_run(context):
+    """Baseline run function - loads all the keys on startup."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf(settings_files=context["path"])
+        for key in USED_KEYS:
+            settings[key]
+
+
+def setup():
+    """Setup function - writes the settings file."""
+    return {"path": _write_settings()}
+
+
+def run(context):
+    """Run function - loads only the keys that are read."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf(settings_files=context["path"], lazy_load=True)
+        for key in USED_KEYS:
+            settings[key]
@@ -0,0 +1,67 @@
+"""
+Overriding a large nested setting with environment variables.
+
+`APP_DATABASES__db_1__PORT=5433` style variables are set as dotted keys, each
+merged into the existing `DATABASES` tree. The variables sharing a top level
+key are merged into the tree and set at once.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 20
+DB_COUNT = 200
+
+
+def _write_settings():
+    lines = []
+    for i in range(DB_COUNT):
+        lines.append(f"[databases.db_{i}]")
+        lines.append(f'host = "db{i}.local"')
+        lines.append("port = 5432")
+        lines.append(f'options = {{timeout = 10, name = "db_{i}"}}')
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def _export_vars():
+    for i in range(DB_COUNT):
+        os.environ[f"APP_DATABASES__db_{i}__PORT"] = str(6000 + i)
+
+
+def baseline_setup():
+    """Baseline setup function - writes the file and exports variables."""
+    _export_vars()
+    return {"path": _write_settings()}
+
+
+def baseline_run(context):
+    """Baseline run function - parses the file and applies the overrides."""
+    from dynaconf.vendor import tomllib
+
+    for i in range(LOOP_COUNT):
+        with open(context["path"], "rb") as settings_file:
+            data = tomllib.load(settings_file)
+        for key, value in os.environ.items():
+            if key.startswith("APP_DATABASES__"):
+                _, name, field = key.split("__")
+                data["databases"][name][field.lower()] = int(value)
+
+
+def setup():
+    """Setup function - writes the file and exports variables."""
+    _export_vars()
+    return {"path": _write_settings()}
+
+
+def run(context):
+    """Run function - loads the file and the variables into Dynaconf."""
+    from dynaconf import Dynaconf
+
+    for i in range(LOOP_COUNT):
+        settings = Dynaconf(
+            settings_files=context["path"], envvar_prefix="APP"
+        )
+        settings.DATABASES
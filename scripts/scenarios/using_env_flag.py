@@ -0,0 +1,54 @@
+"""
+Checking feature flags.
+
+`flag` reads the key inside `using_env`, entering the env swaps the core
+seen by the current context only, the env is loaded on the first `flag`
+and kept until the settings change.
+"""
+
+import os
+import tempfile
+
+LOOP_COUNT = 200
+KEY_COUNT = 100
+
+
+def _write_settings():
+    lines = ["[default]"]
+    lines.extend(f"key_{i} = {i}" for i in range(KEY_COUNT))
+    lines.extend(["dashboard = false", "[premiumuser]", "dashboard = true"])
+    path = os.path.join(tempfile.mkdtemp(), "settings.toml")
+    with open(path, "w") as settings_file:
+        settings_file.write("\n".join(lines))
+    return path
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    return {"data": {"premiumuser": {"dashboard": True}}}
+
+
+def baseline_run(context):
+    """Baseline run function - performs raw dict access."""
+    data = context["data"]
+    for i in range(LOOP_COUNT):
+        data["premiumuser"]["dashboard"]
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(settings_files=_write_settings(), environments=True)
+    # Trigger setup to warm up the object
+    settings.KEY_0
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - reads the value of a key in another env."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        with settings.using_env("premiumuser"):
+            settings.DASHBOARD
+        settings.DASHBOARD
@@ -0,0 +1,56 @@
+"""
+Validating a large allowlist with `items_validators`.
+
+Every item is checked by the item validators, the operations of each
+validator are resolved once and reused for all the items.
+"""
+
+LOOP_COUNT = 5
+ITEM_COUNT = 10_000
+
+
+def _data():
+    hosts = [f"10.0.{i // 256}.{i % 256}" for i in range(ITEM_COUNT)]
+    return {"allowed_ips": hosts}
+
+
+def _is_ip(value):
+    return value.count(".") == 3
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    return {"data": _data()}
+
+
+def baseline_run(context):
+    """Baseline run function - runs the conditions on the raw list."""
+    data = context["data"]
+    for i in range(LOOP_COUNT):
+        for item in data["allowed_ips"]:
+            assert isinstance(item, str) and _is_ip(item)
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+    from dynaconf import Validator
+
+    settings = Dynaconf(**_data())
+    settings.validators.register(
+        Validator(
+            "allowed_ips",
+            must_exist=True,
+            items_validators=[Validator(is_type_of=str, condition=_is_ip)],
+        )
+    )
+    # Trigger setup to warm up the object
+    settings.allowed_ips
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - validates the allowlist."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        settings.validators.validate()
@@ -0,0 +1,46 @@
+"""
+Runtime updates with `validate_on_update`.
+
+Each update runs only the validators reading the keys it changed, the
+other validators already passed and are not run again.
+"""
+
+LOOP_COUNT = 500
+KEY_COUNT = 200
+
+
+def baseline_setup():
+    """Baseline setup function - creates raw dict for comparison."""
+    return {"data": {f"key_{i}": i for i in range(KEY_COUNT)}}
+
+
+def baseline_run(context):
+    """Baseline run function - performs raw dict updates."""
+    data = context["data"]
+    for i in range(LOOP_COUNT):
+        data[f"key_{i % KEY_COUNT}"] = i
+
+
+def setup():
+    """Setup function - creates Dynaconf settings object."""
+    from dynaconf import Dynaconf
+    from dynaconf import Validator
+
+    settings = Dynaconf(
+        validate_on_update=True,
+        validators=[
+            Validator(f"key_{i}", must_exist=True, is_type_of=int, gte=0)
+            for i in range(KEY_COUNT)
+        ],
+        **{f"key_{i}": i for i in range(KEY_COUNT)},
+    )
+    # Trigger setup to warm up the object
+    settings.key_0
+    return {"settings": settings}
+
+
+def run(context):
+    """Run function - sets a key per loop, validating on update."""
+    settings = context["settings"]
+    for i in range(LOOP_COUNT):
+        settings.set(f"key_{i % KEY_COUNT}", i)
@@ -9,6 +9,7 @@ from dynaconf import Dynaconf
 from dynaconf import LazySettings
 from dynaconf import ValidationError
 from dynaconf import Validator
+from dynaconf.base import Settings
 from dynaconf.loaders import toml_loader
 from dynaconf.loaders import yaml_loader
 from dynaconf.nodes import DataDict
@@ -352,6 +353,60 @@ def test_set(settings):
     assert settings.get("BAZ") == "bar"
 
 
+def test_update_applies_options_set_in_the_batch():
+    settings = Dynaconf()
+    settings.update(
+        {
+            "DATA.name": "dynaconf",
+            "DATA.port": 8000,
+            "AUTO_CAST_FOR_DYNACONF": False,
+            "RAW": "@int 42",
+            "NESTED_SEPARATOR_FOR_DYNACONF": "___",
+            "NESTED___KEY": 1,
+        }
+    )
+    assert settings.DATA == {"name": "dynaconf", "port": 8000}
+    assert settings.RAW == "@int 42"
+    assert settings.NESTED.KEY == 1
+
+
+def test_update_merges_dotted_keys_of_the_same_top_key():
+    data = {
+        "DATABASES__default__ENGINE": "other.module",
+        "DATABASES__default__ARGS__timeout": "@int 99",
+        "DATABASES.default.PORTS": "@merge [789]",
+        "DATABASES__replica__NAME": "replica",
+        "DATABASES.default.ARGS": "@merge retries=10",
+    }
+    initial = {
+        "default": {
+            "NAME": "db",
+            "ARGS": {"timeout": 30},
+            "PORTS": [123, 456],
+        }
+    }
+    grouped = Dynaconf(DATABASES=initial)
+    grouped.update(data, loader_identifier="env_global")
+    sequential = Dynaconf(DATABASES=initial)
+    for key, value in data.items():
+        sequential.set(key, value, loader_identifier="env_global")
+
+    assert (
+        grouped.DATABASES
+        == sequential.DATABASES
+        == {
+            "default": {
+                "NAME": "db",
+                "ENGINE": "other.module",
+                "ARGS": {"timeout": 99, "retries": 10},
+                "PORTS": [123, 456, 789],
+            },
+            "replica": {"NAME": "replica"},
+        }
+    )
+    assert grouped.loaded_by_loaders == sequential.loaded_by_loaders
+
+
 def test_global_set_merge(settings):
     settings.set("MERGE_ENABLED_FOR_DYNACONF", True)
     settings.set(
@@ -944,6 +999,58 @@ def test_dotted_get_fresh(tmpdir):
     assert settings2.get("foo.baz.qux", fresh=True) == "v1"
 
 
+def test_fresh_reads_only_sources_of_the_key(tmpdir, monkeypatch):
+    tmpdir.join("settings.toml").write('kill_switch = false\nname = "a"')
+    tmpdir.join("other.yaml").write("other: 1")
+    settings = LazySettings(
+        settings_files=["settings.toml", "other.yaml"],
+        fresh_vars=["kill_switch"],
+    )
+    assert settings.KILL_SWITCH is False
+
+    reads = []
+    original_load = toml_loader.tomllib.load
+    monkeypatch.setattr(
+        toml_loader.tomllib,
+        "load",
+        lambda *a, **kw: reads.append(1) or original_load(*a, **kw),
+    )
+    monkeypatch.setattr(
+        yaml_loader.yaml,
+        "safe_load",
+        lambda *a, **kw: pytest.fail("other.yaml must not be read"),
+    )
+
+    # unchanged file is parsed once, then served from the parsed cache
+    assert settings.KILL_SWITCH is False
+    assert settings.KILL_SWITCH is False
+    assert len(reads) == 1
+
+    # env vars are still read on every access
+    monkeypatch.setenv("DYNACONF_KILL_SWITCH", "true")
+    assert settings.KILL_SWITCH is True
+    monkeypatch.delenv("DYNACONF_KILL_SWITCH")
+    assert settings.KILL_SWITCH is False
+    assert len(reads) == 1
+
+
+def test_fresh_reloads_when_a_file_changes(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write("kill_switch = false")
+    settings = LazySettings(
+        settings_file="settings.toml", fresh_vars=["kill_switch"]
+    )
+    assert settings.KILL_SWITCH is False
+
+    settings_file.write("kill_switch = true")
+    assert settings.KILL_SWITCH is True
+    assert settings.KILL_SWITCH is True
+
+    # a new .local. file is also detected
+    tmpdir.join("settings.local.toml").write("kill_switch = false")
+    assert settings.KILL_SWITCH is False
+
+
 def test_dotted_set(settings):
     settings.set("MERGE_ENABLED_FOR_DYNACONF", False)
 
@@ -1148,6 +1255,38 @@ def test_from_env_method(clean_env, tmpdir):
     assert settings.A_DEFAULT == "From default env"
 
 
+def test_from_env_cache_is_bounded_and_cleared_on_reload(clean_env, tmpdir):
+    data = {
+        "default": {"value": "From default env"},
+        "one": {"value": "From one env"},
+        "two": {"value": "From two env"},
+        "three": {"value": "From three env"},
+    }
+    toml_path = str(tmpdir.join("settings.toml"))
+    toml_loader.write(toml_path, data, merge=False)
+    settings = LazySettings(
+        settings_file=toml_path, environments=True, env_cache_size=2
+    )
+    assert settings.VALUE == "From default env"
+
+    one = settings.from_env("one")
+    two = settings.from_env("two")
+    assert one is settings.from_env("one")
+    # the least recently used is dropped
+    assert settings.from_env("three").VALUE == "From three env"
+    assert one is settings.from_env("one")
+    assert two is not settings.from_env("two")
+
+    data["one"]["value"] = "Changed one env"
+    toml_loader.write(toml_path, data, merge=False)
+    settings.reload()
+    assert one is not settings.from_env("one")
+    assert settings.from_env("one").VALUE == "Changed one env"
+
+    settings.set("ENV_CACHE_SIZE_FOR_DYNACONF", 0)
+    assert settings.from_env("two") is not settings.from_env("two")
+
+
 def test_env_override_nested_lazy_value_from_included_file(
     clean_env, monkeypatch, tmpdir
 ):
@@ -1932,6 +2071,433 @@ def test_no_extra_values_in_nested_structure():
     assert settings.key == [{"d": "v"}]
 
 
+def test_freeze():
+    settings = Dynaconf(
+        name="Bruno",
+        greeting="@format Hello {this.NAME}",
+        database={"host": "server.com", "ports": [1, "@int 2"]},
+    )
+    frozen = settings.freeze()
+
+    assert frozen.GREETING == "Hello Bruno"
+    assert frozen.greeting == "Hello Bruno"
+    assert frozen["greeting"] == "Hello Bruno"
+    assert frozen.DATABASE.host == "server.com"
+    assert frozen.database.HOST == "server.com"
+    assert frozen.DATABASE.ports == [1, 2]
+    assert frozen.get("database.host") == "server.com"
+    assert frozen.get("database.port", 5432) == 5432
+    assert frozen("database.ports.1") == 2
+    assert frozen.get("database.ports.1", cast="@str") == "2"
+    assert frozen.exists("greeting")
+    assert not frozen.exists("missing")
+    assert "greeting" in frozen and "database" in frozen
+    assert frozen.current_env == settings.current_env
+    assert frozen.as_dict() == {
+        "NAME": "Bruno",
+        "GREETING": "Hello Bruno",
+        "DATABASE": {"host": "server.com", "ports": [1, 2]},
+    }
+
+    # changes to the settings are not reflected on the snapshot
+    settings.set("name", "Erik")
+    assert frozen.NAME == "Bruno"
+    assert frozen.GREETING == "Hello Bruno"
+
+
+def test_freeze_is_read_only():
+    frozen = Dynaconf(data={"key": "value"}, items=[1, 2]).freeze()
+
+    with pytest.raises(TypeError):
+        frozen.NEW = 1
+    with pytest.raises(TypeError):
+        frozen["DATA"] = {}
+    with pytest.raises(TypeError):
+        frozen.DATA["key"] = "other"
+    with pytest.raises(TypeError):
+        frozen.DATA.update({"key": "other"})
+    with pytest.raises(TypeError):
+        frozen.ITEMS.append(3)
+    with pytest.raises(TypeError):
+        del frozen.ITEMS[0]
+    with pytest.raises(AttributeError):
+        frozen.MISSING
+
+    mutations = [
+        lambda: frozen.set("KEY", 1),
+        lambda: frozen.update(KEY=1),
+        lambda: frozen.unset("DATA"),
+        lambda: frozen.unset_all(["DATA"]),
+        lambda: frozen.clean(),
+        lambda: frozen.setenv("production"),
+        lambda: frozen.using_env("production"),
+        lambda: frozen.reload(),
+        lambda: frozen.execute_loaders(),
+        lambda: frozen.load_file("settings.toml"),
+        lambda: frozen.fresh(),
+        lambda: frozen.watch(),
+        lambda: frozen.validators,
+    ]
+    for mutate in mutations:
+        with pytest.raises(TypeError, match="settings are frozen"):
+            mutate()
+    assert frozen.DATA == {"key": "value"}
+
+    # copies are safe to mutate
+    data = frozen.as_dict()
+    data["DATA"]["key"] = "other"
+    assert frozen.DATA.key == "value"
+
+
+def test_freeze_copy_and_pickle():
+    import copy
+    import pickle
+
+    frozen = Dynaconf(data={"key": "value"}, items=[1, {"a": 1}]).freeze()
+    assert copy.deepcopy(frozen) is frozen
+    assert copy.copy(frozen.DATA) is frozen.DATA
+
+    loaded = pickle.loads(pickle.dumps(frozen))
+    assert loaded == frozen
+    assert loaded.DATA.KEY == "value"
+    assert loaded.ITEMS[1].a == 1
+    assert loaded.current_env == frozen.current_env
+
+
+def test_frozen_option(tmpdir):
+    tmpdir.join("settings.toml").write(
+        'name = "Bruno"\ngreeting = "@format Hello {this.NAME}"'
+    )
+    settings = LazySettings(
+        settings_file="settings.toml",
+        frozen=True,
+        validators=[Validator("name", must_exist=True)],
+    )
+    assert settings.GREETING == "Hello Bruno"
+    assert settings.get("greeting") == "Hello Bruno"
+    with pytest.raises(TypeError):
+        settings.NAME = "Erik"
+
+    # values cached on the proxy are dropped on configure
+    tmpdir.join("settings.toml").write(
+        'name = "Erik"\ngreeting = "@format Hello {this.NAME}"'
+    )
+    settings.configure()
+    assert settings.GREETING == "Hello Erik"
+
+
+def test_frozen_supports_the_read_only_api(tmpdir):
+    from dynaconf.utils.inspect import inspect_settings
+
+    tmpdir.join("settings.toml").write(
+        '[default]\nname = "Bruno"\n[production]\nname = "Erik"'
+    )
+    settings = LazySettings(
+        settings_file="settings.toml", environments=True, frozen=True
+    )
+    frozen = settings._wrapped
+    assert not hasattr(frozen, "__dict__")
+    assert settings.get("name", fresh=True) == "Bruno"
+    assert settings.exists("name", fresh=True)
+    assert settings.get_fresh("name") == "Bruno"
+    assert settings.store["NAME"] == "Bruno"
+    assert settings.as_dict(env="production")["NAME"] == "Erik"
+    assert settings.from_env("production").NAME == "Erik"
+    assert settings.from_env("production").current_env == "production"
+    assert settings.loaded_by_loaders
+
+    report = inspect_settings(settings, "name", env="production")
+    assert report["current"] == "Erik"
+
+
+def test_lazy_load(tmpdir, monkeypatch):
+    tmpdir.join("settings.toml").write(
+        """
+        [default]
+        name = "default"
+        database = {host = "db", port = 5432}
+        colors = ["red"]
+        [development]
+        name = "dev"
+        colors = "@merge ['blue']"
+        greeting = "@format Hello {this.NAME}"
+        """
+    )
+    monkeypatch.setenv("DYNACONF_DATABASE__port", "5433")
+    monkeypatch.setenv("DYNACONF_DEBUG", "true")
+    options = dict(settings_file="settings.toml", environments=True)
+    settings = LazySettings(lazy_load=True, **options)
+    assert list(settings.__core__.config.lazy_keys) == [
+        "NAME",
+        "DATABASE",
+        "COLORS",
+        "GREETING",
+        "DEBUG",
+    ]
+    assert "NAME" not in settings.__core__.store
+
+    assert settings.GREETING == "Hello dev"
+    lazy_keys = settings.__core__.config.lazy_keys
+    assert list(lazy_keys) == ["DATABASE", "COLORS", "DEBUG"]
+    assert settings.database.port == 5433
+    assert settings.get("colors") == ["red", "blue"]
+    assert "DEBUG" in settings
+    assert not settings.__core__.config.lazy_keys
+
+    eager = LazySettings(**options)
+    assert settings.as_dict() == eager.as_dict()
+
+
+def test_lazy_load_nested_and_dotted_keys(tmpdir):
+    tmpdir.join("settings.toml").write(
+        """
+        [default]
+        db = {host = "db", port = 5432}
+        "dotted.a.b" = 1
+        [development]
+        "dotted.a.c" = 2
+        "colors.primary" = "red"
+        """
+    )
+    tmpdir.join("settings.local.toml").write(
+        'dynaconf_merge = true\n[development]\ndb__user = "admin"'
+    )
+    options = dict(settings_file="settings.toml", environments=True)
+    settings = LazySettings(lazy_load=True, **options)
+    eager = LazySettings(**options)
+    assert settings.DB == {"host": "db", "port": 5432, "user": "admin"}
+    assert settings.DOTTED == {"A": {"B": 1, "C": 2}}
+    assert settings.as_dict() == eager.as_dict()
+
+
+def test_lazy_load_set_and_iterate(tmpdir):
+    tmpdir.join("settings.yaml").write("colors: [red]\nname: Bruno")
+    settings = LazySettings(settings_file="settings.yaml", lazy_load=True)
+    settings.set("colors", "@merge ['blue']")
+    assert settings.COLORS == ["red", "blue"]
+    settings.unset("name")
+    assert "NAME" not in settings.keys()
+    assert settings.exists("name") is False
+
+
+def test_reload_is_published_at_once(tmpdir):
+    tmpdir.join("settings.toml").write('name = "old"\ncolors = ["red"]')
+    seen = []
+
+    def post_hook(staged):
+        # loaders are done on the staged copy, readers still see old values
+        seen.append((staged.NAME, settings.NAME, settings.COLORS))
+        return {}
+
+    settings = LazySettings(settings_file="settings.toml")
+    assert settings.NAME == "old"
+    settings.__core__.config.post_hooks.append(post_hook)
+    tmpdir.join("settings.toml").write('name = "new"\ncolors = ["blue"]')
+    settings.reload()
+    assert seen == [("new", "old", ["red"])]
+    assert settings.NAME == "new"
+    assert settings.COLORS == ["blue"]
+
+
+def test_concurrent_reads_during_reload(tmpdir):
+    import threading
+
+    tmpdir.join("settings.toml").write(
+        "\n".join(f"key_{i} = {i}" for i in range(100))
+    )
+    settings = LazySettings(
+        settings_file="settings.toml", fresh_vars=["KEY_0"]
+    )
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                for i in range(100):
+                    assert settings.get(f"key_{i}") == i
+            except Exception as error:  # pragma: no cover
+                errors.append(error)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(20):
+        settings.reload()
+        settings.setenv("development")
+    stop.set()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+
+
+def test_reads_during_a_key_reload(tmpdir):
+    import threading
+
+    tmpdir.join("settings.toml").write("name = 'Bruno'\n")
+    tmpdir.join("settings.local.toml").write(
+        "dynaconf_merge = true\nname = 'Bruno Rocha'\n"
+    )
+    settings = LazySettings(settings_file=str(tmpdir.join("settings.toml")))
+    assert settings.NAME == "Bruno Rocha"
+    stop = threading.Event()
+    seen = set()
+
+    def read():
+        while not stop.is_set():
+            seen.add(settings.get("name"))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(50):
+        assert settings.get_fresh("name") == "Bruno Rocha"
+    stop.set()
+    for reader in readers:
+        reader.join()
+    # never missing nor the value of the first file only
+    assert seen == {"Bruno Rocha"}
+
+
+def test_using_env_is_local_to_the_thread(tmpdir):
+    import threading
+
+    tmpdir.join("settings.toml").write(
+        "[default]\nname = 'default'\n[other]\nname = 'other'\n"
+    )
+    settings = LazySettings(
+        environments=True, settings_file=str(tmpdir.join("settings.toml"))
+    )
+    entered = threading.Event()
+    done = threading.Event()
+    seen = []
+
+    def read():
+        with settings.using_env("other"):
+            seen.append(settings.NAME)
+            entered.set()
+            done.wait()
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    entered.wait()
+    assert settings.NAME == "default"
+    assert settings.current_env == "DEVELOPMENT"
+    done.set()
+    reader.join()
+    assert seen == ["other"]
+
+    core = settings.__core__
+    with settings.using_env("other"):
+        assert settings.NAME == "other"
+        assert settings.current_env == "OTHER"
+        assert type(settings._wrapped) is Settings
+        settings.set("extra", 1)
+        with settings.using_env("default"):
+            assert settings.NAME == "default"
+        assert settings.as_dict(env="default")["NAME"] == "default"
+        assert settings.NAME == "other"
+    assert settings.__core__ is core
+    assert settings.NAME == "default"
+    assert "EXTRA" not in settings
+    assert type(settings._wrapped) is Settings
+    # env cores are reused until the settings change
+    with settings.using_env("other"):
+        env_core = settings.__core__
+    with settings.using_env("other"):
+        assert settings.__core__ is env_core
+    settings.set("name", "changed")
+    assert core.env_cores == {}
+
+
+def test_using_env_loads_changed_env_vars_and_files(tmpdir, monkeypatch):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write(
+        "[default]\nname = 'default'\n[other]\nname = 'other'\n"
+    )
+    settings = LazySettings(
+        environments=True, settings_file=str(settings_file)
+    )
+    with settings.using_env("other"):
+        assert settings.NAME == "other"
+        assert "ZZ" not in settings
+
+    monkeypatch.setenv("DYNACONF_ZZ", "1")
+    with settings.using_env("other"):
+        assert settings.ZZ == 1
+
+    settings_file.write(
+        "[default]\nname = 'default'\n[other]\nname = 'edited'\n"
+    )
+    with settings.using_env("other"):
+        assert settings.NAME == "edited"
+
+
+def test_get_fresh_reloads_a_key_missing_on_the_previous_read(monkeypatch):
+    settings = LazySettings()
+    assert settings.get_fresh("missing_key") is None
+    monkeypatch.setenv("DYNACONF_MISSING_KEY", "found")
+    assert settings.get_fresh("missing_key") == "found"
+    assert settings.MISSING_KEY == "found"
+
+
+def test_lazy_evaluation_does_not_keep_settings():
+    settings = Dynaconf(name="Bruno", greeting="@format Hello {this.NAME}")
+    lazy = settings.__core__.store.get("GREETING", bypass_eval=True)
+    assert lazy(settings) == "Hello Bruno"
+    assert not hasattr(lazy, "settings")
+
+
+def test_lazy_evaluation_is_memoized_by_the_keys_it_reads(monkeypatch):
+    monkeypatch.setenv("LAZY_PORT", "80")
+    settings = Dynaconf(
+        host="a.com",
+        base_url="@format http://{this.HOST}",
+        service={
+            "url": "@format {this.BASE_URL}:{env[LAZY_PORT]}/api",
+            "host": "@get HOST",
+        },
+    )
+    results = settings.__core__.lazy_cache.results
+    assert settings.service.url == "http://a.com:80/api"
+    assert settings.service.host == "a.com"
+    cached = len(results)
+    assert cached == 3
+
+    # unrelated keys keep the results
+    settings.set("other", 1)
+    assert len(results) == cached
+    assert settings.service.url == "http://a.com:80/api"
+
+    # a key read by a nested value invalidates the values reading it
+    settings.set("host", "b.com")
+    assert len(results) == 0
+    assert settings.service.url == "http://b.com:80/api"
+    assert settings.service.host == "b.com"
+
+    monkeypatch.setenv("LAZY_PORT", "8080")
+    assert settings.service.url == "http://b.com:8080/api"
+
+    settings.unset("host")
+    settings.set("host", "c.com")
+    assert settings.service.url == "http://c.com:8080/api"
+
+
+def test_lazy_evaluation_reading_properties_is_not_memoized():
+    settings = Dynaconf()
+    settings.set("env_name", "@format {this.current_env}")
+    assert settings.ENV_NAME == settings.current_env
+    assert len(settings.__core__.lazy_cache.results) == 0
+
+
+def test_lazy_jinja_reading_properties_is_not_memoized():
+    settings = Dynaconf(env_name="@jinja {{ this.current_env }}")
+    assert settings.ENV_NAME == settings.current_env
+    assert settings.ENV_NAME == settings.current_env
+    assert len(settings.__core__.lazy_cache.results) == 0
+
+
 class TestIndexMerge:
     def test_dotted_set_with_index_merge_disabled(self, settings):
         settings.set("MERGE_ENABLED_FOR_DYNACONF", False)
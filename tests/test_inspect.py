@@ -888,6 +888,40 @@ def test_inspect_exception_invalid_format():
         inspect_settings(settings, dumper="invalid_format")
 
 
+@pytest.mark.parametrize(
+    "history_mode,expected",
+    [
+        ("full", [("toml", {"a": 1}), ("env_global", {"a": 1, "b": 2})]),
+        ("keys", [("toml", None), ("env_global", None)]),
+        ("ring:1", [("env_global", {"a": 1, "b": 2})]),
+        ("off", [("undefined", {"a": 1, "b": 2})]),
+    ],
+)
+def test_get_history_history_mode(tmp_path, history_mode, expected):
+    file_a = tmp_path / "a.toml"
+    create_file(file_a, "data = {a = 1}")
+    os.environ["DYNACONF_DATA__b"] = "2"
+    settings = Dynaconf(settings_file=file_a, history_mode=history_mode)
+    history = get_history(settings, "data")
+    assert [(h["loader"], h["value"]) for h in history] == expected
+
+    # reloads don't grow the recorded files and degrade gracefully
+    settings.reload()
+    assert len(settings.__core__.config.loaded_files) == (
+        2 if history_mode == "full" else 1
+    )
+    result = inspect_settings(settings, key="data", print_report=False)
+    assert result["current"] == {"a": 1, "b": 2}
+
+
+def test_invalid_history_mode_is_not_set(tmp_path):
+    settings = Dynaconf(history_mode="keys")
+    with pytest.raises(ValueError, match="Invalid history mode"):
+        settings.set("history_mode_for_dynaconf", "bad")
+    assert settings.HISTORY_MODE_FOR_DYNACONF == "keys"
+    assert settings.__core__.config.loaded_by_loaders.mode == "keys"
+
+
 def test_get_debug_info(tmp_path):
     file_a = tmp_path / "a.yml"
     file_b = tmp_path / "b.yml"
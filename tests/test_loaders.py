@@ -39,3 +39,104 @@ def test_loaders_raise_on_syntax_error(file_factory, filename, silent):
     settings = Dynaconf()
     with pytest.raises(Exception):
         settings.load_file(path=filepath, silent=silent)
+
+
+@pytest.fixture
+def yaml_reads(monkeypatch):
+    """Count the yaml files parsed by the yaml_loader."""
+    from dynaconf.loaders import yaml_loader
+
+    reads = []
+    safe_load = yaml_loader.yaml.safe_load
+
+    def counting_safe_load(stream):
+        reads.append(getattr(stream, "name", stream))
+        return safe_load(stream)
+
+    monkeypatch.setattr(yaml_loader.yaml, "safe_load", counting_safe_load)
+    return reads
+
+
+def test_parsed_files_are_shared_across_instances(file_factory, yaml_reads):
+    filepath = file_factory(
+        "settings.yaml",
+        """\
+        default:
+          server:
+            hosts: [a, b]
+        development:
+          name: dev
+        production:
+          name: prod
+        """,
+    )
+    settings = Dynaconf(settings_files=filepath, environments=True)
+    assert settings.NAME == "dev"
+    prod = settings.from_env("production")
+    assert prod.NAME == "prod"
+    other = Dynaconf(settings_files=filepath, environments=True)
+    assert other.NAME == "dev"
+    assert len(yaml_reads) == 1
+
+    # values are copied from the cached tree
+    settings.SERVER.HOSTS.append("c")
+    assert other.SERVER.HOSTS == ["a", "b"]
+    assert Dynaconf(settings_files=filepath).DEFAULT.SERVER.HOSTS == [
+        "a",
+        "b",
+    ]
+
+
+def test_parsed_files_cache_detects_changes(file_factory, yaml_reads):
+    filepath = file_factory("settings.yaml", "name: aaa")
+    assert Dynaconf(settings_files=filepath).NAME == "aaa"
+
+    # same size and possibly the same mtime
+    file_factory("settings.yaml", "name: bbb")
+    assert Dynaconf(settings_files=filepath).NAME == "bbb"
+
+    file_factory("settings.yaml", "name: a longer value")
+    assert Dynaconf(settings_files=filepath).NAME == "a longer value"
+    assert len(yaml_reads) == 3
+
+
+def test_fresh_reads_reuse_the_key_index(
+    file_factory, yaml_reads, monkeypatch
+):
+    from dynaconf.loaders.base import BaseLoader
+
+    prepared = []
+    prepare_data = BaseLoader._prepare_data
+
+    def counting_prepare_data(self, data, *args):
+        prepared.append(data)
+        return prepare_data(self, data, *args)
+
+    monkeypatch.setattr(BaseLoader, "_prepare_data", counting_prepare_data)
+    filepath = file_factory(
+        "settings.yaml", "name: aaa\nport: 1\nserver__host: a\n"
+    )
+    settings = Dynaconf(settings_files=filepath, fresh_vars=["name"])
+    assert settings.PORT == 1
+    assert len(prepared) == 1
+    for _ in range(3):
+        assert settings.NAME == "aaa"
+        assert settings.get_fresh("server") == {"host": "a"}
+    # the file was prepared once more to index it by top level key
+    assert len(prepared) == 2
+    assert len(yaml_reads) == 1
+
+
+def test_parsed_files_cache_is_bounded():
+    from dynaconf.loaders.base import ParsedFilesCache
+
+    cache = ParsedFilesCache(maxsize=2)
+    signature = (0, 1)
+    for key in "abc":
+        cache.set(key, signature, None, {"key": key})
+    assert len(cache) == 2
+    assert cache.get("a", "a.yaml", signature) is not None
+    assert cache.get("c", "c.yaml", signature) == {"key": "c"}
+    assert cache.get("c", "c.yaml", (1, 1)) is not cache.get(
+        "c", "c.yaml", signature
+    )
@@ -121,6 +121,52 @@ def test_accessing_datadict_inside_datalist_inside_datadict():
     assert data.NESTED[0].DEEPER == "nest"
 
 
+def test_casing_index_is_kept_up_to_date():
+    data = DataDict({"Foo": 1, "my key": 2})
+    assert data.foo == 1
+    assert data["MY_KEY"] == 2
+    assert "FOO" in data and "My_Key" in data
+
+    # new keys are added to the index
+    data["Bar"] = 3
+    data.setdefault("Zaz", 4)
+    data.update({"Other": 5})
+    data |= {"Last": 6}
+    assert data.bar == 3 and data.zaz == 4
+    assert data.other == 5 and data.last == 6
+
+    # the first matching key wins, as with find_the_correct_casing
+    data["FOO"] = 10
+    assert data["foo"] == 1
+    del data["Foo"]
+    assert data["foo"] == 10
+    data.pop("FOO")
+    assert "foo" not in data
+    assert data.get("foo") is None
+
+    # a key without other casings is dropped from the index
+    del data["Bar"]
+    assert data.__meta__.casing is not None
+    assert "bar" not in data
+    assert data.zaz == 4
+
+    data.clear()
+    assert "bar" not in data
+
+
+def test_casing_index_after_copy_and_pickle():
+    import pickle
+
+    data = DataDict({"Foo": {"Bar": 1}})
+    assert data.foo.bar == 1
+
+    for other in (copy.deepcopy(data), pickle.loads(pickle.dumps(data))):
+        other["Zaz"] = 2
+        assert other.zaz == 2
+        assert other.foo.bar == 1
+        assert "zaz" not in data
+
+
 # Additional Tests
 
 
@@ -332,6 +378,35 @@ class TestDataList:
         li += [2, 3]
         assert list(li) == [1, 2, 3]
 
+    def test_lazy_flag(self):
+        from dynaconf.utils.parse_conf import Lazy
+
+        assert DataList([1, {"a": Lazy("x")}]).__meta__.lazy is False
+        assert DataList([1, [Lazy("x")]]).__meta__.lazy is True
+        for add in (
+            lambda li: li.append(Lazy("x")),
+            lambda li: li.insert(0, Lazy("x")),
+            lambda li: li.extend(iter([Lazy("x")])),
+            lambda li: li.__iadd__([Lazy("x")]),
+            lambda li: li.__setitem__(0, Lazy("x")),
+            lambda li: li.__setitem__(slice(0, 0), [Lazy("x")]),
+            lambda li: li.append([Lazy("x")]),
+        ):
+            li = DataList([1, [2]])
+            assert li.__meta__.lazy is False
+            add(li)
+            assert li.__meta__.lazy is True
+
+    def test_without_lazy_values_is_returned_as_is(self):
+        from dynaconf import Dynaconf
+
+        settings = Dynaconf(
+            name="x", hosts=["a", ["b"]], urls=["a", "@format {this.NAME}"]
+        )
+        assert settings.get("hosts") is settings.get("hosts")
+        assert settings.get("urls") == ["a", "x"]
+        assert settings.get("urls") is not settings.get("urls")
+
 
 def test_nested_structures():
     di = DataDict({"a": [{"x": 1}, {"y": 2}], "b": {"c": [3, 4]}})
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import pytest
 
 from dynaconf import LazySettings
+from dynaconf.loaders import redis_loader
 from dynaconf.loaders.redis_loader import delete
+from dynaconf.loaders.redis_loader import delete_many
 from dynaconf.loaders.redis_loader import load
 from dynaconf.loaders.redis_loader import write
+from dynaconf.loaders.redis_loader import write_many
 from dynaconf.utils.inspect import get_history
 
 if TYPE_CHECKING:
@@ -127,3 +131,109 @@ def test_redis_has_proper_source_metadata(docker_redis):
     )
     assert history[0]["env"] == "development"  # default when environments=True
     assert history[0]["value"]["SECRET"] == "redis_works_perfectly"
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """The redis loader connected to an in-memory fakeredis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis_loader, "_clients", {})
+    monkeypatch.setattr(
+        redis_loader,
+        "StrictRedis",
+        lambda **kwargs: fakeredis.FakeStrictRedis(
+            server=server,
+            decode_responses=kwargs.get("decode_responses", True),
+        ),
+    )
+    monkeypatch.setenv("REDIS_ENABLED_FOR_DYNACONF", "1")
+    return server
+
+
+def test_redis_client_is_shared(fake_redis):
+    settings = LazySettings(environments=True)
+    client = redis_loader._get_redis_client(settings)
+    assert redis_loader._get_redis_client(settings) is client
+    production = settings.from_env("production")
+    assert redis_loader._get_redis_client(production) is client
+
+
+def test_load_reads_all_envs_in_one_round_trip(fake_redis, monkeypatch):
+    settings = LazySettings(environments=True)
+    write_many(
+        settings,
+        {
+            "development": {"NAME": "dev", "PORT": 8080},
+            "global": {"NAME": "global"},
+            "production": {"NAME": "prod"},
+        },
+    )
+    assert settings.NAME == "global"
+    assert settings.PORT == 8080
+    assert settings.from_env("production").NAME == "global"
+
+    client = redis_loader._get_redis_client(settings)
+    pipeline = client.pipeline
+    executed = []
+
+    def counted_pipeline(*args, **kwargs):
+        new_pipeline = pipeline(*args, **kwargs)
+        execute = new_pipeline.execute
+        new_pipeline.execute = lambda: executed.append(None) or execute()
+        return new_pipeline
+
+    monkeypatch.setattr(client, "pipeline", counted_pipeline)
+    load(settings)
+    load(settings, key="PORT")
+    assert len(executed) == 2
+    assert settings.PORT == 8080
+
+
+def test_delete_many_from_redis(fake_redis):
+    settings = LazySettings(environments=True)
+    write(settings, {"A": 1, "B": 2, "C": 3})
+    delete_many(settings, ["a", "b"])
+    assert settings.get("A") is None
+    assert settings.get("B") is None
+    load(settings)
+    assert settings.get("A") is None
+    assert settings.C == 3
+
+
+def test_delete_all_from_redis_without_decoding(fake_redis, monkeypatch):
+    monkeypatch.setenv("REDIS_DECODE_FOR_DYNACONF", "false")
+    settings = LazySettings(environments=True)
+    client = redis_loader._get_redis_client(settings)
+    client.hset("DYNACONF_DEVELOPMENT", mapping={"A": "1", "B": "2"})
+    settings.set("A", 1, loader_identifier="redis")
+    delete(settings)
+    assert client.hgetall("DYNACONF_DEVELOPMENT") == {}
+    assert settings.get("A") is None
+
+
+def _eventually(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_subscribe_reloads_the_changed_keys(fake_redis):
+    settings = LazySettings(environments=True)
+    write(settings, {"NAME": "old", "PORT": 1})
+    settings.set("greeting", "@format Hello {this.NAME}")
+    assert settings.GREETING == "Hello old"
+
+    thread = redis_loader.subscribe(settings, sleep_time=0.01)
+    try:
+        # changes made by other processes
+        other = LazySettings(environments=True)
+        write(other, {"NAME": "new"})
+        assert _eventually(lambda: settings.GREETING == "Hello new")
+        delete(other, "port")
+        assert _eventually(lambda: settings.get("PORT") is None)
+    finally:
+        thread.stop()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import inspect
 import json
 import os
 import sys
+import time
 from collections import namedtuple
 from pathlib import Path
 from textwrap import dedent
@@ -19,8 +21,10 @@ from dynaconf.utils import build_env_list
 from dynaconf.utils import ensure_a_list
 from dynaconf.utils import ensure_upperfied_list
 from dynaconf.utils import extract_json_objects
+from dynaconf.utils import files
 from dynaconf.utils import find_the_correct_casing
 from dynaconf.utils import isnamedtupleinstance
+from dynaconf.utils import LoadingHistory
 from dynaconf.utils import Missing
 from dynaconf.utils import missing
 from dynaconf.utils import object_merge
@@ -30,12 +34,16 @@ from dynaconf.utils import upperfy
 from dynaconf.utils.files import find_file
 from dynaconf.utils.files import get_local_filename
 from dynaconf.utils.parse_conf import boolean_fix
+from dynaconf.utils.parse_conf import converters
 from dynaconf.utils.parse_conf import evaluate_lazy_format
 from dynaconf.utils.parse_conf import Formatters
 from dynaconf.utils.parse_conf import Lazy
 from dynaconf.utils.parse_conf import parse_conf_data
+from dynaconf.utils.parse_conf import parse_with_toml
+from dynaconf.utils.parse_conf import SafeFormatter
 from dynaconf.utils.parse_conf import try_to_encode
 from dynaconf.utils.parse_conf import unparse_conf_data
+from dynaconf.vendor import tomllib
 
 
 def test_isnamedtupleinstance():
@@ -117,6 +125,39 @@ def test_find_file(tmpdir):
     ) == os.path.join(str(tmpdir), ".env")
 
 
+def test_find_file_sees_changes(tmpdir):
+    assert find_file("settings.yaml") == ""
+    tmpdir.join("settings.yaml").write("a: 1")
+    assert find_file("settings.yaml") == str(tmpdir.join("settings.yaml"))
+
+    # old listings are refreshed when the directory changes
+    old = time.time_ns() - 10_000_000_000
+    os.utime(str(tmpdir), ns=(old, old))
+    assert find_file("settings.yaml") == str(tmpdir.join("settings.yaml"))
+    os.remove(str(tmpdir.join("settings.yaml")))
+    assert find_file("settings.yaml") == ""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs symlinks")
+def test_find_file_agrees_with_the_filesystem(tmpdir):
+    tmpdir.join("settings.yaml").write("a: 1")
+    os.symlink(str(tmpdir.join("missing.yaml")), str(tmpdir.join("link.yaml")))
+    old = time.time_ns() - 10_000_000_000
+    os.utime(str(tmpdir), ns=(old, old))
+    for name in ("settings.yaml", "SETTINGS.yaml", "link.yaml"):
+        path = str(tmpdir.join(name))
+        expected = path if os.path.exists(path) else ""
+        # once from a new listing and once from the cached one
+        assert find_file(name, project_root=str(tmpdir)) == expected
+        assert find_file(name, project_root=str(tmpdir)) == expected
+    assert find_file("link.yaml", project_root=str(tmpdir)) == ""
+
+
+def test_find_file_script_dir():
+    expected = os.path.dirname(os.path.abspath(inspect.stack()[-1].filename))
+    assert files._script_dir() == expected
+
+
 def test_casting_str(settings):
     res = parse_conf_data("@str 7")
     assert isinstance(res, str) and res == "7"
@@ -275,6 +316,41 @@ def test_tomlfy_unparsable(test_input, settings):
     )
 
 
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        "42",
+        "+1_000",
+        "-0",
+        "01",
+        "1.5e-3",
+        "1.",
+        "inf",
+        " true ",
+        "True",
+        "1979-05-27",
+        "0x1F",
+        "42 # comment",
+        "'quoted'",
+        "plain string",
+        "",
+    ],
+)
+def test_parse_with_toml_fast_path(test_input):
+    try:
+        expected = tomllib.loads(f"key={test_input}")["key"]
+    except tomllib.TOMLDecodeError:
+        expected = test_input
+    assert parse_with_toml(test_input) == expected
+    assert type(parse_with_toml(test_input)) is type(expected)
+
+
+def test_parse_with_toml_returns_copies():
+    first = parse_with_toml("{a=[1, 2]}")
+    first["a"].append(3)
+    assert parse_with_toml("{a=[1, 2]}") == {"a": [1, 2]}
+
+
 def test_missing_sentinel():
     # The missing singleton should always compare truthfully to itself
     assert missing == missing
@@ -327,6 +403,21 @@ def test_merge_existing_list_unique():
     assert new == ["karla", "erik", "bruno"]
 
 
+def test_merge_existing_list_unique_unhashable_items():
+    existing = [{"name": "a"}, 1, ["x"], 2, {"name": "a"}, 1]
+    new = [["x"], 2, {"name": "b"}]
+    object_merge(existing, new, unique=True)
+    # the last occurrence of repeated items is kept
+    assert new == [{"name": "a"}, 1, ["x"], 2, {"name": "b"}]
+
+
+def test_merge_dict_without_merge_keeps_new_order():
+    existing = {"a": 1, "b": 2}
+    new = {"dynaconf_merge": False, "c": 3, "a": 4, "d": 5}
+    object_merge(existing, new)
+    assert list(new.items()) == [("c", 3), ("a", 4), ("d", 5)]
+
+
 def test_merge_existing_dict():
     existing = {"host": "localhost", "port": 666}
     new = {"user": "admin"}
@@ -545,6 +636,32 @@ class TestLazyInternal:
         settings = {"FOO": "foo"}
         assert value(settings) == "foo/bar"
 
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{this[FOO]}/bar",
+            "{{literal}} {this.FOO!r:>8}",
+            "{this.NESTED.key}:{this.NESTED[items][1]}",
+            "{this.NUM:.2f}",
+            "{this.FOO:{this.WIDTH}}",
+            "{this.current_env}",
+            "no fields",
+        ],
+    )
+    def test_format_template_cache(self, template):
+        settings = Dynaconf(
+            foo="foo", num=3.14159, width=6, nested={"key": 1, "items": [1, 2]}
+        )
+        expected = SafeFormatter().format(template, this=settings)
+        formatter = Formatters.python_formatter
+        # the second call uses the compiled template
+        assert formatter(template, this=settings) == expected
+        assert formatter(template, this=settings) == expected
+
+    def test_format_template_cache_missing_key(self):
+        with pytest.raises(DynaconfFormatError):
+            Formatters.python_formatter("{this.MISSING}", this=Dynaconf())
+
     def test_custom_function_formatter(self):
         def custom_formatter(value, **context):
             return f"custom:{value}"
@@ -685,6 +802,25 @@ def test_add_converter_path_example(tmp_path):
     assert isinstance(settings.my_path, Path)
 
 
+def test_add_converter_updates_combined_tokens(settings):
+    settings.set("VALUE", "dynaconf")
+    assert parse_conf_data("@shout @format {this.VALUE}") == (
+        "@shout @format {this.VALUE}"
+    )
+    try:
+        add_converter("shout", lambda value: f"{value}!")
+        assert parse_conf_data("@shout @format {this.VALUE}")(settings) == (
+            "dynaconf!"
+        )
+        add_converter("shout", str.upper)
+        assert parse_conf_data("@shout @format {this.VALUE}")(settings) == (
+            "DYNACONF"
+        )
+    finally:
+        converters.pop("@shout")
+    assert parse_conf_data("@shout x", box_settings=settings) == "@shout x"
+
+
 def test_boolean_fix():
     """Assert boolean fix works"""
     assert boolean_fix("True") == "true"
@@ -1555,3 +1691,42 @@ def test_merge_single_value_fallback(settings):
     # When merge value is a plain string (no JSON, no key=value, no commas)
     settings.set("SINGLE_VALUE", "@merge singlevalue")
     assert settings.SINGLE_VALUE == ["singlevalue"]
+
+
+def test_loading_history_modes():
+    history = LoadingHistory()
+    history.record("a", "KEY", {"value": 1})
+    history.record("b", "KEY", 2)
+    history.record("a", "OTHER", 3)
+    assert history == {"a": {"KEY": {"value": 1}, "OTHER": 3}, "b": {"KEY": 2}}
+
+    history.set_mode("keys")
+    assert history == {"a": {"KEY": None, "OTHER": None}, "b": {"KEY": None}}
+    history.record("c", "KEY", 4)
+    assert history["c"] == {"KEY": None}
+
+    # the most recently loaded sources are kept
+    history.set_mode("ring:2")
+    assert list(history) == ["b", "c"]
+    history.record("b", "KEY", 5)
+    history.update({"d": {"KEY": 6}})
+    assert history == {"b": {"KEY": 5}, "d": {"KEY": 6}}
+
+    history.set_mode("off")
+    history.record("e", "KEY", 7)
+    assert history.setdefault("f", {}) == {}
+    assert history == {}
+    assert not history.complete
+
+    loaded = ["settings.toml"]
+    history.add_loaded(loaded, "settings.toml")
+    assert loaded == ["settings.toml"]
+    history.set_mode("full")
+    history.add_loaded(loaded, "settings.toml")
+    assert loaded == ["settings.toml", "settings.toml"]
+
+
+@pytest.mark.parametrize("mode", ["ring", "ring:0", "ring:x", "all", "off:1"])
+def test_loading_history_invalid_mode(mode):
+    with pytest.raises(ValueError, match="Invalid history mode"):
+        LoadingHistory().set_mode(mode)
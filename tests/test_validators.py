@@ -957,3 +957,148 @@ def test_sibling_key_sharing_leaf_name_survives_validation():
     # Before the fix `foo.value` was dropped, because the sibling key shared
     # the leaf name of the dotted path being set.
     assert settings.foo.value is True
+
+
+def test_validate_on_update_runs_only_the_validators_of_changed_keys():
+    runs = []
+
+    def counted(name):
+        def condition(value):
+            runs.append(name)
+            return value is not None
+
+        return condition
+
+    settings = Dynaconf(
+        validate_on_update=True,
+        name="Bruno",
+        database={"port": 5432},
+        servers=[{"host": "a.com"}],
+        validators=[
+            Validator("name", condition=counted("name")),
+            Validator("database.port", condition=counted("port")),
+            Validator(
+                "servers",
+                items_validators=[Validator("host", must_exist=True)],
+                condition=counted("servers"),
+            ),
+            Validator("timeout", must_exist=True, when=Validator("name")),
+            Validator("a", must_exist=True)
+            | Validator("database", condition=counted("or")),
+        ],
+        timeout=10,
+    )
+    assert settings.NAME == "Bruno"
+    assert sorted(runs) == ["name", "or", "port", "servers"]
+
+    runs.clear()
+    settings.set("unrelated", 1)
+    assert runs == []
+
+    settings.set("database.port", 5433)
+    assert sorted(runs) == ["or", "port"]
+
+    runs.clear()
+    settings.update({"name": "Erik", "unrelated": 2})
+    assert runs == ["name"]
+
+    with pytest.raises(ValidationError):
+        settings.set("servers", [{"port": 1}])
+    # failed keys are validated again on the next update
+    runs.clear()
+    with pytest.raises(ValidationError):
+        settings.set("unrelated", 3)
+    assert runs == ["servers"]
+    settings.set("servers", [{"host": "b.com"}])
+
+    # unset keys are validated on the next update
+    settings.unset("timeout")
+    with pytest.raises(ValidationError):
+        settings.set("unrelated", 4)
+    settings.set("timeout", 10)
+
+    # a validator added later runs on the next update
+    runs.clear()
+    settings.validators.register(Validator("name", condition=counted("new")))
+    settings.set("unrelated", 4)
+    assert sorted(runs) == ["name", "new", "or", "port", "servers"]
+
+
+def test_validate_on_update_runs_validators_of_nested_separator_names():
+    settings = Dynaconf(
+        validate_on_update=True,
+        database={"host": "x"},
+        validators=[Validator("DATABASE__HOST", eq="x")],
+    )
+    assert settings.DATABASE.host == "x"
+
+    with pytest.raises(ValidationError):
+        settings.set("DATABASE", {"host": "y"})
+
+
+def test_items_validators_report_the_failing_item():
+    item_validator = Validator(is_type_of=str)
+    settings = Dynaconf(ips=["10.0.0.1", "10.0.0.2", 3])
+    settings.validators.register(
+        Validator("ips", items_validators=[item_validator])
+    )
+    with pytest.raises(ValidationError) as error:
+        settings.validators.validate()
+    assert str(error.value) == (
+        "ips.2 must is_type_of <class 'str'> but it is 3 in env main"
+    )
+    # the nameless item validator is copied, not mutated
+    assert item_validator.names == ()
+
+    settings.set("ips", ["10.0.0.1", "10.0.0.2"])
+    settings.validators.validate()
+
+
+def test_operations_are_resolved_again_when_changed():
+    validator = Validator("port", is_type_of="int")
+    validator.validate({"port": 8080})
+
+    validator.is_type_of = "str"
+    with pytest.raises(ValidationError):
+        validator.validate({"port": 8080})
+    validator.validate({"port": "8080"})
+
+    validator.operations["len_max"] = 2
+    with pytest.raises(ValidationError):
+        validator.validate({"port": "8080"})
+
+
+def test_validate_envs(tmpdir):
+    tmpdir.join("settings.toml").write(
+        "[default]\nport = 1\n[production]\nport = 0\n[staging]\nport = 2\n"
+    )
+    settings = Dynaconf(
+        settings_file=str(tmpdir.join("settings.toml")), environments=True
+    )
+    assert settings.PORT == 1
+    settings.validators.register(
+        Validator("port", gt=0, env=["production", "staging"]),
+        Validator("name", default="Bruno"),
+    )
+
+    with pytest.raises(ValidationError) as error:
+        settings.validators.validate_envs(max_workers=2)
+    assert str(error.value) == "port must gt 0 but it is 0 in env production"
+    assert len(error.value.details) == 1
+
+    validations = settings.validators.validate_envs(raise_error=False)
+    assert [validation.env for validation in validations] == [
+        "production",
+        "staging",
+        "DEVELOPMENT",
+    ]
+    assert len(validations[0].errors) == 1
+    assert validations[1].errors == validations[2].errors == []
+    assert all(validation.seconds >= 0 for validation in validations)
+    assert settings.NAME == "Bruno"
+
+    validations = settings.validators.validate_envs(["staging", "testing"])
+    assert [(v.env, v.errors) for v in validations] == [
+        ("staging", []),
+        ("testing", []),
+    ]
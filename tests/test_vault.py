@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
+import time
 from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from typing import TYPE_CHECKING
 
 import pytest
 
 from dynaconf import LazySettings
+from dynaconf.loaders import vault_loader
 from dynaconf.loaders.vault_loader import list_envs
 from dynaconf.loaders.vault_loader import load
 from dynaconf.loaders.vault_loader import write
@@ -33,6 +39,168 @@ def docker_vault(docker_ip: str, docker_services: Iterator[Service]):
     return url
 
 
+class VaultStandIn(BaseHTTPRequestHandler):
+    """Answers the Vault API calls made by the loader, kv version 1."""
+
+    token_ttl = 0
+    secrets: dict = {}
+    requests: list = []
+    revoked: set = set()
+    reading: list = []
+    most_reading = 0
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def _serve(self):
+        path = self.path.split("?")[0]
+        self.requests.append((self.command, path))
+        if path == "/v1/auth/approle/login":
+            token = f"token-{len(self.requests)}"
+            auth = {"client_token": token, "lease_duration": 0}
+            return self._reply(200, {"auth": auth})
+        if self.headers.get("X-Vault-Token") in self.revoked:
+            return self._reply(403, {"errors": ["permission denied"]})
+        if path in ("/v1/auth/token/lookup-self", "/v1/auth/token/renew-self"):
+            info = {"ttl": self.token_ttl, "renewable": True}
+            auth = {"lease_duration": self.token_ttl, "renewable": True}
+            return self._reply(200, {"data": info, "auth": auth})
+        if self.command == "LIST" and path == "/v1/secret/dynaconf":
+            return self._reply(200, {"data": {"keys": []}})
+        self.reading.append(path)
+        VaultStandIn.most_reading = max(self.most_reading, len(self.reading))
+        time.sleep(0.05)
+        self.reading.remove(path)
+        secret = self.secrets.get(path.removeprefix("/v1/secret/data/"))
+        if self.command == "GET" and secret is not None:
+            body = {"data": {"data": secret}, "lease_duration": 0}
+            return self._reply(200, body)
+        self._reply(404, {"errors": []})
+
+    def do_GET(self):
+        self._serve()
+
+    def do_POST(self):
+        self._serve()
+
+    def do_PUT(self):
+        self._serve()
+
+    def do_LIST(self):
+        self._serve()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def vault_stand_in(monkeypatch):
+    pytest.importorskip("hvac")
+    monkeypatch.setattr(vault_loader, "_sessions", {})
+    monkeypatch.setattr(vault_loader, "_secrets", {})
+    monkeypatch.setattr(VaultStandIn, "requests", [])
+    monkeypatch.setattr(VaultStandIn, "revoked", set())
+    monkeypatch.setattr(VaultStandIn, "reading", [])
+    monkeypatch.setattr(VaultStandIn, "most_reading", 0)
+    monkeypatch.setattr(
+        VaultStandIn,
+        "secrets",
+        {"dynaconf/default": {"SECRET": "default"}},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), VaultStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _vault_settings(server, **kwargs):
+    host, port = server.server_address
+    return LazySettings(
+        environments=True,
+        VAULT_FOR_DYNACONF={"url": f"http://{host}:{port}", "token": "root"},
+        VAULT_KV_VERSION_FOR_DYNACONF=1,
+        **kwargs,
+    )
+
+
+def _count(prefix):
+    return sum(
+        1 for _, path in VaultStandIn.requests if path.startswith(prefix)
+    )
+
+
+def test_vault_client_is_shared_and_renewed(vault_stand_in, monkeypatch):
+    monkeypatch.setattr(VaultStandIn, "token_ttl", 1)
+    settings = _vault_settings(vault_stand_in)
+    load(settings)
+    load(_vault_settings(vault_stand_in))
+    assert settings.SECRET == "default"
+    assert _count("/v1/auth/token/lookup-self") == 1
+    assert _count("/v1/auth/token/renew-self") == 0
+
+    time.sleep(0.7)
+    load(settings)
+    assert _count("/v1/auth/token/lookup-self") == 1
+    assert _count("/v1/auth/token/renew-self") == 1
+
+
+def test_vault_logs_in_again_when_the_token_is_revoked(vault_stand_in):
+    settings = _vault_settings(
+        vault_stand_in, VAULT_ROLE_ID_FOR_DYNACONF="role"
+    )
+    load(settings)
+    assert _count("/v1/auth/approle/login") == 1
+
+    client = vault_loader.get_client(settings)
+    VaultStandIn.revoked.add(client.token)
+    VaultStandIn.secrets["dynaconf/default"] = {"SECRET": "changed"}
+    load(settings)
+    assert settings.SECRET == "changed"
+    assert _count("/v1/auth/approle/login") == 2
+    assert vault_loader.get_client(settings) is not client
+
+
+def test_vault_reads_the_envs_concurrently(vault_stand_in):
+    VaultStandIn.secrets["dynaconf/development"] = {"SECRET": "dev"}
+    settings = _vault_settings(vault_stand_in)
+    load(settings, env="development")
+    assert settings.SECRET == "dev"
+    # dynaconf, default, global and development paths, each read once
+    assert _count("/v1/secret/data/dynaconf") == 4
+    assert VaultStandIn.most_reading > 1
+
+
+def test_vault_secrets_are_cached_for_the_ttl(vault_stand_in):
+    settings = _vault_settings(
+        vault_stand_in,
+        VAULT_CACHE_TTL_FOR_DYNACONF=0.3,
+        VAULT_CACHE_STALE_FOR_DYNACONF=10,
+    )
+    load(settings)
+    reads = _count("/v1/secret/data/dynaconf")
+    VaultStandIn.secrets["dynaconf/default"] = {"SECRET": "changed"}
+    load(settings)
+    assert settings.SECRET == "default"
+    assert _count("/v1/secret/data/dynaconf") == reads
+
+    # once expired the stale value is loaded while it is read again
+    time.sleep(0.4)
+    load(settings)
+    assert settings.SECRET == "default"
+    assert vault_loader._refreshing
+    for _ in range(50):
+        if not vault_loader._refreshing:
+            break
+        time.sleep(0.02)
+    assert _count("/v1/secret/data/dynaconf") == reads * 2
+    load(settings)
+    assert settings.SECRET == "changed"
+
+
 @pytest.mark.integration
 def test_load_vault_not_configured():
     with pytest.raises(AssertionError) as excinfo:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from dynaconf import Dynaconf
+from dynaconf import ValidationError
+from dynaconf import Validator
+from dynaconf.watcher import SettingsWatcher
+
+pytestmark = pytest.mark.usefixtures("no_deprecations")
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_text('name = "Bruno"\nport = 8000\n')
+    return path
+
+
+def test_check_reloads_changed_keys(settings_file):
+    settings = Dynaconf(settings_files=str(settings_file))
+    assert settings.NAME == "Bruno"
+    changes = []
+    watcher = SettingsWatcher(
+        settings._wrapped, debounce=0, callback=changes.append
+    )
+    assert watcher.check() is None
+
+    settings_file.write_text('name = "Bruno Rocha"\nport = 8000\n')
+    assert watcher.check() == {"NAME"}
+    assert changes == [{"NAME"}]
+    assert settings.NAME == "Bruno Rocha"
+    assert watcher.check() is None
+
+    # new `.local.` files are picked too
+    settings_file.with_name("settings.local.toml").write_text("port = 9000")
+    assert watcher.check() == {"PORT"}
+    assert settings.PORT == 9000
+
+
+def test_check_without_changed_keys_keeps_settings(settings_file):
+    settings = Dynaconf(settings_files=str(settings_file))
+    core = settings.__core__
+    watcher = SettingsWatcher(settings._wrapped, debounce=0)
+    settings_file.write_text('# a comment\nname = "Bruno"\nport = 8000\n')
+    assert watcher.check() == set()
+    assert settings.__core__ is core
+
+
+def test_check_keeps_settings_on_validation_error(settings_file):
+    settings = Dynaconf(
+        settings_files=str(settings_file),
+        validators=[Validator("port", lte=9000)],
+    )
+    assert settings.PORT == 8000
+    watcher = SettingsWatcher(settings._wrapped, debounce=0)
+    settings_file.write_text('name = "Erik"\nport = 9999\n')
+    with pytest.raises(ValidationError):
+        watcher.check()
+    assert settings.NAME == "Bruno"
+    assert settings.PORT == 8000
+    # the broken edit is not reloaded again until the file changes
+    assert watcher.check() is None
+    settings_file.write_text('name = "Erika"\nport = 9000\n')
+    assert watcher.check() == {"NAME", "PORT"}
+
+
+def test_watch_in_background(settings_file):
+    changed = threading.Event()
+    settings = Dynaconf(settings_files=str(settings_file))
+    assert settings.PORT == 8000
+    watcher = settings.watch(
+        interval=0.01, debounce=0, callback=lambda keys: changed.set()
+    )
+    try:
+        assert watcher.running
+        settings_file.write_text('name = "Bruno"\nport = 8080\n')
+        assert changed.wait(5)
+        assert settings.PORT == 8080
+    finally:
+        watcher.stop()
+    assert not watcher.running
+
+
+def test_watch_option(settings_file):
+    settings = Dynaconf(settings_files=str(settings_file), watch=0.5)
+    watcher = settings.__core__.watcher
+    try:
+        assert watcher.running
+        assert watcher.interval == 0.5
+    finally:
+        watcher.stop()